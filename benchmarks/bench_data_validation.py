@@ -0,0 +1,103 @@
+"""
+bench_data_validation.py
+
+Purpose:
+    Compares the eager and streaming modes of DataValidation on a synthetic
+    gsearch_jobs-like CSV. Each mode runs in a fresh process so the reported
+    peak resident memory (RSS) is not polluted by the other run.
+
+Usage:
+    Run from the project root:
+    `python -m benchmarks.bench_data_validation --rows 500000 --chunk-size 100000`
+"""
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.career_chief.constants import SCHEMA_FILE_PATH
+from src.career_chief.utils.common import read_yaml
+from src.career_chief.entity.config_entity import DataValidationConfig
+from src.career_chief.components.data_validation import DataValidation
+
+
+def make_dataset(path: Path, rows: int, seed: int = 0):
+    """
+    Writes a synthetic jobs CSV with the schema columns plus a few unused ones.
+
+    Args:
+        path (Path): Destination CSV file.
+        rows (int): Number of rows to generate.
+        seed (int): Seed for the random generator.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'date_time': pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D'),
+        'title': rng.choice(['Data Analyst', 'Senior Data Analyst', 'BI Developer'], rows),
+        'company_name': rng.choice([f'Company {i}' for i in range(500)], rows),
+        'location': rng.choice(['Anywhere', 'United States', 'Kansas City, MO'], rows),
+        'via': rng.choice(['via LinkedIn', 'via Upwork', 'via BeBee'], rows),
+        'description': ['Experience with SQL, Python and Tableau. ' * 20] * rows,
+        'job_id': [f'job-{i}' for i in range(rows)],
+        'salary_standardized': rng.uniform(40_000, 200_000, rows),
+        'extensions': ['Full-time'] * rows,
+        'thumbnail': ['https://example.com/thumbnail.png'] * rows,
+    })
+    df.to_csv(path, index=False)
+
+
+def run_mode(config: DataValidationConfig) -> tuple:
+    """
+    Runs the full validation for one configuration and measures it.
+    Meant to be executed in a dedicated worker process.
+
+    Returns:
+        tuple: (status, seconds, peak RSS in MB)
+    """
+    start = time.perf_counter()
+    status = DataValidation(config=config).run_all_validations()
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is reported in kilobytes on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return status, elapsed, peak_rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark eager vs streaming data validation.")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    schema = read_yaml(SCHEMA_FILE_PATH).columns
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_file = Path(tmp_dir) / "gsearch_jobs.csv"
+        # Generate the file in a separate process as well; Linux carries the peak RSS across exec
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            executor.submit(make_dataset, data_file, args.rows).result()
+        print(f"Dataset: {args.rows} rows, {data_file.stat().st_size / 1024 ** 2:.1f} MB on disk")
+
+        for streaming in (False, True):
+            config = DataValidationConfig(
+                root_dir=Path(tmp_dir),
+                data_source_file=data_file,
+                status_file=Path(tmp_dir) / "status.txt",
+                schema=schema,
+                streaming=streaming,
+                chunk_size=args.chunk_size,
+            )
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                status, elapsed, peak_mb = executor.submit(run_mode, config).result()
+            mode = f"streaming (chunk={args.chunk_size})" if streaming else "eager"
+            print(f"{mode:<28} status={status!s:<5} time={elapsed:6.2f}s peak_rss={peak_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+bench_entity_extraction.py
+
+Purpose:
+    Measures the throughput of EntityExtractorFromJobDescriptions on synthetic job
+    descriptions: the former one-document-at-a-time loop against `nlp.pipe` with 1,
+    4 and 16 processes. Every run goes end to end, from the Parquet input to the
+    entities file. Without --model a blank English pipeline with an initialized
+    (untrained) 'ner' pipe is used, which has the cost of the real model architecture
+    but finds arbitrary entities.
+
+Usage:
+    Run from the project root:
+    `python -m benchmarks.bench_entity_extraction --docs 20000 --processes 1 4 16`
+    `python -m benchmarks.bench_entity_extraction --model artifacts/model_training/NERJobDescriptionExtractor/Model/finetuned_model/model-best`
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.career_chief.components.entity_extraction import EntityExtractorFromJobDescriptions
+
+
+def make_blank_model(path: Path):
+    """
+    Saves a blank English pipeline with an initialized 'ner' pipe.
+
+    Args:
+        path (Path): Directory of the model.
+    """
+    import spacy
+    from spacy.training import Example
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("ner")
+    example = Example.from_dict(nlp.make_doc("python and sql skills"),
+                                {"entities": [(0, 6, "SKILL"), (11, 14, "SKILL")]})
+    nlp.initialize(lambda: [example])
+    nlp.to_disk(path)
+
+
+def make_dataset(path: Path, docs: int, rng: random.Random, words_per_doc: int = 200):
+    """
+    Writes job ids and cleaned descriptions to a Parquet file.
+
+    Args:
+        path (Path): Destination file.
+        docs (int): Number of descriptions.
+        rng (random.Random): Random generator.
+        words_per_doc (int): Words per description.
+    """
+    vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(5000)]
+    pd.DataFrame({
+        "job_id": [f"job-{index}" for index in range(docs)],
+        "cleaned_text": [" ".join(rng.choices(vocabulary, k=words_per_doc)) for _ in range(docs)],
+    }).to_parquet(path, index=False)
+
+
+def run(model: Path, data: Path, output: Path, batch_size: int, n_process: int) -> float:
+    """Runs one extraction and returns its duration in seconds."""
+    extractor = EntityExtractorFromJobDescriptions(model, data, output, batch_size=batch_size, n_process=n_process)
+    start = time.perf_counter()
+    extractor.extract_and_save_entities()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NER entity extraction.")
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--loop-docs", type=int, default=2_000, help="Documents the former loop is timed on.")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--model", type=Path, default=None, help="spaCy model directory. Defaults to a blank model.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        model = args.model
+        if model is None:
+            model = tmp / "model"
+            make_blank_model(model)
+
+        data, sample = tmp / "data.parquet", tmp / "sample.parquet"
+        make_dataset(data, args.docs, rng)
+        pd.read_parquet(data).head(args.loop_docs).to_parquet(sample, index=False)
+
+        loop_time = run(model, sample, tmp / "loop.csv", batch_size=0, n_process=1)
+        loop_rate = args.loop_docs / loop_time
+
+        print(f"documents: {args.docs}, batch size: {args.batch_size}")
+        print(f"{'mode':>14} {'seconds':>9} {'docs/s':>9} {'speedup':>8}")
+        print(f"{'one-by-one':>14} {args.docs / loop_rate:9.1f} {loop_rate:9.1f} {1:8.2f}x  "
+              f"(extrapolated from {args.loop_docs} documents)")
+
+        for n_process in args.processes:
+            elapsed = run(model, data, tmp / f"pipe_{n_process}.parquet", args.batch_size, n_process)
+            rate = args.docs / elapsed
+            print(f"{f'pipe n={n_process}':>14} {elapsed:9.1f} {rate:9.1f} {rate / loop_rate:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+bench_ner_training.py
+
+Purpose:
+    Measures the training cost of the custom spaCy NER model on CPU as time-to-target-F1:
+    the wall-clock time `train_ner` needs until the F1 score on the evaluation sample
+    reaches --target-f1, with fixed batches of --batch-size documents against
+    length-bucketed batches of each --batch-words budget. Words per second are reported
+    as well. Every configuration starts from the same random seed, so runs are
+    repeatable on the same host.
+
+    Without --train/--dev, synthetic job descriptions of log-normally distributed
+    lengths are generated, with skills and tools from small vocabularies annotated as
+    entities.
+
+Usage:
+    Run from the project root:
+    `python -m benchmarks.bench_ner_training --docs 2000 --target-f1 0.9`
+    `python -m benchmarks.bench_ner_training --train artifacts/model_training/spacy_ner/output/train_data --dev artifacts/model_training/spacy_ner/output/dev_data --target-f1 0.6`
+"""
+
+import argparse
+import random
+import string
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.career_chief.components.annotation_conversion import iter_docs
+from src.career_chief.components.ner_training import train_ner
+
+
+SKILLS = ["python", "sql", "spark", "statistics", "machine learning", "deep learning", "tableau", "excel"]
+TOOLS = ["aws", "docker", "kubernetes", "airflow", "git", "snowflake"]
+
+
+def make_docs(nlp, count: int, rng: random.Random, median_words: int = 400) -> list:
+    """
+    Generates annotated job descriptions.
+
+    Args:
+        nlp (Language): Pipeline whose tokenizer makes the Docs.
+        count (int): Number of descriptions.
+        rng (random.Random): Random generator.
+        median_words (int): Median number of words per description.
+
+    Returns:
+        list: Docs with SKILL and TOOL entities.
+    """
+    vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(3000)]
+    docs = []
+    for _ in range(count):
+        words = max(20, int(rng.lognormvariate(np.log(median_words), 0.9)))
+        parts, entities, position = [], [], 0
+        for _ in range(words):
+            if rng.random() < 0.05:
+                label, terms = ("SKILL", SKILLS) if rng.random() < 0.6 else ("TOOL", TOOLS)
+                word = rng.choice(terms)
+                entities.append((position, position + len(word), label))
+            else:
+                word = rng.choice(vocabulary)
+            parts.append(word)
+            position += len(word) + 1
+        doc = nlp.make_doc(" ".join(parts))
+        doc.ents = [doc.char_span(start, end, label=label) for start, end, label in entities]
+        docs.append(doc)
+    return docs
+
+
+def run(train_docs: list, dev_docs: list, training: dict, target_f1: float, seed: int) -> dict:
+    """Trains a blank model until the target F1 score and returns its cost."""
+    import spacy
+    from spacy.tokens import Doc
+    from spacy.util import fix_random_seed
+
+    fix_random_seed(seed)
+    nlp = spacy.blank("en")
+    ner = nlp.add_pipe("ner")
+    for label in {ent.label_ for doc in train_docs + dev_docs for ent in doc.ents}:
+        ner.add_label(label)
+
+    # Docs are re-created in the new vocabulary, as train_ner makes Examples from their text
+    train = [Doc(nlp.vocab).from_bytes(doc.to_bytes()) for doc in train_docs]
+    dev = [Doc(nlp.vocab).from_bytes(doc.to_bytes()) for doc in dev_docs]
+
+    start = time.perf_counter()
+    metrics = train_ner(nlp, train, dev, dict(training, seed=seed), target_f1=target_f1)
+    elapsed = time.perf_counter() - start
+    reached = metrics[-1]["f1"] >= target_f1
+    return {
+        "epochs": len(metrics),
+        "seconds": elapsed if reached else float("nan"),
+        "words_per_sec": np.mean([row["words_per_sec"] for row in metrics]),
+        "best_f1": max(row["f1"] for row in metrics),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NER training time to a target F1 score.")
+    parser.add_argument("--docs", type=int, default=2000, help="Synthetic training documents.")
+    parser.add_argument("--train", type=Path, default=None, help=".spacy file or shard directory of training data.")
+    parser.add_argument("--dev", type=Path, default=None, help=".spacy file or shard directory of development data.")
+    parser.add_argument("--target-f1", type=float, default=0.9)
+    parser.add_argument("--max-epochs", type=int, default=20)
+    parser.add_argument("--eval-docs", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=128, help="Documents per batch of the fixed mode.")
+    parser.add_argument("--batch-words", type=int, nargs="+", default=[1000, 3000, 10000])
+    parser.add_argument("--bucket-size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import spacy
+
+    nlp = spacy.blank("en")
+    if args.train is not None:
+        train_docs = list(iter_docs(args.train, nlp.vocab))
+        dev_docs = list(iter_docs(args.dev, nlp.vocab))
+    else:
+        rng = random.Random(args.seed)
+        train_docs = make_docs(nlp, args.docs, rng)
+        dev_docs = make_docs(nlp, max(args.eval_docs, args.docs // 5), rng)
+
+    training = {"max_epochs": args.max_epochs, "eval_docs": args.eval_docs, "patience": 0,
+                "dropout": 0.3, "bucket_size": args.bucket_size}
+    modes = [(f"fixed {args.batch_size} docs", dict(training, batch_words=0, batch_size=args.batch_size))]
+    modes += [(f"bucketed {words} words", dict(training, batch_words=words)) for words in args.batch_words]
+
+    words = sum(len(doc) for doc in train_docs)
+    print(f"training documents: {len(train_docs)} ({words} words), evaluation documents: "
+          f"{min(args.eval_docs, len(dev_docs)) or len(dev_docs)}, target F1: {args.target_f1}")
+    print(f"{'mode':>22} {'epochs':>7} {'seconds':>9} {'words/s':>9} {'best F1':>8}")
+    for name, settings in modes:
+        result = run(train_docs, dev_docs, settings, args.target_f1, args.seed)
+        print(f"{name:>22} {result['epochs']:7d} {result['seconds']:9.1f} "
+              f"{result['words_per_sec']:9.0f} {result['best_f1']:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
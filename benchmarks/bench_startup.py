@@ -0,0 +1,61 @@
+"""
+bench_startup.py
+
+Purpose:
+    Measures the cold-start latency of the command line entry points: `main.py --help`,
+    planning runs and importing single stages. Every command runs in a fresh
+    interpreter, so the numbers include all import and configuration loading costs.
+
+Usage:
+    Run from the project root:
+    `python -m benchmarks.bench_startup --repeat 10`
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+COMMANDS = {
+    "main.py --help": [sys.executable, "main.py", "--help"],
+    "main.py --dry-run": [sys.executable, "main.py", "--dry-run"],
+    "main.py --only data_validation --dry-run": [sys.executable, "main.py", "--only", "data_validation", "--dry-run"],
+    "import stage_01_data_ingestion": [sys.executable, "-c", "import src.career_chief.pipeline.stage_01_data_ingestion"],
+    "import stage_02_data_validation": [sys.executable, "-c", "import src.career_chief.pipeline.stage_02_data_validation"],
+}
+
+
+def time_command(command: list, repeat: int) -> list:
+    """
+    Run a command several times and return the wall time of each run.
+
+    Args:
+        command (list): The command to execute.
+        repeat (int): Number of runs.
+
+    Returns:
+        list: Wall time in seconds for every run.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-start latency of the pipeline entry points.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'command':<45} {'min (ms)':>10} {'median (ms)':>12}")
+    for name, command in COMMANDS.items():
+        timings = time_command(command, args.repeat)
+        print(f"{name:<45} {min(timings) * 1000:>10.0f} {statistics.median(timings) * 1000:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+bench_term_normalizer.py
+
+Purpose:
+    Compares the single-pass TermNormalizer with the former per-term `re.sub` loop of
+    DataTransformation._normalize_technical_terms on synthetic job descriptions. The
+    loop is timed on a sample of the documents and extrapolated, since running it on
+    the full corpus takes hours. The outputs of both are compared on the sample; they
+    only differ where multi-word terms overlap shorter ones.
+
+Usage:
+    Run from the project root:
+    `python -m benchmarks.bench_term_normalizer --docs 100000 --terms 1000`
+"""
+
+import argparse
+import json
+import random
+import re
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from src.career_chief.components.term_normalizer import load_normalizer
+
+
+def make_dictionary(terms: int, rng: random.Random) -> dict:
+    """
+    Builds a normalization dictionary of lower-case abbreviations and a few multi-word terms.
+
+    Args:
+        terms (int): Number of entries.
+        rng (random.Random): Random generator.
+
+    Returns:
+        dict: Full forms keyed by term.
+    """
+    dictionary = {}
+    while len(dictionary) < terms:
+        words = rng.choices([1, 2], weights=[9, 1])[0]
+        term = " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(words))
+        # Full forms are capitalised words that never contain a term themselves
+        dictionary[term] = f"Expanded Term {len(dictionary)}".replace("0", "Zero")
+    return dictionary
+
+
+def make_documents(docs: int, dictionary: dict, rng: random.Random, words_per_doc: int = 150) -> list:
+    """
+    Builds letter-only descriptions (as produced by noise removal) where about 5% of
+    the words are dictionary terms.
+
+    Args:
+        docs (int): Number of documents.
+        dictionary (dict): The normalization dictionary.
+        rng (random.Random): Random generator.
+        words_per_doc (int): Words per document.
+
+    Returns:
+        list: The documents.
+    """
+    vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(5000)]
+    terms = list(dictionary)
+    documents = []
+    for _ in range(docs):
+        words = [rng.choice(terms).upper() if rng.random() < 0.05 else rng.choice(vocabulary) for _ in range(words_per_doc)]
+        documents.append(" ".join(words))
+    return documents
+
+
+def loop_normalize(text: str, dictionary: dict) -> str:
+    """The former implementation: one regex substitution per dictionary entry."""
+    for abbr, full_form in dictionary.items():
+        text = re.sub(r'\b{}\b'.format(abbr), full_form, text, flags=re.IGNORECASE)
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark technical term normalization.")
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--terms", type=int, default=1_000)
+    parser.add_argument("--loop-docs", type=int, default=200, help="Documents the former loop is timed on.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    dictionary = make_dictionary(args.terms, rng)
+    documents = make_documents(args.docs, dictionary, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "normalization_dict.json"
+        path.write_text(json.dumps(dictionary))
+
+        start = time.perf_counter()
+        normalizer = load_normalizer(path)
+        compile_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        load_normalizer(path)
+        cached_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalized = [normalizer.normalize(document) for document in documents]
+    single_pass_time = time.perf_counter() - start
+
+    sample = documents[:args.loop_docs]
+    start = time.perf_counter()
+    looped = [loop_normalize(document, dictionary) for document in sample]
+    loop_time = (time.perf_counter() - start) * len(documents) / len(sample)
+
+    mismatches = sum(a != b for a, b in zip(looped, normalized[:len(sample)]))
+
+    print(f"documents: {len(documents)}, dictionary entries: {len(dictionary)}")
+    print(f"compile dictionary:        {compile_time * 1000:10.1f} ms (cached reload: {cached_time * 1000:.2f} ms)")
+    print(f"single-pass normalizer:    {single_pass_time:10.2f} s  ({len(documents) / single_pass_time:,.0f} docs/s)")
+    print(f"per-term re.sub loop:      {loop_time:10.2f} s  (extrapolated from {len(sample)} documents)")
+    print(f"speedup:                   {loop_time / single_pass_time:10.1f}x")
+    # The loop lets dictionary order decide between overlapping terms ('ab' vs 'ab cd');
+    # the single-pass normalizer always takes the longest term
+    print(f"documents differing on the sample: {mismatches} (overlapping multi-word terms)")
+
+
+if __name__ == "__main__":
+    main()
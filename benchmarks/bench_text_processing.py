@@ -0,0 +1,101 @@
+"""
+bench_text_processing.py
+
+Purpose:
+    Measures how noise removal plus term normalization scales with the number of
+    worker processes of ParallelTextProcessor on synthetic job descriptions. Every
+    worker count is compared with the former single-process `apply` baseline and
+    the speedup and parallel efficiency (speedup / workers) are reported. The
+    results of every run are checked against the baseline.
+
+    Scaling is bounded by the physical cores of the machine; worker counts above
+    `os.cpu_count()` only show the overhead of oversubscription.
+
+Usage:
+    Run from the project root:
+    `python -m benchmarks.bench_text_processing --docs 200000 --workers 1 2 4 8 16 32`
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.career_chief.components.term_normalizer import load_normalizer
+from src.career_chief.components.text_processing import ParallelTextProcessor, remove_noise
+from benchmarks.bench_term_normalizer import make_dictionary
+
+
+def make_descriptions(docs: int, dictionary: dict, rng: random.Random, words_per_doc: int = 150) -> pd.Series:
+    """
+    Builds raw descriptions with punctuation, digits and dictionary terms.
+
+    Args:
+        docs (int): Number of descriptions.
+        dictionary (dict): The normalization dictionary.
+        rng (random.Random): Random generator.
+        words_per_doc (int): Words per description.
+
+    Returns:
+        pd.Series: The descriptions.
+    """
+    vocabulary = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10))) for _ in range(5000)]
+    vocabulary += ["5+", "(e.g.", "C++", "$120k", "2-3", "years.", "/", "-"]
+    terms = list(dictionary)
+    descriptions = []
+    for _ in range(docs):
+        words = [rng.choice(terms) if rng.random() < 0.05 else rng.choice(vocabulary) for _ in range(words_per_doc)]
+        descriptions.append(" ".join(words))
+    return pd.Series(descriptions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-process text cleaning.")
+    parser.add_argument("--docs", type=int, default=200_000)
+    parser.add_argument("--terms", type=int, default=1_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help="Worker counts to measure.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    dictionary = make_dictionary(args.terms, rng)
+    descriptions = make_descriptions(args.docs, dictionary, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "normalization_dict.json"
+        path.write_text(json.dumps(dictionary))
+        normalizer = load_normalizer(path)
+
+    # The former implementation: two row-by-row `apply` passes in the pipeline process
+    start = time.perf_counter()
+    baseline = descriptions.apply(lambda x: re.sub(r'[^a-zA-Z\s]', '', x)).apply(normalizer.normalize)
+    baseline_time = time.perf_counter() - start
+
+    print(f"descriptions: {len(descriptions)}, dictionary entries: {len(dictionary)}, "
+          f"chunk size: {args.chunk_size}, cpu count: {os.cpu_count()}")
+    print(f"{'workers':>8} {'seconds':>9} {'docs/s':>10} {'speedup':>8} {'efficiency':>11}")
+    print(f"{'apply':>8} {baseline_time:9.2f} {len(descriptions) / baseline_time:10,.0f} {1:8.2f}x {'':>11}")
+
+    for workers in args.workers:
+        processor = ParallelTextProcessor([remove_noise, normalizer.normalize],
+                                          workers=workers, chunk_size=args.chunk_size)
+        start = time.perf_counter()
+        cleaned = processor.map(descriptions)
+        elapsed = time.perf_counter() - start
+
+        if not cleaned.equals(baseline.astype(object)):
+            raise AssertionError(f"Output with {workers} workers differs from the baseline.")
+        speedup = baseline_time / elapsed
+        print(f"{workers:>8} {elapsed:9.2f} {len(descriptions) / elapsed:10,.0f} {speedup:8.2f}x {speedup / workers:10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,88 @@
+import argparse
+from pathlib import Path
+
 from src.career_chief import logger
+from src.career_chief.config.configuration import ConfigurationManager
+from src.career_chief.utils.stage_cache import StageCache
+from src.career_chief.utils.dag_scheduler import StageScheduler, FAILED, UPSTREAM_FAILED
+from src.career_chief.utils.tracing import collect_events, write_chrome_trace, format_summary
 from src.career_chief.pipeline.stage_01_data_ingestion import DataIngestionPipeline
 from src.career_chief.pipeline.stage_02_data_validation import DataValidationPipeline
+from src.career_chief.pipeline.stage_03_data_deduplication import DataDeduplicationPipeline
+from src.career_chief.pipeline.stage_04_data_transformation import DataTransformationPipeline
+from src.career_chief.pipeline.stage_05_spacy_ner import SpacyCustomNERModelPipeline
+
+# Pipeline stages. Their order only breaks ties; the execution order follows the
+# dependencies implied by each stage's declared input and output paths.
+STAGES = [DataIngestionPipeline, 
+          DataValidationPipeline,
+          DataDeduplicationPipeline,
+          DataTransformationPipeline,
+          SpacyCustomNERModelPipeline,
+        #   ModelTrainerPipeline,
+        #   ModelEvaluationPipeline
+          ]
+
+
+def parse_args(stage_keys):
+    """
+    Parse the orchestrator's command line arguments.
+
+    Args:
+        stage_keys (list): Names that can be passed to --only (the stages' config sections).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run the Career Chief pipeline stages.")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore the stage cache and run every stage.")
+    parser.add_argument("--only", nargs="+", metavar="STAGE", choices=stage_keys,
+                        help=f"Run only these stages, bypassing the cache. Choices: {', '.join(stage_keys)}.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of stages run concurrently. Defaults to 'max_workers' in config.yaml.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the execution plan without running any stage.")
+    return parser.parse_args()
+
 
 def main():
     """
-    Main orchestrator function to execute all the pipeline stages in the defined sequence.
+    Main orchestrator function to execute all the pipeline stages.
     
-    The function loops through each stage in the execution sequence, initiates, and runs it.
-    Any errors encountered during a stage's execution are logged, and the program is terminated.
+    The stages form a dependency graph derived from their declared artifacts. Independent 
+    stages run concurrently in a process pool, and stages whose inputs, configuration and 
+    parameters are unchanged since their last successful run are skipped, unless --force 
+    or --only is given. A failing stage stops only the stages that depend on it; the 
+    program exits with an error status once all runnable stages are done. The traced 
+    sections of the run are saved as a Chrome trace and summarised at the end.
     """
-    
-    # Define the list of pipeline stages to be executed in sequence
-    execution_sequence = [DataIngestionPipeline(), 
-                          DataValidationPipeline(),
-                        #   DataTransformationPipeline(),
-                        #   ModelTrainerPipeline(),
-                        #   ModelEvaluationPipeline()
-                          ]
-
-    for pipeline in execution_sequence:
-        try:
-            # Start and log the current pipeline stage
-            logger.info(f">>>>>> Stage: {pipeline.STAGE_NAME} started <<<<<<")
-            
-            # Execute the `run_pipeline` method of the current pipeline
-            pipeline.run_pipeline()
-            
-            # Log the successful completion of the current pipeline stage
-            logger.info(f">>>>>> Stage {pipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
-        except Exception as e:
-            # Log any errors encountered during the pipeline's execution
-            logger.exception(f"Error encountered during the {pipeline.STAGE_NAME}: {e}")
-            logger.error("Program terminated due to an error.")
-            
-            # Exit the program with an error status
-            exit(1)
+    args = parse_args([stage.CONFIG_SECTION for stage in STAGES])
+
+    config_manager = ConfigurationManager()
+    stage_cache = StageCache(Path(config_manager.config.get("stage_cache_dir", "artifacts/stage_cache")))
+    max_workers = args.workers or config_manager.config.get("max_workers", 1)
+
+    scheduler = StageScheduler(STAGES, config_manager, stage_cache, max_workers=max_workers)
+
+    if args.dry_run:
+        print(scheduler.describe_plan(force=args.force, only=args.only))
+        return
+
+    states = scheduler.run(force=args.force, only=args.only)
+
+    events = collect_events()
+    if events:
+        write_chrome_trace(Path(config_manager.config.get("trace_dir", "artifacts/traces")), events)
+        logger.info(f"Time spent per traced section:\n{format_summary(events)}")
+
+    failed = [key for key, state in states.items() if state in (FAILED, UPSTREAM_FAILED)]
+    if failed:
+        logger.error(f"Program terminated due to an error. Stages not completed: {', '.join(failed)}.")
+        
+        # Exit the program with an error status
+        exit(1)
 
 if __name__ == "__main__":
     # Start the main orchestrator function if the script is run as the main module
-    main()
\ No newline at end of file
+    main()
@@ -2,13 +2,18 @@
 logger.py
 
 Purpose:
-    Configures and provides a logger for this project. 
+    Configures and provides a logger for this project.
     The logger logs messages to both the console (stdout) and a specified log file.
+    Records are handed to a background thread through a queue, so logging calls in
+    hot loops never block on file or console I/O.
 """
 
 import os
 import sys
+import queue
 import logging
+import logging.handlers
+from multiprocessing import util as multiprocessing_util
 
 # Logger format string
 logging_str = "[%(asctime)s: %(lineno)d: %(name)s: %(levelname)s: %(module)s:  %(message)s]"
@@ -20,15 +25,54 @@ log_file_path = os.path.join(log_dir, "running_logs.log")
 # Check and create log directory if not exists
 os.makedirs(log_dir, exist_ok=True)
 
+# The handlers doing the actual I/O, driven by the queue listener's thread
+formatter = logging.Formatter(logging_str)
+output_handlers = [logging.FileHandler(log_file_path), logging.StreamHandler(sys.stdout)]
+for handler in output_handlers:
+    handler.setFormatter(formatter)
+
+# The queue handler only renders the message; the output handlers add the prefix
+queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 # Basic logging configuration
 logging.basicConfig(
     level=logging.INFO,
-    format=logging_str,
-    handlers=[
-        logging.FileHandler(log_file_path),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[queue_handler]
 )
 
+
+def _start_listener() -> logging.handlers.QueueListener:
+    """Start a listener thread draining the log queue into the output handlers."""
+    listener = logging.handlers.QueueListener(queue_handler.queue, *output_handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _stop_listener_at_exit(*_):
+    """
+    Stop the listener, flushing the remaining records, when the process exits. The
+    multiprocessing finalizers also run in worker processes, which skip atexit hooks.
+    """
+    def stop(current):
+        if current._thread is not None:
+            current.stop()
+    multiprocessing_util.Finalize(None, stop, args=(listener,), exitpriority=0)
+
+
+def _restart_listener_after_fork():
+    """A forked child does not inherit the listener thread, so it gets its own queue and listener."""
+    global listener
+    queue_handler.queue = queue.SimpleQueue()
+    listener = _start_listener()
+    _stop_listener_at_exit()
+
+
+listener = _start_listener()
+_stop_listener_at_exit()
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
+# Worker processes clear the finalizers they inherited or registered while unpickling their target
+multiprocessing_util.register_after_fork(queue_handler, _stop_listener_at_exit)
+
 # Create and provide logger instance
-logger = logging.getLogger("career_chief_logger")
\ No newline at end of file
+logger = logging.getLogger("career_chief_logger")
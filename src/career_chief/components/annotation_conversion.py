@@ -0,0 +1,265 @@
+import os
+import json
+from pathlib import Path
+from collections import deque
+from typing import Iterator, List, Tuple
+
+import pandas as pd
+
+from src.career_chief import logger
+from src.career_chief.components.data_splitter import HashSplitter
+from src.career_chief.utils.tracing import trace
+
+
+# Characters read from the export at a time
+_READ_SIZE = 1 << 20
+
+# Tokenizer of a worker process, created by _init_converter
+_worker_nlp = None
+
+
+def iter_json_array(path: Path, read_size: int = _READ_SIZE) -> Iterator[dict]:
+    """
+    Yield the items of a JSON array file one at a time.
+
+    Only the item being parsed and one block of the file are held in memory, so the
+    size of the file does not matter.
+
+    Args:
+    - path (Path): The JSON file, whose top-level value is an array.
+    - read_size (int, optional): Characters read at a time. Defaults to 1M.
+
+    Yields:
+    - dict: The items of the array, in order.
+
+    Raises:
+    - ValueError: If the file is not a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer, position, eof = "", 0, False
+
+        def fill():
+            nonlocal buffer, position, eof
+            block = f.read(read_size)
+            eof = not block
+            buffer = buffer[position:] + block
+            position = 0
+
+        def skip(characters: str):
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in characters:
+                    position += 1
+                if position < len(buffer) or eof:
+                    return
+                fill()
+
+        skip(" \t\r\n")
+        if buffer[position:position + 1] != "[":
+            raise ValueError(f"{path} does not contain a JSON array.")
+        position += 1
+
+        while True:
+            skip(" \t\r\n,")
+            if position >= len(buffer):
+                raise ValueError(f"Unexpected end of {path}.")
+            if buffer[position] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            position = end
+            yield item
+
+
+def _init_converter():
+    """Create the blank English tokenizer of a worker process."""
+    global _worker_nlp
+    import spacy
+
+    _worker_nlp = spacy.blank("en")
+
+
+def _task_to_doc(nlp, item: dict):
+    """
+    Turn one Label Studio task into a Doc with its labelled entity spans.
+
+    Spans overlapping an earlier span of the task, or not aligned to token boundaries,
+    are dropped.
+    """
+    doc = nlp.make_doc(item["data"]["text"])
+
+    ents = []
+    existing_spans = set()
+    for annot in item["annotations"][0]["result"]:
+        start = annot["value"]["start"]
+        end = annot["value"]["end"]
+        label = annot["value"]["labels"][0]
+
+        if not any((start <= s < end) or (start < e <= end) for s, e in existing_spans):
+            span = doc.char_span(start, end, label=label, alignment_mode="strict")
+            if span is not None:
+                ents.append(span)
+                existing_spans.add((start, end))
+
+    doc.ents = ents
+    return doc
+
+
+def _convert_tasks(tasks: List[dict], dev_flags: List[bool]) -> Tuple[bytes, int, bytes, int]:
+    """
+    Convert a batch of tasks into a serialized train DocBin and dev DocBin.
+
+    Returns:
+    - Tuple[bytes, int, bytes, int]: The train DocBin and its number of documents,
+      then the dev DocBin and its number of documents.
+    """
+    from spacy.tokens import DocBin
+
+    if _worker_nlp is None:
+        _init_converter()
+
+    train_bin, dev_bin = DocBin(store_user_data=True), DocBin(store_user_data=True)
+    for item, is_dev in zip(tasks, dev_flags):
+        (dev_bin if is_dev else train_bin).add(_task_to_doc(_worker_nlp, item))
+    return train_bin.to_bytes(), len(train_bin), dev_bin.to_bytes(), len(dev_bin)
+
+
+class AnnotationConverter:
+    """
+    Converts a Label Studio JSON export into sharded spaCy DocBin files.
+
+    The export is parsed incrementally and cut into batches of `shard_size` annotated
+    tasks, which are converted to Docs in parallel worker processes. Every batch becomes
+    one train shard and one dev shard of at most `shard_size` documents, written as soon
+    as it is ready; at most two batches per worker are in flight. The train and dev
+    directories can be passed to spaCy's corpus reader (`--paths.train`/`--paths.dev`)
+    directly, as it reads every .spacy file of a directory.
+
+    A task goes to dev from a hash of its Label Studio id, so a task keeps its split
+    when the export grows.
+
+    Attributes:
+    - json_path (Path): The Label Studio JSON export.
+    - train_dir (Path): Directory of the training shards.
+    - dev_dir (Path): Directory of the development shards.
+    - shard_size (int): Maximum number of tasks per batch and documents per shard.
+    - workers (int): Number of worker processes; 1 converts in this process.
+    - splitter (HashSplitter): Assigns tasks to dev.
+    """
+
+    def __init__(self, json_path: Path, train_dir: Path, dev_dir: Path, dev_size: float = 0.2,
+                 shard_size: int = 1000, workers: int = 1):
+        """
+        Initialize the AnnotationConverter.
+
+        Args:
+        - json_path (Path): The Label Studio JSON export.
+        - train_dir (Path): Directory of the training shards.
+        - dev_dir (Path): Directory of the development shards.
+        - dev_size (float, optional): Fraction of tasks used for development. Defaults to 0.2.
+        - shard_size (int, optional): Maximum number of documents per shard. Defaults to 1000.
+        - workers (int, optional): Number of worker processes. Defaults to 1.
+        """
+        self.json_path = Path(json_path)
+        self.train_dir = Path(train_dir)
+        self.dev_dir = Path(dev_dir)
+        self.shard_size = max(1, shard_size)
+        self.workers = max(1, workers)
+        self.splitter = HashSplitter(val_size=dev_size, test_size=0.0, key="id")
+
+    def _batches(self) -> Iterator[Tuple[List[dict], List[bool]]]:
+        """Yield batches of annotated tasks with the dev flag of every task."""
+        batch, skipped = [], 0
+        for item in iter_json_array(self.json_path):
+            if not item.get("annotations"):
+                skipped += 1
+                continue
+            batch.append(item)
+            if len(batch) == self.shard_size:
+                yield batch, self._dev_flags(batch)
+                batch = []
+        if batch:
+            yield batch, self._dev_flags(batch)
+        if skipped:
+            logger.warning(f"Skipped {skipped} tasks without annotations in {self.json_path}.")
+
+    def _dev_flags(self, batch: List[dict]) -> List[bool]:
+        codes = self.splitter.assign(pd.Series([item.get("id") for item in batch], dtype=object))
+        return (codes == self.splitter.SPLITS.index("val")).tolist()
+
+    def _prepare_dir(self, directory: Path):
+        """Create a shard directory and remove the shards of an earlier conversion."""
+        os.makedirs(directory, exist_ok=True)
+        for shard in directory.glob("*.spacy"):
+            shard.unlink()
+
+    def convert(self) -> Tuple[int, int]:
+        """
+        Convert the export into train and dev shards.
+
+        Returns:
+        - Tuple[int, int]: Number of training and development documents.
+        """
+        self._prepare_dir(self.train_dir)
+        self._prepare_dir(self.dev_dir)
+
+        counts = {"train": 0, "dev": 0}
+        shards = {"train": 0, "dev": 0}
+
+        def write(result: Tuple[bytes, int, bytes, int]):
+            train_bytes, train_docs, dev_bytes, dev_docs = result
+            for split, directory, data, docs in (("train", self.train_dir, train_bytes, train_docs),
+                                                 ("dev", self.dev_dir, dev_bytes, dev_docs)):
+                if docs:
+                    (directory / f"shard-{shards[split]:05d}.spacy").write_bytes(data)
+                    shards[split] += 1
+                    counts[split] += docs
+
+        with trace("annotation_conversion.convert") as span:
+            if self.workers == 1:
+                for tasks, dev_flags in self._batches():
+                    write(_convert_tasks(tasks, dev_flags))
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+
+                # Batches are submitted as results are written, so only a bounded number of
+                # parsed tasks and converted shards are held at a time; shards keep their order
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_converter) as executor:
+                    pending = deque()
+                    for tasks, dev_flags in self._batches():
+                        pending.append(executor.submit(_convert_tasks, tasks, dev_flags))
+                        if len(pending) >= 2 * self.workers:
+                            write(pending.popleft().result())
+                    while pending:
+                        write(pending.popleft().result())
+            span.rows = counts["train"] + counts["dev"]
+
+        logger.info(f"Converted {self.json_path} into {counts['train']} training documents in {shards['train']} "
+                    f"shards ({self.train_dir}) and {counts['dev']} development documents in {shards['dev']} "
+                    f"shards ({self.dev_dir}).")
+        return counts["train"], counts["dev"]
+
+
+def iter_docs(path: Path, vocab) -> Iterator:
+    """
+    Yield the Docs of a .spacy file or of every .spacy shard in a directory.
+
+    Args:
+    - path (Path): A .spacy file or a directory of shards.
+    - vocab (Vocab): Vocabulary the Docs are restored with.
+
+    Yields:
+    - Doc: The documents, shard by shard.
+    """
+    from spacy.tokens import DocBin
+
+    path = Path(path)
+    files = sorted(path.rglob("*.spacy")) if path.is_dir() else [path]
+    for file in files:
+        yield from DocBin().from_disk(file).get_docs(vocab)
@@ -0,0 +1,212 @@
+import ast
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.career_chief import logger
+from src.career_chief.components.semantic_role_labeling import role_spans
+from src.career_chief.utils.dataset_io import DatasetWriter, dataset_format, dataset_schema, read_dataset, read_table
+from src.career_chief.utils.tracing import trace
+
+
+# Columns of the SRL results combined into the embedded text, in order. The roles are
+# 'srl_roles' in Parquet and Arrow results and 'processed_srl_results' in CSV ones
+_TEXT_COLUMNS = ["entities", "topic", "probability", "srl_roles", "processed_srl_results"]
+
+
+def load_sentence_encoder(model_name: str):
+    """
+    Loads a SentenceTransformer model by name or from a local directory.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+def load_embeddings(output_path: Path, index_path: Path) -> Tuple[np.ndarray, pd.Series]:
+    """
+    Load saved embeddings memory-mapped, with the job ids of their rows.
+
+    Args:
+    - output_path (Path): The `.npy` embedding matrix.
+    - index_path (Path): The job id index saved with it.
+
+    Returns:
+    - Tuple[np.ndarray, pd.Series]: The read-only matrix, and the job id of every row.
+    """
+    embeddings = np.load(output_path, mmap_mode="r")
+    job_ids = read_dataset(index_path, columns=["job_id"])["job_id"]
+    return embeddings, job_ids
+
+
+def join_spans(column: pa.ChunkedArray, text_field: str, label_field: str) -> pd.Series:
+    """
+    Format the spans of a list<struct> column as 'text [label]' and join them per row.
+
+    The spans are formatted on the flattened column, without visiting the rows in Python.
+
+    Args:
+    - column (pa.ChunkedArray): A list column of structs, e.g. 'entities' or 'srl_roles', or
+      of [text, label] pairs.
+    - text_field (str): Field holding the text of a span.
+    - label_field (str): Field holding the label of a span.
+
+    Returns:
+    - pd.Series: The joined spans of every row; empty for rows without spans.
+    """
+    lists = column.combine_chunks()
+    spans = pc.list_flatten(lists)
+    rows = pc.list_parent_indices(lists).to_numpy()
+    if pa.types.is_struct(spans.type):
+        texts, labels = spans.field(text_field), spans.field(label_field)
+    else:
+        texts, labels = pc.list_element(spans, 0), pc.list_element(spans, 1)
+    parts = texts.to_pandas().fillna("") + " [" + labels.to_pandas().fillna("") + "]"
+    joined = parts.groupby(rows).agg(" ".join)
+    return joined.reindex(range(len(lists)), fill_value="")
+
+
+def _format_entities(value) -> str:
+    """Format a stringified list of (text, label) or {'text', 'label'} entities of a CSV file as 'text [label]' spans."""
+    if not isinstance(value, str):
+        return ""
+    entities = [(ent["text"], ent["label"]) if isinstance(ent, dict) else ent for ent in ast.literal_eval(value)]
+    return " ".join(f"{text} [{label}]" for text, label in entities)
+
+
+def _format_roles(value) -> str:
+    """Format a stringified processed SRL result of a CSV file as the 'text [role]' spans of `join_spans`."""
+    if not isinstance(value, str):
+        return ""
+    return " ".join(f"{span['text']} [{span['role']}]" for span in role_spans(ast.literal_eval(value)))
+
+
+class ContextualEmbedder:
+    def __init__(self, config, encoder=None):
+        """
+        Initializes the ContextualEmbedder with the SentenceTransformer model specified in the configuration,
+        or with the given encoder. Loads the SRL results from the path provided in the config.
+
+        With a positive `batch_size` the texts are encoded in batches, sorted by length when
+        `sort_by_length` is set so that every batch holds texts of similar length. The
+        embeddings are saved as one contiguous `.npy` matrix of `dtype`, with the job id of
+        every row in a separate index file, so both load without unpickling (see
+        `load_embeddings`). A `batch_size` of 0 encodes the texts one at a time.
+
+        Args:
+            config (ContextualEmbedderConfig): Configuration object containing attributes like model_name, results_path, output_path and index_path.
+            encoder (optional): Any model with a SentenceTransformer-style `encode(texts, batch_size=...)`
+                returning an array, used instead of loading `config.model_name`.
+        """
+        self.config = config
+        self.model = encoder if encoder is not None else load_sentence_encoder(config.model_name)
+        self.table = self.load_results()
+        self.data = pd.DataFrame({"job_id": self.table.column("job_id").to_pandas()})
+        self.embeddings = None
+        logger.info(f"ContextualEmbedder initialized with model {config.model_name} and data from {config.results_path}.")
+
+    def load_results(self) -> pa.Table:
+        """
+        Loads the job ids and the columns of the SRL results that make up the texts.
+        Parquet and Arrow results are read as these columns only, keeping their nested types.
+        """
+        path = self.config.results_path
+        if dataset_format(path) == "csv":
+            df = read_dataset(path)
+            names = df.columns
+        else:
+            names = dataset_schema(path).names
+        columns = ["job_id"] + [name for name in _TEXT_COLUMNS if name in names]
+        if dataset_format(path) == "csv":
+            return pa.Table.from_pandas(df[columns], preserve_index=False)
+        return read_table(path, columns=columns)
+
+    def preprocess_text(self):
+        """
+        Combines the entities, topic, probability and semantic roles of every job into a single text.
+        Entities and role spans are written as 'text [label]'; nested columns are formatted on their
+        flattened values, while stringified CSV columns are parsed row by row into the same text.
+
+        The roles are the spans of every verb in order, e.g. 'We [ARG0] build [V] models [ARG1]',
+        rather than the stringified processed_srl_results dict the research notebook embedded.
+        """
+        table = self.table
+        parts = []
+        if "entities" in table.column_names:
+            entities = table.column("entities")
+            if pa.types.is_list(entities.type) or pa.types.is_large_list(entities.type):
+                parts.append(join_spans(entities, "text", "label"))
+            else:
+                parts.append(entities.to_pandas().map(_format_entities))
+        if "topic" in table.column_names:
+            parts.append("Topic " + table.column("topic").to_pandas().astype(str))
+        if "probability" in table.column_names:
+            parts.append(table.column("probability").to_pandas().astype(str))
+        if "srl_roles" in table.column_names:
+            parts.append(join_spans(table.column("srl_roles"), "text", "role"))
+        elif "processed_srl_results" in table.column_names:
+            parts.append(table.column("processed_srl_results").to_pandas().map(_format_roles))
+
+        combined = pd.Series([""] * table.num_rows, dtype=object)
+        for part in parts:
+            combined = combined.str.cat(part.reset_index(drop=True), sep=" ")
+        self.data['combined_text'] = combined.str.strip().to_numpy()
+        logger.info("Text data preprocessed successfully.")
+
+    def _encode(self, texts) -> np.ndarray:
+        return np.asarray(self.model.encode(texts, batch_size=max(1, self.config.batch_size),
+                                            show_progress_bar=False, convert_to_numpy=True))
+
+    def create_embeddings(self):
+        """
+        Generates embeddings for each entry in the dataframe by encoding the combined text.
+        """
+        from tqdm.auto import tqdm
+
+        if 'combined_text' not in self.data.columns:
+            self.preprocess_text()
+        texts = self.data['combined_text'].tolist()
+        batch_size = self.config.batch_size
+        dtype = np.dtype(self.config.dtype)
+
+        if batch_size > 0:
+            order = np.arange(len(texts))
+            if self.config.sort_by_length:
+                # Longest first, so a batch that does not fit in memory fails at the start
+                order = np.argsort(-np.fromiter(map(len, texts), dtype=np.int64, count=len(texts)), kind="stable")
+            batches = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+        else:
+            batches = [np.array([i]) for i in range(len(texts))]
+
+        logger.info(f"Encoding {len(texts)} texts in {len(batches)} batches of up to {max(1, batch_size)}.")
+        embeddings = None
+        with trace("contextual_embedding.encode", rows=len(texts)):
+            for batch in tqdm(batches, desc="Encoding"):
+                vectors = self._encode([texts[i] for i in batch])
+                if embeddings is None:
+                    embeddings = np.empty((len(texts), vectors.shape[1]), dtype=dtype)
+                embeddings[batch] = vectors
+        self.embeddings = embeddings if embeddings is not None else np.empty((0, 0), dtype=dtype)
+        logger.info("Embeddings created successfully.")
+
+    def save_embeddings(self):
+        """
+        Saves the embedding matrix to the output path and the job id of each of its rows to the index path.
+        """
+        output_path = Path(self.config.output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(output_path, np.ascontiguousarray(self.embeddings))
+        with DatasetWriter(self.config.index_path) as writer:
+            writer.write(self.data[['job_id']])
+        logger.info(f"Embeddings {self.embeddings.shape} saved successfully at {output_path}, "
+                    f"job ids at {self.config.index_path}.")
+
+    def get_embeddings(self):
+        """
+        Returns the embedding matrix, with one row per job in the order of `data`.
+        """
+        return self.embeddings
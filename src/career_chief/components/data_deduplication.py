@@ -0,0 +1,320 @@
+import os
+import re
+import zlib
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from src.career_chief import logger
+from src.career_chief.entity.config_entity import DataDeduplicationConfig
+from src.career_chief.utils.dataset_io import DatasetWriter, iter_dataset, read_dataset
+from src.career_chief.utils.tracing import trace
+
+
+# Largest Mersenne prime below 2^64, used by the universal hash family of the permutations
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Rows of the ingested data filtered at a time when writing the deduplicated dataset
+_CHUNK_ROWS = 50_000
+
+# Candidate pairs whose signatures are compared at a time
+_PAIR_BATCH = 100_000
+
+# Every MinHash value of a text without words. A text with words would need the largest
+# 32-bit hash as its minimum under all permutations, which does not happen in practice
+_EMPTY_SIGNATURE_VALUE = np.uint32(_MAX_HASH)
+
+
+class MinHashLSHIndex:
+    """
+    A MinHash signature store with an LSH banding index.
+
+    Every document is reduced to `num_perm` MinHash values over its word shingles.
+    The signature is split into `bands` bands; documents sharing a band are candidate
+    near-duplicates and are confirmed when the fraction of equal MinHash values (the
+    Jaccard similarity estimate) reaches `similarity_threshold`.
+
+    Attributes:
+    - num_perm (int): Number of MinHash permutations.
+    - bands (int): Number of LSH bands; must divide num_perm.
+    - shingle_size (int): Number of consecutive words per shingle.
+    - similarity_threshold (float): Minimum estimated Jaccard similarity of a near-duplicate.
+    - job_ids (np.ndarray): Ids of the indexed documents, in insertion order.
+    - canonical_ids (np.ndarray): Canonical id of every indexed document.
+    - signatures (np.ndarray): MinHash signatures, shape (documents, num_perm), uint32.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 5,
+                 similarity_threshold: float = 0.8, seed: int = 42):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands}).")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.similarity_threshold = similarity_threshold
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._band_coefficients = rng.integers(1, np.iinfo(np.int64).max, size=num_perm // bands, dtype=np.uint64) | np.uint64(1)
+        self._token_hashes = {}
+
+        self.job_ids = np.empty(0, dtype=object)
+        self.canonical_ids = np.empty(0, dtype=object)
+        self.signatures = np.empty((0, num_perm), dtype=np.uint32)
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        """
+        Hash the word shingles of a text. Token hashes are cached; shingle hashes are
+        combined from them with a vectorized polynomial over a sliding window.
+        """
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if not tokens:
+            return np.empty(0, dtype=np.uint64)
+
+        cache = self._token_hashes
+        token_hashes = np.fromiter(
+            (cache[t] if t in cache else cache.setdefault(t, zlib.crc32(t.encode("utf-8"))) for t in tokens),
+            dtype=np.uint64, count=len(tokens))
+
+        k = min(self.shingle_size, len(tokens))
+        shingles = np.zeros(len(tokens) - k + 1, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for offset in range(k):
+                shingles = shingles * np.uint64(1_000_003) + token_hashes[offset:len(tokens) - k + 1 + offset]
+        return np.unique(shingles)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+        - text (str): The document.
+
+        Returns:
+        - np.ndarray: The signature, shape (num_perm,), uint32. Texts without words get
+          the largest uint32 value everywhere and are never matched with another document.
+        """
+        shingles = self._shingle_hashes(text if isinstance(text, str) else "")
+        if not len(shingles):
+            return np.full(self.num_perm, _EMPTY_SIGNATURE_VALUE, dtype=np.uint32)
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(self._a, shingles) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Hash every band of every signature into one uint64 key, shape (documents, bands)."""
+        rows = self.num_perm // self.bands
+        banded = signatures.astype(np.uint64).reshape(len(signatures), self.bands, rows)
+        with np.errstate(over="ignore"):
+            return (banded * self._band_coefficients).sum(axis=2)
+
+    def add(self, job_ids: np.ndarray, signatures: np.ndarray) -> np.ndarray:
+        """
+        Add documents to the index and resolve the canonical id of each of them.
+
+        Documents already in the index keep their canonical id. A new document maps to
+        the earliest indexed document it is a near-duplicate of, or to itself. Documents
+        without words (see `signature`) have no candidates and always map to themselves.
+
+        Args:
+        - job_ids (np.ndarray): Ids of the new documents (unique, not yet indexed).
+        - signatures (np.ndarray): Their MinHash signatures.
+
+        Returns:
+        - np.ndarray: Canonical id of every new document.
+        """
+        start = len(self.job_ids)
+        all_signatures = np.vstack([self.signatures, signatures])
+        total = len(all_signatures)
+
+        parent = np.arange(total)
+
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        # Documents without words are left out of the buckets, so they match nothing
+        candidates = np.flatnonzero((all_signatures != _EMPTY_SIGNATURE_VALUE).any(axis=1))
+        keys = self._band_keys(all_signatures[candidates])
+        positions = np.arange(len(candidates))
+        for band in range(self.bands):
+            # A stable sort keeps the earliest document first within every bucket
+            band_order = np.argsort(keys[:, band], kind="stable")
+            order = candidates[band_order]
+            sorted_keys = keys[band_order, band]
+            starts = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+            bucket_start = np.maximum.accumulate(np.where(starts, positions, 0))
+
+            # Pair every new document with each document before it in its bucket. Documents
+            # only sort after earlier ones, so these are all pairs involving a new document
+            later = positions[order >= start]
+            counts = later - bucket_start[later]
+            if not counts.sum():
+                continue
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            members = order[np.repeat(later, counts)]
+            others = order[np.repeat(bucket_start[later], counts) + offsets]
+
+            for begin in range(0, len(members), _PAIR_BATCH):
+                batch_members = members[begin:begin + _PAIR_BATCH]
+                batch_others = others[begin:begin + _PAIR_BATCH]
+                similarity = (all_signatures[batch_members] == all_signatures[batch_others]).mean(axis=1)
+                similar = similarity >= self.similarity_threshold
+                for member, other in zip(batch_members[similar], batch_others[similar]):
+                    root_member, root_other = find(member), find(other)
+                    if root_member != root_other:
+                        # The earlier document always becomes the representative
+                        parent[max(root_member, root_other)] = min(root_member, root_other)
+
+        # Indexed documents keep their recorded canonical id; new representatives map to themselves
+        roots = np.array([find(node) for node in range(start, total)], dtype=np.int64)
+        lookup = np.concatenate([self.canonical_ids, np.asarray(job_ids, dtype=object)])
+        new_canonical = lookup[roots] if len(roots) else np.empty(0, dtype=object)
+
+        self.job_ids = np.concatenate([self.job_ids, np.asarray(job_ids, dtype=object)])
+        self.canonical_ids = np.concatenate([self.canonical_ids, new_canonical])
+        self.signatures = all_signatures
+        return new_canonical
+
+    def save(self, index_dir: Path):
+        """
+        Persist the index to a directory.
+
+        Args:
+        - index_dir (Path): Directory receiving 'signatures.npy' and 'ids.csv'.
+        """
+        os.makedirs(index_dir, exist_ok=True)
+        np.save(Path(index_dir) / "signatures.npy", self.signatures)
+        pd.DataFrame({"job_id": self.job_ids, "canonical_job_id": self.canonical_ids}).to_csv(
+            Path(index_dir) / "ids.csv", index=False)
+        logger.info(f"MinHash LSH index with {len(self.job_ids)} documents saved to {index_dir}.")
+
+    def load(self, index_dir: Path) -> bool:
+        """
+        Load a previously saved index, if present.
+
+        Args:
+        - index_dir (Path): Directory written by `save`.
+
+        Returns:
+        - bool: True if an index was loaded.
+        """
+        signatures_path = Path(index_dir) / "signatures.npy"
+        ids_path = Path(index_dir) / "ids.csv"
+        if not (signatures_path.exists() and ids_path.exists()):
+            return False
+
+        signatures = np.load(signatures_path)
+        if signatures.shape[1] != self.num_perm:
+            logger.warning(f"Ignoring MinHash index at {index_dir}: built with {signatures.shape[1]} permutations.")
+            return False
+
+        ids = pd.read_csv(ids_path, dtype=str)
+        self.signatures = signatures
+        self.job_ids = ids["job_id"].to_numpy(dtype=object)
+        self.canonical_ids = ids["canonical_job_id"].to_numpy(dtype=object)
+        logger.info(f"MinHash LSH index with {len(self.job_ids)} documents loaded from {index_dir}.")
+        return True
+
+
+class DataDeduplication:
+    """
+    DataDeduplication removes repeated job postings before the expensive NLP stages.
+
+    Postings are first deduplicated exactly on `job_id`. The remaining descriptions are
+    then checked for near-duplicates (the same posting syndicated through different
+    `via` sources with slightly different text) against a persistent MinHash LSH index,
+    so each new batch is compared with everything seen in earlier runs. The canonical
+    postings are written to `deduplicated_file`, the input of the later stages.
+
+    Attributes:
+    - config (DataDeduplicationConfig): Configuration settings for deduplication.
+    - index (MinHashLSHIndex): The near-duplicate index.
+    """
+
+    def __init__(self, config: DataDeduplicationConfig):
+        """
+        Initialize the DataDeduplication component.
+
+        Args:
+        - config (DataDeduplicationConfig): Configuration settings for deduplication.
+        """
+        self.config = config
+        self.index = MinHashLSHIndex(num_perm=config.num_perm,
+                                     bands=config.bands,
+                                     shingle_size=config.shingle_size,
+                                     similarity_threshold=config.similarity_threshold,
+                                     seed=config.seed)
+
+    def run(self) -> pd.DataFrame:
+        """
+        Build the canonical-id mapping for the ingested data and update the index.
+
+        Returns:
+        - pd.DataFrame: One row per distinct job_id with columns 'job_id',
+          'canonical_job_id' and 'is_duplicate'.
+        """
+        with trace("data_deduplication.read") as span:
+            df = read_dataset(self.config.data_source_file, columns=["job_id", "description"], dtype={"job_id": str})
+            span.rows = total_rows = len(df)
+
+        # Exact deduplication: the first occurrence of a job_id wins
+        df = df.dropna(subset=["job_id"]).drop_duplicates(subset="job_id", keep="first")
+        logger.info(f"Exact deduplication on job_id: {total_rows} rows -> {len(df)} distinct postings.")
+
+        self.index.load(self.config.index_dir)
+        known = pd.Series(self.index.canonical_ids, index=self.index.job_ids)
+
+        new_postings = df[~df["job_id"].isin(known.index)]
+        logger.info(f"Computing MinHash signatures for {len(new_postings)} new postings.")
+        with trace("data_deduplication.signatures", rows=len(new_postings)):
+            signatures = np.empty((len(new_postings), self.config.num_perm), dtype=np.uint32)
+            for row, text in enumerate(new_postings["description"].to_numpy()):
+                signatures[row] = self.index.signature(text)
+
+        with trace("data_deduplication.lsh_index", rows=len(new_postings)):
+            new_canonical = self.index.add(new_postings["job_id"].to_numpy(dtype=object), signatures)
+        canonical = pd.concat([known, pd.Series(new_canonical, index=new_postings["job_id"].to_numpy())])
+
+        mapping = pd.DataFrame({"job_id": df["job_id"].to_numpy()})
+        mapping["canonical_job_id"] = canonical.reindex(mapping["job_id"]).to_numpy()
+        mapping["is_duplicate"] = mapping["job_id"] != mapping["canonical_job_id"]
+
+        os.makedirs(Path(self.config.canonical_map_file).parent, exist_ok=True)
+        mapping.to_csv(self.config.canonical_map_file, index=False)
+        self.index.save(self.config.index_dir)
+
+        logger.info(f"Near-duplicate detection: {int(mapping['is_duplicate'].sum())} of {len(mapping)} postings "
+                    f"map to another canonical posting. Mapping saved to {self.config.canonical_map_file}.")
+
+        self.write_deduplicated(mapping.loc[~mapping["is_duplicate"], "job_id"])
+        return mapping
+
+    def write_deduplicated(self, canonical_ids: pd.Series):
+        """
+        Write the ingested data restricted to the canonical postings, with all its columns.
+
+        The data is streamed in chunks; of rows repeating a job_id only the first is kept,
+        as in the exact deduplication.
+
+        Args:
+        - canonical_ids (pd.Series): The job_ids of the canonical postings.
+        """
+        keep = set(canonical_ids)
+        written = set()
+        with trace("data_deduplication.write") as span, DatasetWriter(self.config.deduplicated_file) as writer:
+            first_chunk = None
+            for chunk in iter_dataset(self.config.data_source_file, _CHUNK_ROWS, dtype={"job_id": str}):
+                first_chunk = chunk if first_chunk is None else first_chunk
+                job_ids = chunk["job_id"].astype(str)
+                selected = job_ids.isin(keep) & ~job_ids.isin(written) & ~job_ids.duplicated()
+                written.update(job_ids[selected])
+                writer.write(chunk[selected.to_numpy()])
+            writer.close(empty=first_chunk)
+            span.rows = writer.rows
+        logger.info(f"{writer.rows} canonical postings saved to {self.config.deduplicated_file}.")
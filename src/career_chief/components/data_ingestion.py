@@ -1,11 +1,15 @@
 import os
 import shutil
 import pandas as pd
+import fastparquet
 from pathlib import Path
+from typing import List, Optional
 
 from src.career_chief import logger
-from src.career_chief.utils.common import get_size
+from src.career_chief.utils.common import get_size, get_file_hash, transfer_file, load_json, save_json
 from src.career_chief.entity.config_entity import DataIngestionConfig
+from src.career_chief.utils.schema_loader import SchemaLoader
+from src.career_chief.utils.tracing import trace
 
 class DataIngestion:
     """
@@ -17,6 +21,7 @@ class DataIngestion:
 
     Attributes:
     - config (DataIngestionConfig): Configuration settings for data ingestion.
+    - loader (SchemaLoader): Reads the data with the column types declared in the schema.
     """
 
     def __init__(self, config: DataIngestionConfig):
@@ -27,6 +32,7 @@ class DataIngestion:
         - config (DataIngestionConfig): Configuration settings for data ingestion.
         """
         self.config = config
+        self.loader = SchemaLoader(config.schema or {})
 
     def download_data(self):
         """ 
@@ -42,12 +48,80 @@ class DataIngestion:
         """
         pass
 
-    def read_data_file(self, file_name: str = "gsearch_jobs.csv") -> pd.DataFrame:
+    def get_parquet_path(self, file_name: str = "gsearch_jobs.csv") -> Path:
+        """
+        Return the location of the Parquet dataset that mirrors the given CSV artifact.
+
+        Args:
+        - file_name (str, optional): The name of the CSV artifact. Defaults to "gsearch_jobs.csv".
+
+        Returns:
+        - Path: Path to the Parquet dataset directory, e.g. 'artifacts/data_ingestion/gsearch_jobs.parquet'.
+        """
+        return Path(self.config.root_dir) / Path(file_name).with_suffix(".parquet").name
+
+    def convert_to_parquet(self, file_name: str = "gsearch_jobs.csv") -> Path:
+        """
+        Convert the ingested CSV artifact into a columnar Parquet dataset using fastparquet.
+
+        The dataset is written in the 'hive' layout with one part file per row group of
+        `row_group_size` rows, so readers can project columns and skip row groups
+        instead of re-parsing the whole CSV. Columns are stored in their schema types,
+        so categorical columns are dictionary-encoded in the Parquet files.
+
+        Args:
+        - file_name (str, optional): The name of the CSV artifact to convert. Defaults to "gsearch_jobs.csv".
+
+        Returns:
+        - Path: Path to the written Parquet dataset.
+
+        Raises:
+        - FileNotFoundError: If the CSV artifact does not exist in the artifact directory.
+        """
+        artifact_data_path = Path(self.config.root_dir) / file_name
+        parquet_path = self.get_parquet_path(file_name)
+
+        if not artifact_data_path.exists():
+            logger.error(f"Artifact data file not found at {artifact_data_path}.")
+            raise FileNotFoundError(f"No file found at {artifact_data_path}")
+
+        with trace("data_ingestion.read_csv") as span:
+            df = self.loader.read_csv(artifact_data_path)
+            span.rows = len(df)
+
+        # Remove a previous conversion so stale part files are never mixed with new ones
+        if parquet_path.exists():
+            shutil.rmtree(parquet_path)
+
+        with trace("data_ingestion.write_parquet", rows=len(df)):
+            fastparquet.write(str(parquet_path), df,
+                              row_group_offsets=self.config.row_group_size,
+                              file_scheme="hive",
+                              write_index=False)
+
+        logger.info(f"Data file '{file_name}' converted to Parquet at {parquet_path}. "
+                    f"Rows: {len(df)}, row group size: {self.config.row_group_size}.")
+        return parquet_path
+
+    def read_data_file(self,
+                       file_name: str = "gsearch_jobs.csv",
+                       columns: Optional[List[str]] = None,
+                       filters: Optional[list] = None,
+                       use_parquet: bool = True) -> pd.DataFrame:
         """
         Read the specified jobs data file into a pandas DataFrame, defaulting to 'gsearch_jobs.csv'.
 
+        If a Parquet dataset produced by `convert_to_parquet` exists it is read instead of the CSV,
+        which allows column projection and row-group filtering. The CSV is used as a fallback.
+        Either way the columns declared in the schema are returned in their schema types.
+
         Args:
         - file_name (str, optional): The name of the file to be read. Defaults to "gsearch_jobs.csv".
+        - columns (List[str], optional): Only read these columns, e.g. ['job_id', 'description'].
+        - filters (list, optional): fastparquet filters such as [('salary_standardized', '>', 50000)].
+          They skip whole row groups whose statistics cannot match, so rows in the remaining
+          row groups are not filtered individually. Ignored for the CSV fallback.
+        - use_parquet (bool, optional): Set to False to always read the CSV. Defaults to True.
 
         Returns:
         - df (pd.DataFrame): DataFrame containing the jobs data.
@@ -55,6 +129,17 @@ class DataIngestion:
         Raises:
         - FileNotFoundError: If the specified data file does not exist in the artifact directory.
         """
+        parquet_path = self.get_parquet_path(file_name)
+
+        if use_parquet and parquet_path.exists():
+            with trace("data_ingestion.read_parquet") as span:
+                df = fastparquet.ParquetFile(str(parquet_path)).to_pandas(columns=columns, filters=filters or [])
+                df = self.loader.apply_types(df)
+                span.rows = len(df)
+            self.loader.log_memory_report(df)
+            logger.info(f"Parquet dataset '{parquet_path}' read into DataFrame. Shape: {df.shape}.")
+            return df
+
         # Construct the path to the data file in the artifact directory
         artifact_data_path = Path(self.config.root_dir) / file_name
         
@@ -62,37 +147,104 @@ class DataIngestion:
         if not artifact_data_path.exists():
             logger.error(f"Artifact data file not found at {artifact_data_path}.")
             raise FileNotFoundError(f"No file found at {artifact_data_path}")
-        
-        # Read the data file into a pandas DataFrame
-        df = pd.read_csv(artifact_data_path)
+
+        if filters:
+            logger.warning("Row-group filters are only supported for Parquet datasets; reading the full CSV.")
+
+        # Read the data file into a pandas DataFrame, typed at parse time
+        with trace("data_ingestion.read_csv") as span:
+            df = self.loader.read_csv(artifact_data_path, columns=columns)
+            span.rows = len(df)
         
         logger.info(f"Data file '{file_name}' read into DataFrame. Shape: {df.shape}.")
         return df
 
-    def transfer_data(self) -> None:
+    def get_manifest_path(self) -> Path:
+        """
+        Return the location of the ingestion manifest inside the artifact directory.
+
+        Returns:
+        - Path: Path to 'manifest.json' in the data ingestion root directory.
+        """
+        return Path(self.config.root_dir) / "manifest.json"
+
+    def _load_manifest(self) -> dict:
+        """
+        Load the manifest written by the previous transfer, if any.
+
+        Returns:
+        - dict: The recorded source 'path', 'sha256', 'size' and 'mtime', or an empty dict.
+        """
+        manifest_path = self.get_manifest_path()
+        if not manifest_path.exists():
+            return {}
+        try:
+            return dict(load_json(manifest_path))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable manifest at {manifest_path}: {e}")
+            return {}
+
+    def transfer_data(self) -> bool:
         """
         Transfer the data from the local directory to the project's artifact directory.
 
         This method ensures that the artifact directory exists, and then transfers 
-        the data file to this directory.
+        the data file to this directory. A manifest with the content hash, size and 
+        mtime of the source is kept next to the artifact; when the source is unchanged 
+        the transfer is skipped. The file is only hashed when its size or mtime differ 
+        from the manifest. When a transfer is needed, reflinks, hardlinks (if allowed) 
+        or os.sendfile are used before falling back to a regular copy.
+
+        Returns:
+        - bool: True if the data file was transferred, False if the artifact was up to date.
 
         Raises:
         - FileNotFoundError: If the local data file does not exist.
         """
         root_dir = Path(self.config.root_dir)
         local_data_path = Path(self.config.local_data_file)
+        artifact_data_path = root_dir / local_data_path.name
         
         # Check if the local data file exists
         if not local_data_path.exists():
             logger.error(f"Local data file not found at {local_data_path}.")
             raise FileNotFoundError(f"No file found at {local_data_path}")
 
-        # Get the file size using the utility function
-        file_size = get_size(local_data_path)
-
         # Ensure the transfer directory exists
         os.makedirs(root_dir, exist_ok=True)
 
+        stat = local_data_path.stat()
+        manifest = self._load_manifest()
+        artifact_present = artifact_data_path.exists() and artifact_data_path.stat().st_size == stat.st_size
+        same_source = manifest.get("path") == str(local_data_path) and manifest.get("size") == stat.st_size
+
+        # Cheap check first: same size and mtime means the content has not been rewritten
+        if artifact_present and same_source and manifest.get("mtime") == stat.st_mtime:
+            logger.info(f"Data at {local_data_path} is unchanged since the last transfer. Skipping copy. Data moved: ~ 0 KB.")
+            return False
+
+        file_hash = get_file_hash(local_data_path)
+        new_manifest = {
+            "path": str(local_data_path),
+            "sha256": file_hash,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+
+        # The mtime changed but the content did not (e.g. the file was touched)
+        if artifact_present and same_source and manifest.get("sha256") == file_hash:
+            save_json(self.get_manifest_path(), new_manifest)
+            logger.info(f"Data at {local_data_path} has a new mtime but identical content. Skipping copy. Data moved: ~ 0 KB.")
+            return False
+
         # Transfer the file
-        shutil.copy2(local_data_path, root_dir)
-        logger.info(f"Data transferred from {local_data_path} to {root_dir}. File size: {file_size}.")
\ No newline at end of file
+        with trace("data_ingestion.transfer") as span:
+            strategy = transfer_file(local_data_path, artifact_data_path, allow_hardlinks=self.config.allow_hardlinks)
+            span.args["strategy"] = strategy
+        save_json(self.get_manifest_path(), new_manifest)
+
+        # Reflinks and hardlinks share blocks with the source, so no data is actually written
+        moved = get_size(artifact_data_path) if strategy in ("sendfile", "copy") else "~ 0 KB"
+        logger.info(f"Data transferred from {local_data_path} to {root_dir} via {strategy}. "
+                    f"File size: {get_size(artifact_data_path)}. Data moved: {moved}.")
+        return True
@@ -0,0 +1,194 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict
+
+from src.career_chief import logger
+
+
+class DataQualityEngine:
+    """
+    Evaluates the row-level data quality rules declared under `rules` for each column
+    in the schema. Every rule is computed with vectorized pandas/NumPy column operations.
+
+    Supported rules:
+    - max_null_rate (float): Highest allowed fraction of missing values.
+    - min / max (float): Inclusive numeric bounds; non-numeric values count as violations.
+    - pattern (str): Regular expression every non-null value must fully match.
+    - unique (bool): Non-null values must not repeat.
+    - min_length / max_length (int): Bounds on the number of characters.
+    - allowed_values (List[str]): The only values a non-null entry may take.
+    - max_violation_rate (float): Fraction of rows allowed to break each of the rules
+      above except max_null_rate before the rule fails. Defaults to 0.
+
+    The engine can be fed the whole DataFrame at once or chunk by chunk. Uniqueness
+    is resolved across chunks when the report is built, from the 64-bit hashes of the
+    values collected while updating (8 bytes per row).
+
+    Attributes:
+    - schema (Dict[str, Dict]): Column definitions from the schema.
+    - sample_size (int): Maximum number of offending row indices kept per rule.
+    """
+
+    sample_size = 10
+
+    def __init__(self, schema: Dict[str, Dict]):
+        """
+        Initialize the DataQualityEngine.
+
+        Args:
+        - schema (Dict[str, Dict]): Column definitions, each optionally containing a `rules` mapping.
+        """
+        self.schema = schema
+        self.rules = []
+        for column, definition in schema.items():
+            column_rules = dict(definition.get('rules', {}) or {})
+            tolerance = column_rules.pop('max_violation_rate', 0.0)
+            for rule, value in column_rules.items():
+                self.rules.append({
+                    'column': column,
+                    'rule': rule,
+                    'value': value,
+                    'tolerance': value if rule == 'max_null_rate' else tolerance,
+                    'violations': 0,
+                    'sample_rows': [],
+                })
+        self.total_rows = 0
+        self._unique_hashes = {}
+
+    def _violations(self, series: pd.Series, rule: str, value) -> pd.Series:
+        """
+        Compute the boolean mask of rows violating a single rule.
+
+        Args:
+        - series (pd.Series): The column values.
+        - rule (str): The rule name.
+        - value: The rule parameter.
+
+        Returns:
+        - pd.Series: True for every offending row.
+        """
+        not_null = series.notna()
+
+        if rule == 'max_null_rate':
+            return ~not_null
+
+        if rule in ('min', 'max'):
+            numeric = pd.to_numeric(series, errors='coerce')
+            out_of_range = numeric < value if rule == 'min' else numeric > value
+            return not_null & (numeric.isna() | out_of_range)
+
+        if rule == 'pattern':
+            matches = series.astype('string').str.fullmatch(value)
+            return not_null & ~matches.fillna(False).astype(bool)
+
+        if rule in ('min_length', 'max_length'):
+            lengths = series.astype('string').str.len()
+            bad_length = lengths < value if rule == 'min_length' else lengths > value
+            return not_null & bad_length.fillna(False).astype(bool)
+
+        if rule == 'allowed_values':
+            return not_null & ~series.isin(list(value))
+
+        raise ValueError(f"Unknown data quality rule '{rule}' for column '{series.name}'.")
+
+    def update(self, df: pd.DataFrame):
+        """
+        Evaluate all rules on a batch of rows and accumulate the results.
+
+        Args:
+        - df (pd.DataFrame): The batch to evaluate. Its index is reported as the row index.
+        """
+        self.total_rows += len(df)
+        for rule in self.rules:
+            if rule['column'] not in df.columns:
+                continue
+
+            if rule['rule'] == 'unique':
+                if rule['value']:
+                    self._collect_hashes(df[rule['column']])
+                continue
+
+            mask = self._violations(df[rule['column']], rule['rule'], rule['value'])
+            count = int(mask.sum())
+            rule['violations'] += count
+
+            missing_samples = self.sample_size - len(rule['sample_rows'])
+            if count and missing_samples > 0:
+                rule['sample_rows'].extend(df.index[mask.to_numpy()][:missing_samples].tolist())
+
+    def _collect_hashes(self, series: pd.Series):
+        """
+        Store the hashes and row indices of the non-null values of a column checked for uniqueness.
+
+        Args:
+        - series (pd.Series): The column values.
+        """
+        not_null = series.notna().to_numpy()
+        hashes = pd.util.hash_pandas_object(series[not_null], index=False).to_numpy()
+        self._unique_hashes.setdefault(series.name, []).append((hashes, series.index[not_null]))
+
+    def _resolve_unique(self, rule: dict):
+        """
+        Count the repeated values of a column across all batches seen so far.
+
+        Args:
+        - rule (dict): The 'unique' rule to update.
+        """
+        batches = self._unique_hashes.get(rule['column'], [])
+        if not batches:
+            return
+        hashes = np.concatenate([batch_hashes for batch_hashes, _ in batches])
+        duplicated = pd.Series(hashes).duplicated().to_numpy()
+        rule['violations'] = int(duplicated.sum())
+        rows = np.concatenate([np.asarray(batch_index) for _, batch_index in batches])
+        rule['sample_rows'] = rows[duplicated][:self.sample_size].tolist()
+
+    def report(self) -> dict:
+        """
+        Build the data quality report.
+
+        Returns:
+        - dict: The total row count, the overall status and, per rule, the number and
+          rate of violations, whether it passed and sample offending row indices.
+        """
+        rules = []
+        for rule in self.rules:
+            if rule['rule'] == 'unique':
+                self._resolve_unique(rule)
+            rate = rule['violations'] / self.total_rows if self.total_rows else 0.0
+            rules.append({
+                'column': rule['column'],
+                'rule': rule['rule'],
+                'value': rule['value'],
+                'violations': rule['violations'],
+                'violation_rate': rate,
+                'passed': rate <= rule['tolerance'],
+                'sample_rows': [int(row) if isinstance(row, (int, np.integer)) else str(row) for row in rule['sample_rows']],
+            })
+        return {
+            'rows': self.total_rows,
+            'passed': all(rule['passed'] for rule in rules),
+            'rules': rules,
+        }
+
+    def save_report(self, path: Path) -> dict:
+        """
+        Write the data quality report as JSON.
+
+        Args:
+        - path (Path): Destination of the report.
+
+        Returns:
+        - dict: The report that was written.
+        """
+        report = self.report()
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=4, default=str)
+
+        failed = [f"{rule['column']}.{rule['rule']}" for rule in report['rules'] if not rule['passed']]
+        if failed:
+            logger.warning(f"Data quality rules failed: {', '.join(failed)}")
+        logger.info(f"Data quality report for {report['rows']} rows saved to {path}.")
+        return report
@@ -0,0 +1,126 @@
+import hashlib
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.career_chief import logger
+from src.career_chief.utils.dataset_io import DatasetWriter, FORMAT_EXTENSIONS
+
+
+class HashSplitter:
+    """
+    Assigns rows to train/val/test from a stable hash of a key column.
+
+    Each key is hashed with BLAKE2b into a number in [0, 1): keys below `test_size`
+    go to test, keys below `test_size + val_size` to val and the rest to train. The
+    assignment depends only on the key, so reruns reproduce the same splits, new
+    postings land in a split without moving existing ones, and rows sharing a key
+    always end up in the same split. Growing `val_size` only moves rows from train
+    to val; the test set is untouched.
+
+    Attributes:
+    - SPLITS (tuple): Split names, in the order of the codes returned by `assign`.
+    - key (str): Column whose values are hashed.
+    - val_size (float): Fraction of keys assigned to validation.
+    - test_size (float): Fraction of keys assigned to testing.
+    - salt (str): Mixed into the hash; changing it draws a new, equally stable split.
+    """
+
+    SPLITS = ("train", "val", "test")
+
+    def __init__(self, val_size: float = 0.1, test_size: float = 0.2, key: str = "job_id", salt: str = ""):
+        """
+        Initialize the HashSplitter.
+
+        Args:
+        - val_size (float, optional): Fraction of keys assigned to validation. Defaults to 0.1.
+        - test_size (float, optional): Fraction of keys assigned to testing. Defaults to 0.2.
+        - key (str, optional): Column whose values are hashed. Defaults to 'job_id'.
+        - salt (str, optional): Mixed into the hash, at most 64 bytes. Defaults to ''.
+
+        Raises:
+        - ValueError: If the fractions are negative or leave nothing for training, or the salt is too long.
+        """
+        if val_size < 0 or test_size < 0 or val_size + test_size >= 1:
+            raise ValueError(f"Invalid split sizes: val_size={val_size}, test_size={test_size}.")
+        if len(salt.encode()) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(f"The split salt is longer than {hashlib.blake2b.MAX_KEY_SIZE} bytes.")
+        self.key = key
+        self.val_size = val_size
+        self.test_size = test_size
+        self.salt = salt
+
+    def _hash(self, value: str) -> int:
+        digest = hashlib.blake2b(value.encode(), digest_size=8, key=self.salt.encode()).digest()
+        return int.from_bytes(digest, "big")
+
+    def assign(self, keys: pd.Series) -> np.ndarray:
+        """
+        Compute the split of every key.
+
+        Args:
+        - keys (pd.Series): The key values. Missing keys are assigned to train.
+
+        Returns:
+        - np.ndarray: Index into SPLITS of every key, int8.
+        """
+        missing = keys.isna().to_numpy()
+        hashes = np.fromiter((0 if is_missing else self._hash(str(value))
+                              for value, is_missing in zip(keys.to_numpy(dtype=object), missing)),
+                             dtype=np.uint64, count=len(keys))
+        fractions = hashes / float(1 << 64)
+
+        codes = np.zeros(len(keys), dtype=np.int8)
+        codes[fractions < self.test_size + self.val_size] = 1
+        codes[fractions < self.test_size] = 2
+        codes[missing] = 0
+        if missing.any():
+            logger.warning(f"{int(missing.sum())} rows without '{self.key}' assigned to the training set.")
+        return codes
+
+    def write(self, chunks: Iterable[pd.DataFrame], output_dir: Path, file_format: str = "csv",
+              schema: Optional[pa.Schema] = None) -> Dict[str, int]:
+        """
+        Stream chunks of rows into '<split>_data.<format>' files, one per split.
+
+        The files are replaced. Only one chunk is held at a time, so a CSV read with
+        `chunksize` can be split without loading it whole.
+
+        Args:
+        - chunks (Iterable[pd.DataFrame]): The rows, with the key column, in chunks of any size.
+        - output_dir (Path): Directory of the split files.
+        - file_format (str, optional): 'csv', 'parquet' or 'arrow'. Defaults to 'csv'.
+        - schema (pa.Schema, optional): Column types of Parquet and Arrow files. Inferred
+          from the first chunk if not given.
+
+        Returns:
+        - Dict[str, int]: Number of rows written to every split.
+
+        Raises:
+        - ValueError: If the format is not supported.
+        """
+        if file_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Unsupported dataset format '{file_format}'; use one of {sorted(FORMAT_EXTENSIONS)}.")
+        extension = FORMAT_EXTENSIONS[file_format]
+
+        with ExitStack() as stack:
+            writers = {split: stack.enter_context(DatasetWriter(Path(output_dir) / f"{split}_data{extension}", schema))
+                       for split in self.SPLITS}
+            first_chunk = None
+            for chunk in chunks:
+                first_chunk = chunk if first_chunk is None else first_chunk
+                codes = self.assign(chunk[self.key])
+                for code, split in enumerate(self.SPLITS):
+                    writers[split].write(chunk[codes == code])
+            # Splits that got no rows still get a file with the columns
+            for writer in writers.values():
+                writer.close(empty=first_chunk)
+
+        counts = {split: writer.rows for split, writer in writers.items()}
+        logger.info(f"Rows split on a hash of '{self.key}' into {output_dir}: "
+                    + ", ".join(f"{split} {count}" for split, count in counts.items()))
+        return counts
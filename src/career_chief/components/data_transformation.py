@@ -0,0 +1,330 @@
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pathlib import Path
+from functools import partial
+
+from src.career_chief import logger
+from src.career_chief.entity.config_entity import DataTransformationConfig
+from src.career_chief.components.term_normalizer import load_normalizer
+from src.career_chief.components.text_processing import ParallelTextProcessor, remove_noise
+from src.career_chief.components.data_splitter import HashSplitter
+from src.career_chief.utils.dataset_io import DatasetWriter, dataset_format, infer_schema, read_dataset
+from src.career_chief.utils.inference_cache import InferenceCache
+from src.career_chief.utils.model_pool import SharedModelPool
+from src.career_chief.utils.tracing import trace
+from src.career_chief.utils.ragged import RaggedArray
+
+
+# Hugging Face model used for tokenization and NER
+NER_MODEL_NAME = "dslim/bert-large-NER"
+
+# Number of NER batches sent to a worker process at a time
+_BATCHES_PER_TASK = 8
+
+# Rows written to the split files at a time
+_SPLIT_CHUNK_ROWS = 10_000
+
+# Arrow types of the nested columns in Parquet and Arrow outputs. NER results keep the
+# fields of the Hugging Face token classification pipeline
+COLUMN_TYPES = {
+    "tokens": pa.list_(pa.int32()),
+    "ner_results": pa.list_(pa.struct([
+        ("entity", pa.string()),
+        ("score", pa.float32()),
+        ("index", pa.int32()),
+        ("word", pa.string()),
+        ("start", pa.int32()),
+        ("end", pa.int32()),
+    ])),
+}
+
+def _load_ner_pipeline(model_name: str):
+    """
+    Load the NER pipeline in a worker process that cannot share the parent's.
+
+    Args:
+    - model_name (str): Hugging Face model to load.
+    """
+    from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForTokenClassification.from_pretrained(model_name)
+    return pipeline("ner", model=model, tokenizer=tokenizer)
+
+
+def _run_ner(nlp_pipeline, texts: list, batch_size: int) -> list:
+    """Run a worker's NER pipeline on texts sorted by length."""
+    return nlp_pipeline(texts, batch_size=batch_size)
+
+
+def _to_json(output: list) -> list:
+    """Turn the numpy scalars of a NER pipeline output, such as the scores, into Python numbers."""
+    return [{key: value.item() if isinstance(value, np.generic) else value for key, value in entity.items()}
+            for entity in output]
+
+
+class DataTransformation:
+    """
+    Preprocesses technical job description data for NLP tasks, including noise removal,
+    technical term normalization, tokenization and named entity recognition (NER), and
+    writes the result into training, validation and testing sets.
+
+    Attributes:
+    - config (DataTransformationConfig): Configuration settings for data transformation.
+    - normalizer (TermNormalizer): Compiled matcher of the normalization dictionary.
+    - df (pd.DataFrame): The data being transformed.
+    """
+
+    def __init__(self, config: DataTransformationConfig):
+        """
+        Initializes the DataTransformation class with configuration settings.
+
+        Args:
+        - config (DataTransformationConfig): Configuration settings for data transformation.
+        """
+        # Imported here because loading the transformer libraries is slow
+        from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+
+        self.config = config
+        self.tokenizer = AutoTokenizer.from_pretrained(NER_MODEL_NAME)  # Hugging Face tokenizer
+        self.model = AutoModelForTokenClassification.from_pretrained(NER_MODEL_NAME)  # NER model
+        self.nlp_pipeline = pipeline("ner", model=self.model, tokenizer=self.tokenizer)  # NER pipeline
+        self.normalizer = self._load_normalizer()  # Compiled normalization dictionary
+        self.token_lengths = None  # Token count of every row, set by _tokenize_text
+        self.df = self._load_data()  # Load dataset
+        logger.info("DataTransformation initialized with provided configuration.")
+
+    def _load_data(self) -> pd.DataFrame:
+        """Loads data from the specified CSV or Parquet dataset."""
+        try:
+            df = read_dataset(self.config.data_source_file)
+            logger.info("Data loaded successfully from {}".format(self.config.data_source_file))
+            return df
+        except Exception as e:
+            logger.error("Failed to load data from {}: {}".format(self.config.data_source_file, e))
+            raise
+
+    def _load_normalizer(self):
+        """Loads the normalization dictionary and compiles it into a single-pass normalizer."""
+        try:
+            normalizer = load_normalizer(self.config.normalization_dict)
+            logger.info("Normalization dictionary loaded successfully.")
+            return normalizer
+        except Exception as e:
+            logger.error("Failed to load normalization dictionary: {}".format(e))
+            raise
+
+    def preprocess_and_transform(self):
+        """Executes the full preprocessing and transformation pipeline."""
+        logger.info("Starting preprocessing and transformation pipeline.")
+        self._remove_noise()
+        self._normalize_technical_terms()
+        self._tokenize_text()
+        self._apply_ner()
+        logger.info("Preprocessing and transformation pipeline completed.")
+
+    def _text_processor(self, *functions) -> ParallelTextProcessor:
+        """Creates a processor applying the functions to the texts on `text_workers` processes."""
+        return ParallelTextProcessor(functions,
+                                     workers=self.config.text_workers,
+                                     chunk_size=self.config.text_chunk_size)
+
+    def _remove_noise(self):
+        """Removes noise such as special characters from the text descriptions."""
+        with trace("data_transformation.remove_noise", rows=len(self.df)):
+            self.df['cleaned_text'] = self._text_processor(remove_noise).map(self.df['description'])
+        logger.info("Noise removed from text.")
+
+    def _normalize_technical_terms(self):
+        """
+        Normalizes technical terms using the provided normalization dictionary.
+
+        Every document is scanned once by the compiled normalizer, whatever the size
+        of the dictionary.
+        """
+        with trace("data_transformation.normalize_terms", rows=len(self.df)):
+            self.df['cleaned_text'] = self._text_processor(self.normalizer.normalize).map(self.df['cleaned_text'])
+        logger.info("Technical terms normalized.")
+
+    def _tokenize_text(self):
+        """
+        Tokenizes the cleaned text with automatic truncation to the maximum sequence length.
+
+        With a positive `tokenize_batch_size` the fast tokenizer receives whole batches of
+        texts. If `tokens_dir` is configured, the token ids are saved there as a ragged
+        int32 array and each row gets the index of its ids in a 'token_row' column;
+        otherwise they are stored as lists in a 'tokens' column.
+        """
+        from tqdm.auto import tqdm
+
+        max_token_length = self.config.max_token_length
+        batch_size = self.config.tokenize_batch_size
+
+        if batch_size <= 0:
+            tqdm.pandas(desc="Tokenizing Text")
+            with trace("data_transformation.tokenize", rows=len(self.df)):
+                self.df['tokens'] = self.df['cleaned_text'].progress_apply(
+                    lambda x: self.tokenizer(x, truncation=True, max_length=max_token_length)['input_ids'])
+            self.token_lengths = self.df['tokens'].map(len).to_numpy()
+            logger.info("Text tokenized with automatic truncation to max length.")
+            return
+
+        texts = self.df['cleaned_text'].tolist()
+        batches = []
+        with trace("data_transformation.tokenize", rows=len(texts)):
+            for start in tqdm(range(0, len(texts), batch_size), desc="Tokenizing Text"):
+                encoded = self.tokenizer(texts[start:start + batch_size],
+                                         truncation=True,
+                                         max_length=max_token_length,
+                                         return_attention_mask=False,
+                                         return_token_type_ids=False)
+                batches.append(RaggedArray.from_sequences(encoded['input_ids']))
+            tokens = RaggedArray.concatenate(batches)
+        self.token_lengths = tokens.lengths
+
+        if self.config.tokens_dir:
+            prefix = Path(self.config.tokens_dir) / "input_ids"
+            tokens.save(prefix)
+            self.df['token_row'] = np.arange(len(tokens), dtype=np.int64)
+            logger.info(f"{len(tokens.values)} token ids of {len(tokens)} texts saved to {prefix}.values.npy/.offsets.npy.")
+        else:
+            self.df['tokens'] = tokens.to_lists()
+        logger.info(f"Text tokenized in batches of {batch_size} with automatic truncation to max length.")
+
+    def _apply_ner(self):
+        """
+        Applies named entity recognition (NER) to identify entities within the text.
+
+        With a positive `ner_batch_size` the texts are sorted by token length and run in
+        batches of similar length, so little compute is spent on padding. With more than
+        one `ner_workers` the batches are spread over worker processes forked from this
+        one, which share its copy of the model. The results are put back in row order and have the same format as the
+        row-by-row pipeline calls.
+
+        With a `ner_cache_path`, the outputs are cached on disk per text and model
+        revision, and only texts that were not seen before are run through the model.
+        """
+        from tqdm.auto import tqdm
+
+        texts = self.df['cleaned_text'].tolist()
+        results = [None] * len(texts)
+        pending = np.arange(len(texts))
+
+        cache = self._ner_cache()
+        if cache is not None:
+            hits = cache.contains(texts)
+            cached = np.flatnonzero(hits)
+            for position, output in zip(cached, cache.get([texts[i] for i in cached])):
+                results[position] = output
+            # An entry evicted since the lookup, e.g. by another run sharing the cache, comes
+            # back as None and is recomputed
+            pending = np.flatnonzero([result is None for result in results])
+            logger.info(f"{len(texts) - len(pending)} of {len(texts)} texts found in the NER cache.")
+
+        batch_size = self.config.ner_batch_size
+        with trace("data_transformation.ner", rows=len(pending)):
+            if batch_size <= 0:
+                for position in tqdm(pending, desc="Applying NER"):
+                    results[position] = self.nlp_pipeline(texts[position])
+            else:
+                self._apply_ner_batched(texts, pending, results)
+
+        # Fresh outputs get the plain Python types of cached ones, whatever the cache state
+        for position in pending:
+            results[position] = _to_json(results[position])
+
+        if cache is not None:
+            cache.put([texts[i] for i in pending], [results[i] for i in pending])
+            cache.close()
+
+        self.df['ner_results'] = results
+        if batch_size <= 0:
+            logger.info("NER applied to text.")
+        else:
+            logger.info(f"NER applied to text in length-sorted batches of {batch_size} "
+                        f"using {max(1, self.config.ner_workers)} process(es).")
+
+    def _apply_ner_batched(self, texts: list, pending: np.ndarray, results: list):
+        """
+        Runs NER on the texts at the `pending` positions in length-sorted batches and
+        stores the outputs at the same positions of `results`.
+        """
+        from tqdm.auto import tqdm
+
+        batch_size = self.config.ner_batch_size
+        lengths = self.token_lengths if self.token_lengths is not None else self.df['cleaned_text'].str.len().to_numpy()
+        order = pending[np.argsort(np.asarray(lengths)[pending], kind="stable")]
+
+        # Consecutive slices of the sorted order; each holds a few batches of similar length
+        task_size = batch_size * _BATCHES_PER_TASK
+        tasks = [order[start:start + task_size] for start in range(0, len(order), task_size)]
+
+        if self.config.ner_workers <= 1:
+            for positions in tqdm(tasks, desc="Applying NER"):
+                outputs = self.nlp_pipeline([texts[i] for i in positions], batch_size=batch_size)
+                for position, output in zip(positions, outputs):
+                    results[position] = output
+        else:
+            # The workers are forked from this process and share its copy of the model
+            with SharedModelPool(partial(_load_ner_pipeline, NER_MODEL_NAME), self.config.ner_workers,
+                                 model=self.nlp_pipeline, name=NER_MODEL_NAME) as pool:
+                outputs = pool.imap(_run_ner, (([texts[i] for i in positions], batch_size) for positions in tasks))
+                for positions, task_outputs in tqdm(zip(tasks, outputs), total=len(tasks), desc="Applying NER"):
+                    for position, output in zip(positions, task_outputs):
+                        results[position] = output
+
+    def _ner_cache(self):
+        """
+        Opens the cache of NER outputs, keyed by the model name and the revision it was
+        loaded from, or returns None if no `ner_cache_path` is configured.
+        """
+        if not self.config.ner_cache_path:
+            return None
+        revision = getattr(self.model.config, "_commit_hash", None) or ""
+        max_mb = self.config.ner_cache_max_mb
+        return InferenceCache(self.config.ner_cache_path, f"{NER_MODEL_NAME}@{revision}",
+                              max_bytes=int(max_mb * 1e6) if max_mb else None)
+
+    def save_splits(self) -> dict:
+        """
+        Writes the transformed data into train_data, val_data and test_data files in the
+        configured `output_format`.
+
+        Every row is assigned to a split from a hash of its `split_key`, so reruns give
+        the same splits and new postings do not move existing ones. The rows are streamed
+        into the three files in chunks. Parquet and Arrow files store the token ids and
+        NER results as typed nested columns, so they are read back without parsing.
+
+        Returns:
+        - dict: Number of rows in every split, keyed by 'train', 'val' and 'test'.
+        """
+        splitter = HashSplitter(val_size=self.config.val_size,
+                                test_size=self.config.test_size,
+                                key=self.config.split_key,
+                                salt=self.config.split_salt)
+        chunks = (self.df.iloc[start:start + _SPLIT_CHUNK_ROWS] for start in range(0, len(self.df), _SPLIT_CHUNK_ROWS))
+        schema = None
+        if self.config.output_format != "csv":
+            schema = infer_schema(self.df, COLUMN_TYPES)
+        with trace("data_transformation.split", rows=len(self.df)):
+            return splitter.write(chunks, self.config.root_dir, self.config.output_format, schema)
+
+    def save_data(self, dataset: pd.DataFrame, filename: str):
+        """
+        Saves a processed dataset in the transformation directory.
+
+        Args:
+        - dataset (pd.DataFrame): The dataset to save.
+        - filename (str): The filename for the saved dataset; its extension ('.csv',
+          '.parquet' or '.arrow') selects the format.
+        """
+        filepath = os.path.join(self.config.root_dir, filename)
+        try:
+            schema = None if dataset_format(filepath) == "csv" else infer_schema(dataset, COLUMN_TYPES)
+            with DatasetWriter(filepath, schema) as writer:
+                writer.write(dataset)
+            logger.info("Dataset saved to {}".format(filepath))
+        except Exception as e:
+            logger.error("Failed to save dataset to {}: {}".format(filepath, e))
@@ -1,6 +1,8 @@
-import pandas as pd
 from src.career_chief import logger
 from src.career_chief.entity.config_entity import DataValidationConfig
+from src.career_chief.components.data_quality import DataQualityEngine
+from src.career_chief.utils.schema_loader import SchemaLoader
+from src.career_chief.utils.tracing import trace
 
 
 class DataValidation:
@@ -11,6 +13,7 @@ class DataValidation:
 
     Attributes:
     - df (pd.DataFrame): The data to be validated.
+    - loader (SchemaLoader): Reads the data with the column types declared in the schema.
     """
 
     # Define optional and required columns for validation
@@ -22,7 +25,8 @@ class DataValidation:
         Initializes the DataValidation class.
         
         Depending on the presence of a file_object, it either loads data from the provided 
-        file object or from the specified file in the configuration.
+        file object or from the specified file in the configuration. In streaming mode 
+        nothing is loaded up front; the data is read chunk by chunk when the validations run.
 
         Args:
         - config (DataValidationConfig): Configuration settings for data validation.
@@ -30,26 +34,19 @@ class DataValidation:
         """
         logger.info("Initializing DataValidation.")
         self.config = config
+        self.file_object = file_object
+        self.df = None
+        self.quality_engine = None
+        self.loader = SchemaLoader(self.config.schema)
         try:
-            if file_object:
-                self.df = pd.read_csv(file_object)
+            if self.config.streaming:
+                logger.info(f"Streaming mode enabled. Data will be validated in chunks of {self.config.chunk_size} rows.")
             else:
-                self.df = pd.read_csv(self.config.data_source_file, dtype={
-                    'title': 'string',
-                    'company_name': 'string',
-                    'location': 'string',
-                    'via': 'category',
-                    'description': 'object',
-                    'job_id': 'string',
-                    'salary_standardized': 'float'
-                }, parse_dates=['date_time'])
-
-                # List of columns to keep (based on your schema)
-                schema_columns = ['title', 'company_name', 'location', 'via', 'description', 'job_id', 'salary_standardized']
-                
-                # Drop columns not in the schema
-                self.df = self.df[schema_columns]
-                
+                # Only the schema columns are parsed, already in their declared types
+                with trace("data_validation.read") as span:
+                    self.df = self.loader.read_csv(self._source(), columns=self.loader.columns)
+                    span.rows = len(self.df)
+
         except FileNotFoundError:
             logger.error(f"File not found: {self.config.data_source_file}")
             raise
@@ -101,7 +98,7 @@ class DataValidation:
         expected_data_types = {col: self.config.schema[col]['type'] for col in self.config.schema if col in self.df.columns}
 
         for column, dtype in expected_data_types.items():
-            if not pd.api.types.is_dtype_equal(self.df[column].dtype, dtype):
+            if not self.loader.dtype_matches(column, self.df[column].dtype):
                 validation_status = False
                 logger.warning(f"Data type mismatch for column '{column}': Expected {dtype} but got {self.df[column].dtype}")
 
@@ -128,17 +125,89 @@ class DataValidation:
             logger.error(f"Error writing to status file: {e}")
             raise
 
+    def _source(self):
+        """Return the file object if one was given, otherwise the configured data source file."""
+        return self.file_object if self.file_object else self.config.data_source_file
+
+    def _iter_chunks(self):
+        """
+        Reads the data source in fixed-size chunks, parsing only the schema columns.
+
+        Only one chunk is held in memory at a time, so peak memory is bounded by 
+        the chunk size rather than by the size of the file.
+
+        Yields:
+        - pd.DataFrame: The next chunk of the dataset.
+        """
+        yield from self.loader.read_csv(self._source(), columns=self.loader.columns, chunksize=self.config.chunk_size)
+
+    def validate_data_quality(self) -> bool:
+        """
+        Writes the JSON data quality report built from the rules declared in the schema.
+
+        In eager mode the whole dataframe is evaluated here; in streaming mode the 
+        chunks have already been fed to the engine while they were read.
+
+        Returns:
+        - bool: True if every data quality rule passed, False otherwise.
+        """
+        logger.info("Starting data quality validation.")
+        if self.df is not None:
+            with trace("data_validation.quality_rules", rows=len(self.df)):
+                self.quality_engine.update(self.df)
+        report = self.quality_engine.save_report(self.config.quality_report_file)
+        return report['passed']
+
+    def run_streaming_validations(self) -> tuple:
+        """
+        Runs the feature and data type validations chunk by chunk and merges 
+        the per-chunk results into a single status.
+
+        Returns:
+        - tuple: (feature_validation_status, data_type_validation_status). Each status 
+          is True only if it held for every chunk.
+        """
+        logger.info("Running streaming data validations.")
+        feature_validation_status = True
+        data_type_validation_status = True
+        total_rows = 0
+
+        with trace("data_validation.streaming") as span:
+            for chunk_number, chunk in enumerate(self._iter_chunks(), start=1):
+                self.df = chunk
+                feature_validation_status &= self.validate_all_features()
+                data_type_validation_status &= self.validate_data_types()
+                if self.quality_engine is not None:
+                    with trace("data_validation.quality_rules", rows=len(chunk)):
+                        self.quality_engine.update(chunk)
+                total_rows += len(chunk)
+                logger.info(f"Validated chunk {chunk_number} ({total_rows} rows so far).")
+            span.rows = total_rows
+
+        # Release the last chunk so it is not kept alive after validation
+        self.df = None
+        logger.info(f"Streaming validation finished. Rows validated: {total_rows}.")
+        return feature_validation_status, data_type_validation_status
+
     def run_all_validations(self) -> bool:
         """
         Executes all data validations and logs the overall status. 
-        It encompasses both feature existence and data type checks.
+        It encompasses feature existence and data type checks, plus the row-level 
+        data quality rules when a quality report file is configured.
         """
         logger.info("Running all data validations.")
-        feature_validation_status = self.validate_all_features()
-        data_type_validation_status = self.validate_data_types()
+        self.quality_engine = DataQualityEngine(self.config.schema) if self.config.quality_report_file else None
+
+        if self.config.streaming:
+            feature_validation_status, data_type_validation_status = self.run_streaming_validations()
+        else:
+            feature_validation_status = self.validate_all_features()
+            data_type_validation_status = self.validate_data_types()
+
+        quality_validation_status = self.validate_data_quality() if self.quality_engine is not None else True
 
         overall_status = "Overall Validation Status: "
-        if feature_validation_status and data_type_validation_status:
+        if feature_validation_status and data_type_validation_status and quality_validation_status:
             overall_status += "All validations passed."
             logger.info(overall_status)
         else:
@@ -146,4 +215,4 @@ class DataValidation:
             logger.error(overall_status)
         
         self._write_status_to_file(overall_status)
-        return feature_validation_status and data_type_validation_status
\ No newline at end of file
+        return feature_validation_status and data_type_validation_status and quality_validation_status
\ No newline at end of file
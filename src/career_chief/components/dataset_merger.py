@@ -0,0 +1,178 @@
+import os
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.career_chief import logger
+from src.career_chief.utils.dataset_io import DatasetWriter, iter_dataset, read_dataset
+from src.career_chief.utils.tracing import trace
+
+
+def _normalize_keys(keys: pd.Series) -> pd.Series:
+    """Compare ids as strings, so '123' read from one file matches 123 read from another."""
+    return keys.astype(object).where(keys.isna(), keys.astype(str))
+
+
+class JobIndex:
+    """
+    A hash index from job_id to the rows of a DataFrame, built once and probed with
+    many batches of keys.
+
+    The distinct ids are kept in a pandas Index, whose hash table is built on the first
+    lookup and reused afterwards. The rows of every id are stored contiguously, so a
+    batch of keys expands to its matching rows with a few vectorized operations.
+
+    Attributes:
+    - key (str): The key column.
+    - frame (pd.DataFrame): The indexed rows, numbered from 0.
+    - ids (pd.Index): The distinct ids.
+    - order (np.ndarray): Row numbers of the frame, grouped by id.
+    - starts (np.ndarray): Start of every id's group in `order`, followed by the number of grouped rows.
+    """
+
+    def __init__(self, df: pd.DataFrame, key: str = "job_id"):
+        """
+        Build the index.
+
+        Args:
+        - df (pd.DataFrame): The rows to index. Rows without a key are never matched.
+        - key (str, optional): The key column. Defaults to 'job_id'.
+        """
+        self.key = key
+        self.frame = df.reset_index(drop=True)
+        codes, uniques = pd.factorize(_normalize_keys(self.frame[key]))
+
+        self.ids = pd.Index(uniques)
+        self.order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[self.order]
+        self.order = self.order[sorted_codes >= 0]  # rows without a key
+        self.starts = np.searchsorted(sorted_codes[sorted_codes >= 0], np.arange(len(uniques) + 1))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def lookup(self, keys: pd.Series, keep_unmatched: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the indexed rows matching a batch of keys.
+
+        Args:
+        - keys (pd.Series): The keys to look up.
+        - keep_unmatched (bool): Keep keys without a match, paired with row -1, as in a
+          left join, instead of dropping them.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Positions in `keys` and matching row numbers of
+          the frame, one pair per output row, in the order of `keys`.
+        """
+        groups = self.ids.get_indexer(_normalize_keys(keys))
+        found = groups >= 0
+        counts = np.where(found, self.starts[groups + 1] - self.starts[groups], 0)
+        if keep_unmatched:
+            counts = np.maximum(counts, 1)
+
+        positions = np.repeat(np.arange(len(keys)), counts)
+        group_starts = np.repeat(np.where(found, self.starts[groups], -1), counts)
+        within = np.arange(len(positions)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        rows = np.full(len(positions), -1)
+        matched = group_starts >= 0
+        rows[matched] = self.order[group_starts[matched] + within[matched]]
+        return positions, rows
+
+
+def _combine(left: pd.DataFrame, right: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    Put matched left and right rows side by side, with the columns of `pd.merge`: the
+    left columns, then the right ones except the key, '_x'/'_y' suffixes on clashes.
+    """
+    right = right.drop(columns=[key])
+    common = set(left.columns) & set(right.columns)
+    left = left.rename(columns={name: f"{name}_x" for name in common}).reset_index(drop=True)
+    right = right.rename(columns={name: f"{name}_y" for name in common}).reset_index(drop=True)
+    return pd.concat([left, right], axis=1)
+
+
+class DatasetMerger:
+    """
+    Left-joins the original job postings with the entities extracted from them on 'job_id'.
+
+    The smaller of the two files is loaded into a JobIndex once; the larger one is read
+    in chunks that are joined against the index and appended to the output file, so
+    memory is bounded by the index and one chunk rather than by both files. The result
+    has the rows and columns of `pd.merge(original, entities, on='job_id', how='left')`,
+    except that rows without a job_id are not matched, and that postings without
+    entities come last when the original postings are the indexed side.
+
+    Attributes:
+        dataset_path (str): Path to the original dataset file (CSV, Parquet or Arrow).
+        extracted_entities_path (str): Path to the extracted entities file.
+        output_path (str): Path for the merged dataset; its extension selects the format.
+        chunk_size (int): Number of rows of the larger file joined at a time.
+    """
+
+    def __init__(self, dataset_path, extracted_entities_path, output_path, chunk_size=50_000):
+        """
+        Initializes DatasetMerger with file paths for datasets and output.
+        """
+        self.dataset_path = dataset_path
+        self.extracted_entities_path = extracted_entities_path
+        self.output_path = output_path
+        self.chunk_size = max(1, chunk_size)
+
+    def merge(self) -> int:
+        """
+        Merges the datasets and writes the result to the output path.
+
+        Returns:
+            int: Number of rows written.
+        """
+        index_original = os.path.getsize(self.dataset_path) < os.path.getsize(self.extracted_entities_path)
+        with trace("dataset_merger.merge") as span, DatasetWriter(Path(self.output_path)) as writer:
+            if index_original:
+                self._stream_entities(writer)
+            else:
+                self._stream_original(writer)
+            span.rows = writer.rows
+
+        logger.info(f"Merged dataset with {writer.rows} rows saved to {self.output_path}.")
+        return writer.rows
+
+    def _stream_original(self, writer: DatasetWriter):
+        """Index the extracted entities and stream the original postings through the index."""
+        from tqdm.auto import tqdm
+
+        logger.info(f"Indexing extracted entities from {self.extracted_entities_path}.")
+        index = JobIndex(read_dataset(self.extracted_entities_path))
+
+        for chunk in tqdm(iter_dataset(self.dataset_path, self.chunk_size), desc="Merging datasets"):
+            positions, rows = index.lookup(chunk[index.key], keep_unmatched=True)
+            # Row -1 is not a label of the frame, so unmatched postings get missing entities
+            writer.write(_combine(chunk.iloc[positions], index.frame.reindex(rows), index.key))
+
+    def _stream_entities(self, writer: DatasetWriter):
+        """
+        Index the original postings and stream the extracted entities through the index.
+
+        Matches are written per chunk of entities; postings without entities are written
+        at the end.
+        """
+        from tqdm.auto import tqdm
+
+        logger.info(f"Indexing original dataset from {self.dataset_path}.")
+        index = JobIndex(read_dataset(self.dataset_path))
+        matched = np.zeros(len(index), dtype=bool)
+        empty = None
+
+        for chunk in tqdm(iter_dataset(self.extracted_entities_path, self.chunk_size), desc="Merging datasets"):
+            positions, rows = index.lookup(chunk[index.key], keep_unmatched=False)
+            matched[rows] = True
+            empty = chunk.iloc[:0]
+            writer.write(_combine(index.frame.take(rows), chunk.iloc[positions], index.key))
+
+        unmatched = np.flatnonzero(~matched)
+        if empty is None:
+            writer.write(index.frame)
+        else:
+            writer.write(_combine(index.frame.take(unmatched), empty.reindex(range(len(unmatched))), index.key))
@@ -0,0 +1,268 @@
+import time
+from pathlib import Path
+from functools import partial
+from itertools import islice
+from collections import defaultdict
+from contextlib import nullcontext
+
+import pandas as pd
+import pyarrow as pa
+
+from src.career_chief import logger
+from src.career_chief.utils.dataset_io import DatasetWriter, dataset_format, read_dataset
+from src.career_chief.utils.inference_cache import InferenceCache, model_fingerprint
+from src.career_chief.utils.model_pool import SharedModelPool
+from src.career_chief.utils.tracing import trace
+
+
+# Arrow type of the 'entities' column in Parquet and Arrow outputs
+ENTITIES_TYPE = pa.list_(pa.struct([("text", pa.string()), ("label", pa.string())]))
+
+# Descriptions whose cached entities are fetched at a time
+_CACHE_BLOCK = 10_000
+
+# nlp.pipe batches sent to a worker process at a time
+_BATCHES_PER_TASK = 4
+
+
+def load_ner_model(model_path):
+    """
+    Loads a spaCy pipeline with every pipe except 'ner' disabled, apart from shared
+    embedding layers such as 'tok2vec' that the 'ner' pipe listens to and cannot run without.
+    """
+    import spacy
+
+    nlp = spacy.load(model_path)
+    needed = {"ner"} | {name for name, pipe in nlp.pipeline
+                        if "ner" in getattr(pipe, "listening_components", [])}
+    disabled = [name for name in nlp.pipe_names if name not in needed]
+    if disabled:
+        nlp.select_pipes(disable=disabled)
+        logger.info(f"Disabled pipes not needed for NER: {', '.join(disabled)}.")
+    return nlp
+
+
+def _pipe_entities(nlp, texts: list, batch_size: int) -> list:
+    """Run a worker's pipeline on texts and return the (text, label) entities of each."""
+    return [[(ent.text, ent.label_) for ent in doc.ents] for doc in nlp.pipe(texts, batch_size=batch_size)]
+
+
+class EntityExtractorFromJobDescriptions:
+    """
+    A class for extracting entities from job descriptions using a fine-tuned NER model.
+
+    With a positive `batch_size` the descriptions are streamed through `nlp.pipe` with
+    only the 'ner' pipe (and the components it listens to) enabled, optionally on
+    `n_process` worker processes forked after the model is loaded, which share its
+    weights instead of each loading a copy, and the aggregated entities are written to the output
+    file every `chunk_size` jobs instead of being collected in memory. A `batch_size`
+    of 0 keeps the former one-document-at-a-time loop.
+
+    With a `cache_path`, the entities of every description are cached on disk under the
+    fingerprint of the model, and only descriptions that were not seen by the same model
+    are run through `nlp.pipe`.
+
+    Attributes:
+        model_path (str): Path to the fine-tuned NER model.
+        data_path (str): Path to the input dataset (CSV, Parquet or Arrow) containing job descriptions.
+        output_path (str): Path where the extracted entities file will be saved.
+        batch_size (int): Number of documents per `nlp.pipe` batch; 0 processes one document at a time.
+        n_process (int): Number of processes running `nlp.pipe`.
+        chunk_size (int): Number of jobs written to the output file at a time.
+        cache_path (str): SQLite file caching the entities of every description, or None.
+        cache_max_mb (float): Size above which the least recently used cache entries are evicted, or None.
+    """
+
+    def __init__(self, model_path, data_path, output_path, batch_size=64, n_process=1, chunk_size=1000,
+                 cache_path=None, cache_max_mb=None):
+        """
+        Initializes the EntityExtractorFromJobDescriptions with specified model, data, and output paths.
+
+        Parameters:
+            model_path (str): Path to the fine-tuned NER model.
+            data_path (str): Path to the input dataset.
+            output_path (str): Path for the output file with extracted entities; its extension
+                ('.csv', '.parquet' or '.arrow') selects the format.
+            batch_size (int, optional): Documents per `nlp.pipe` batch. Defaults to 64.
+            n_process (int, optional): Processes running `nlp.pipe`. Defaults to 1.
+            chunk_size (int, optional): Jobs written to the output file at a time. Defaults to 1000.
+            cache_path (str, optional): SQLite file caching the extracted entities. Defaults to None (no cache).
+            cache_max_mb (float, optional): Maximum size of the cached entities in MB. Defaults to None (unbounded).
+        """
+        self.model_path = model_path
+        self.data_path = data_path
+        self.output_path = output_path
+        self.batch_size = batch_size
+        self.n_process = max(1, n_process)
+        self.chunk_size = max(1, chunk_size)
+        self.cache_path = cache_path
+        self.cache_max_mb = cache_max_mb
+
+    def load_model(self):
+        """
+        Loads the fine-tuned NER model from the specified path, with only the pipes
+        needed for NER enabled.
+        """
+        logger.info("Loading the fine-tuned NER model.")
+        return load_ner_model(self.model_path)
+
+    def load_data(self):
+        """Loads the job ids and cleaned descriptions of the dataset."""
+        logger.info(f"Loading data from {self.data_path}.")
+        return read_dataset(self.data_path, columns=['job_id', 'cleaned_text'])
+
+    def extract_and_save_entities(self):
+        """
+        Extracts entities from job descriptions using the NER model and aggregates all entities per job
+        into a single record, then saves the results to the output file.
+        """
+        nlp = self.load_model()
+        data = self.load_data()
+
+        # Convert all entries in the 'cleaned_text' column to strings to prevent type-related errors.
+        data['cleaned_text'] = data['cleaned_text'].fillna('').astype(str)
+
+        if self.batch_size <= 0:
+            self._extract_one_by_one(nlp, data)
+        else:
+            self._extract_batched(nlp, data)
+
+    def _extract_one_by_one(self, nlp, data):
+        """Runs the model on one description at a time and saves all results at the end."""
+        from tqdm import tqdm
+
+        # Use a defaultdict to aggregate entities by job_id
+        results = defaultdict(list)
+
+        logger.info("Starting entity extraction from job descriptions.")
+        start = time.perf_counter()
+
+        # Process each job description in the dataset.
+        for index, row in tqdm(data.iterrows(), total=data.shape[0], desc="Extracting entities"):
+            doc = nlp(row['cleaned_text'])
+            entities = [(ent.text, ent.label_) for ent in doc.ents]
+            job_id = row['job_id']
+
+            # Append all entities to the job_id key in the defaultdict
+            results[job_id].extend(entities)
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"Extracted entities from {len(data)} documents in {elapsed:.1f}s "
+                    f"({len(data) / max(elapsed, 1e-9):.1f} docs/s).")
+
+        # Convert defaultdict to a DataFrame
+        results_df = pd.DataFrame([(job_id, ents) for job_id, ents in results.items()], columns=['job_id', 'entities'])
+
+        with self._writer() as writer:
+            writer.write(results_df)
+        logger.info(f"Extracted entities saved successfully to {self.output_path}.")
+
+    def _writer(self) -> DatasetWriter:
+        schema = None
+        if dataset_format(self.output_path) != "csv":
+            schema = pa.schema([("job_id", pa.large_string()), ("entities", ENTITIES_TYPE)])
+        return DatasetWriter(Path(self.output_path), schema)
+
+    def _extract_batched(self, nlp, data):
+        """
+        Streams the descriptions through `nlp.pipe` and writes the entities of every
+        `chunk_size` jobs as soon as they are complete.
+        """
+        from tqdm import tqdm
+
+        # Rows of the same job are made consecutive, with jobs in order of first appearance,
+        # so a job's entities are complete as soon as the next job starts
+        codes, _ = pd.factorize(data['job_id'])
+        data = data.iloc[codes.argsort(kind="stable")]
+        job_ids = data['job_id'].tolist()
+        texts = data['cleaned_text'].tolist()
+
+        logger.info(f"Starting entity extraction from {len(texts)} job descriptions "
+                    f"(batch size {self.batch_size}, {self.n_process} process(es)).")
+
+        cache = None
+        if self.cache_path:
+            cache = InferenceCache(Path(self.cache_path), model_fingerprint(self.model_path),
+                                   max_bytes=int(self.cache_max_mb * 1e6) if self.cache_max_mb else None)
+
+        rows, current_job, current_entities = [], None, None
+        processed, start = 0, time.perf_counter()
+        with trace("entity_extraction.pipe", rows=len(texts)), self._writer() as writer, cache or nullcontext():
+            entities = self._entities(nlp, texts, cache)
+            for job_id, doc_entities in tqdm(zip(job_ids, entities), total=len(texts), desc="Extracting entities"):
+                if job_id != current_job or current_entities is None:
+                    if current_entities is not None:
+                        rows.append((current_job, current_entities))
+                    current_job, current_entities = job_id, []
+                    if len(rows) >= self.chunk_size:
+                        writer.write(pd.DataFrame(rows, columns=['job_id', 'entities']))
+                        rows = []
+                        elapsed = time.perf_counter() - start
+                        logger.info(f"{processed} documents processed, {processed / max(elapsed, 1e-9):.1f} docs/s.")
+                current_entities.extend(doc_entities)
+                processed += 1
+            # zip stops without resuming the generator; closing it shuts down its worker pool
+            entities.close()
+
+            if current_entities is not None:
+                rows.append((current_job, current_entities))
+            writer.write(pd.DataFrame(rows, columns=['job_id', 'entities']))
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"Extracted entities from {processed} documents in {elapsed:.1f}s "
+                    f"({processed / max(elapsed, 1e-9):.1f} docs/s) and saved them to {self.output_path}.")
+
+    def _entities(self, nlp, texts, cache):
+        """
+        Yields the (text, label) entities of every description, in order.
+
+        Without a cache every description goes through `nlp.pipe`. With one, the cached
+        descriptions are looked up first and only the others are streamed through
+        `nlp.pipe`; the entities of every block of descriptions are added to the cache
+        before the block is yielded.
+        """
+        if cache is None:
+            yield from self._run_model(nlp, iter(texts))
+            return
+
+        hits = cache.contains(texts)
+        logger.info(f"{int(hits.sum())} of {len(texts)} descriptions found in the entity cache.")
+        extracted = self._run_model(nlp, (text for text, hit in zip(texts, hits) if not hit))
+
+        for start in range(0, len(texts), _CACHE_BLOCK):
+            block, block_hits = texts[start:start + _CACHE_BLOCK], hits[start:start + _CACHE_BLOCK]
+            cached = iter(cache.get([text for text, hit in zip(block, block_hits) if hit]))
+            entities = [next(cached) if hit else next(extracted) for hit in block_hits]
+            # An entry evicted since the lookup, e.g. by another run sharing the cache, comes
+            # back as None; those few descriptions are run here, outside the stream
+            evicted = [i for i, hit in enumerate(block_hits) if hit and entities[i] is None]
+            if evicted:
+                for i, text_entities in zip(evicted, _pipe_entities(nlp, [block[i] for i in evicted], len(evicted))):
+                    entities[i] = text_entities
+            computed = sorted(set(evicted) | {i for i, hit in enumerate(block_hits) if not hit})
+            cache.put([block[i] for i in computed], [entities[i] for i in computed])
+            yield from ([tuple(entity) for entity in block_entities] for block_entities in entities)
+
+    def _run_model(self, nlp, texts):
+        """
+        Yields the (text, label) entities of every text of an iterator, in order.
+
+        With more than one process, tasks of a few batches are run by a SharedModelPool
+        whose workers share the already loaded model.
+        """
+        if self.n_process == 1:
+            for doc in nlp.pipe(texts, batch_size=self.batch_size):
+                yield [(ent.text, ent.label_) for ent in doc.ents]
+            return
+
+        def tasks():
+            while True:
+                chunk = list(islice(texts, self.batch_size * _BATCHES_PER_TASK))
+                if not chunk:
+                    return
+                yield chunk, self.batch_size
+
+        with SharedModelPool(partial(load_ner_model, self.model_path), self.n_process, model=nlp,
+                             name=str(self.model_path)) as pool:
+            for entities in pool.imap(_pipe_entities, tasks()):
+                yield from entities
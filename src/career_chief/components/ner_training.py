@@ -0,0 +1,320 @@
+import os
+import sys
+import time
+import random
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.career_chief import logger
+from src.career_chief.components.annotation_conversion import iter_docs
+
+
+# Name under which TrainingMetricsLogger is registered with spaCy
+METRICS_LOGGER = "career_chief.TrainingMetricsLogger.v1"
+
+
+def length_bucketed_batches(lengths: np.ndarray, words_per_batch: int, bucket_size: int = 256,
+                            rng: Optional[random.Random] = None) -> List[np.ndarray]:
+    """
+    Group documents into batches of a bounded number of padded words.
+
+    The documents are shuffled and cut into buckets of `bucket_size`; every bucket is
+    sorted by length and split into batches whose size times longest document stays
+    within `words_per_batch`, so batches of long documents hold few of them and batches
+    of short documents many, with little padding. A document longer than the budget
+    forms a batch of its own. The batches are returned in random order.
+
+    Args:
+    - lengths (np.ndarray): Number of words of every document.
+    - words_per_batch (int): Maximum padded words per batch.
+    - bucket_size (int, optional): Documents sorted together. Defaults to 256.
+    - rng (random.Random, optional): Random generator for the shuffles.
+
+    Returns:
+    - List[np.ndarray]: Document indices of every batch.
+    """
+    rng = rng or random.Random()
+    lengths = np.asarray(lengths)
+    order = np.arange(len(lengths))
+    rng.shuffle(order)
+
+    batches = []
+    for start in range(0, len(order), max(1, bucket_size)):
+        bucket = order[start:start + bucket_size]
+        bucket = bucket[np.argsort(lengths[bucket], kind="stable")]
+        batch_start = 0
+        for position in range(1, len(bucket) + 1):
+            # Sorted ascending, so the longest document of a batch is its last one
+            if position == len(bucket) or (position + 1 - batch_start) * lengths[bucket[position]] > words_per_batch:
+                batches.append(bucket[batch_start:position])
+                batch_start = position
+    rng.shuffle(batches)
+    return batches
+
+
+def train_ner(nlp, train_docs: list, dev_docs: list, training: dict, target_f1: Optional[float] = None) -> List[dict]:
+    """
+    Train the 'ner' pipe of a pipeline on annotated Docs.
+
+    With a positive `batch_words` the training documents are batched by word count with
+    `length_bucketed_batches`; otherwise they are shuffled into batches of `batch_size`
+    documents. After every epoch the model is scored on `eval_docs` development documents
+    (all of them if 0), a fixed sample drawn once. Training stops after `patience` epochs
+    without a better F1 score, after `max_epochs`, or once `target_f1` is reached, and the
+    weights of the best epoch are restored.
+
+    Args:
+    - nlp (Language): Pipeline with a 'ner' pipe.
+    - train_docs (list): Annotated training Docs.
+    - dev_docs (list): Annotated development Docs.
+    - training (dict): The 'training' settings of the spacy_ner configuration.
+    - target_f1 (float, optional): Stop once the evaluation F1 score reaches this value.
+
+    Returns:
+    - List[dict]: Loss, scores, words, words/sec and elapsed time of every epoch.
+    """
+    from spacy.training import Example
+    from spacy.util import minibatch
+    from tqdm import tqdm
+
+    rng = random.Random(training.get("seed", 0))
+    batch_words = training.get("batch_words", 0)
+    eval_docs = training.get("eval_docs", 0)
+    patience = training.get("patience", 0)
+    dropout = training.get("dropout", 0.3)
+
+    train_examples = [Example(nlp.make_doc(doc.text), doc) for doc in train_docs]
+    dev_examples = [Example(nlp.make_doc(doc.text), doc) for doc in dev_docs]
+    if 0 < eval_docs < len(dev_examples):
+        dev_examples = rng.sample(dev_examples, eval_docs)
+    lengths = np.array([len(example.reference) for example in train_examples])
+
+    optimizer = nlp.initialize(lambda: train_examples)
+    if "learn_rate" in training.get("optimizer", {}):
+        optimizer.learn_rate = training["optimizer"]["learn_rate"]
+
+    metrics, best_f1, best_weights, since_best = [], -1.0, None, 0
+    start = time.perf_counter()
+    for epoch in tqdm(range(training.get("max_epochs", 20)), desc="Training Epochs"):
+        if batch_words > 0:
+            batches = [[train_examples[i] for i in batch]
+                       for batch in length_bucketed_batches(lengths, batch_words, training.get("bucket_size", 256), rng)]
+        else:
+            rng.shuffle(train_examples)
+            batches = minibatch(train_examples, size=training.get("batch_size", 128))
+
+        losses, words, epoch_start = {}, 0, time.perf_counter()
+        for batch in tqdm(batches, leave=False, desc=f"Epoch {epoch}"):
+            nlp.update(batch, drop=dropout, sgd=optimizer, losses=losses)
+            words += sum(len(example.reference) for example in batch)
+        train_seconds = time.perf_counter() - epoch_start
+
+        scores = nlp.evaluate(dev_examples)
+        f1 = scores['ents_f'] or 0.0
+        metrics.append({
+            'epoch': epoch,
+            'loss': losses.get('ner', 0.0),
+            'precision': scores['ents_p'],
+            'recall': scores['ents_r'],
+            'f1': f1,
+            'words': words,
+            'words_per_sec': words / max(train_seconds, 1e-9),
+            'elapsed_seconds': time.perf_counter() - start,
+        })
+        logger.info(f"Epoch {epoch} - Loss: {losses.get('ner', 0.0):.2f}, Precision: {scores['ents_p']}, "
+                    f"Recall: {scores['ents_r']}, F1: {f1}, {metrics[-1]['words_per_sec']:.0f} words/s")
+
+        if f1 > best_f1:
+            best_f1, best_weights, since_best = f1, nlp.to_bytes(), 0
+        else:
+            since_best += 1
+        if target_f1 is not None and f1 >= target_f1:
+            logger.info(f"Target F1 {target_f1} reached after {epoch + 1} epochs.")
+            break
+        if patience and since_best >= patience:
+            logger.info(f"No F1 improvement for {patience} epochs; stopping after epoch {epoch}.")
+            break
+
+    if best_weights is not None:
+        nlp.from_bytes(best_weights)
+    return metrics
+
+
+def training_metrics_logger(output_file: str):
+    """
+    spaCy training logger that prints spaCy's usual progress table and writes every
+    evaluation to a CSV file, with the training words per second since the previous one.
+    """
+    from spacy.util import registry
+
+    console = registry.loggers.get("spacy.ConsoleLogger.v1")(progress_bar=False)
+
+    def setup(nlp, stdout=sys.stdout, stderr=sys.stderr):
+        console_step, console_finalize = console(nlp, stdout, stderr)
+        rows = []
+        previous = {"words": 0, "time": time.perf_counter()}
+
+        def log_step(info):
+            console_step(info)
+            if info is None:
+                return
+            now = time.perf_counter()
+            words_per_sec = (info["words"] - previous["words"]) / max(now - previous["time"], 1e-9)
+            previous.update(words=info["words"], time=now)
+            scores = info["other_scores"]
+            rows.append({
+                "Epoch": info["epoch"],
+                "Step": info["step"],
+                "Loss Tok2Vec": info["losses"].get("tok2vec", 0.0),
+                "Loss NER": info["losses"].get("ner", 0.0),
+                "ENTS_F": 100 * (scores.get("ents_f") or 0.0),
+                "ENTS_P": 100 * (scores.get("ents_p") or 0.0),
+                "ENTS_R": 100 * (scores.get("ents_r") or 0.0),
+                "Score": 100 * info["score"],
+                "Words/s": words_per_sec,
+            })
+
+        def finalize():
+            console_finalize()
+            os.makedirs(Path(output_file).parent, exist_ok=True)
+            pd.DataFrame(rows).to_csv(output_file, index=False)
+
+        return log_step, finalize
+
+    return setup
+
+
+def _register_metrics_logger():
+    from spacy.util import registry
+
+    registry.loggers.register(METRICS_LOGGER, func=training_metrics_logger)
+
+
+class SpacyCustomNERModel:
+    """
+    Trains the NER models on the converted Label Studio annotations: a custom model from
+    a blank English pipeline, and a fine-tuned version of the pretrained pipeline.
+
+    Both can train on CPU with word-count batches of similar-length documents
+    (`training.batch_words`), report their training words per second in the metrics
+    files, and stop early after `training.patience` evaluations without improvement.
+    Evaluations use a fixed sample of `training.eval_docs` development documents.
+
+    Attributes:
+        config (SpacyNERConfig): Paths and training settings.
+        training (dict): The training settings.
+    """
+
+    def __init__(self, config):
+        """
+        Initializes the SpacyCustomNERModel with necessary configurations.
+
+        Parameters:
+        - config (SpacyNERConfig): A configuration object with paths and settings for NER processing.
+        """
+        self.config = config
+        self.training = config.training or {}
+
+    def _use_gpu(self) -> bool:
+        return bool(self.config.gpu_allocator) and self.training.get("device", "gpu") != "cpu"
+
+    def get_labels(self, docs):
+        """
+        Extracts unique entity labels from the provided spaCy documents.
+
+        Args:
+            docs (list of spacy.Doc): List of spaCy Doc objects containing annotations.
+
+        Returns:
+            set: A set containing unique entity labels.
+        """
+        labels = set()
+        for doc in docs:
+            for ent in doc.ents:
+                labels.add(ent.label_)
+        return labels
+
+    def train_ner_model(self) -> List[dict]:
+        """
+        Trains a NER model from a blank English pipeline with `train_ner`, and saves the
+        model of the best epoch along with the metrics of every epoch.
+
+        Returns:
+            List[dict]: The metrics of every epoch.
+        """
+        import spacy
+
+        if self._use_gpu():
+            spacy.require_gpu()
+        nlp = spacy.blank("en")
+        ner = nlp.add_pipe('ner')
+
+        train_docs = list(iter_docs(self.config.spacy_train, nlp.vocab))
+        dev_docs = list(iter_docs(self.config.spacy_dev, nlp.vocab))
+        for label in self.get_labels(train_docs + dev_docs):
+            ner.add_label(label)
+
+        logger.info(f"Starting NER model training on {len(train_docs)} documents...")
+        training_metrics = train_ner(nlp, train_docs, dev_docs, self.training)
+
+        model_save_path = self.config.custom_model_dir
+        nlp.to_disk(model_save_path)
+        logger.info(f"Trained model saved to {model_save_path}")
+
+        metrics_save_path = self.config.training_metrics_path_custom
+        os.makedirs(Path(metrics_save_path).parent, exist_ok=True)
+        pd.DataFrame(training_metrics).to_csv(metrics_save_path, index=False)
+        logger.info(f"Training metrics saved to {metrics_save_path}")
+        return training_metrics
+
+    def finetune_pretrained_ner_model(self):
+        """
+        Fine-tunes the pretrained NER model with spaCy's training loop.
+
+        The pretrained config.cfg is written to `finetuned_model_dir` with the training
+        settings applied: batches of similar-length documents bounded by
+        `batch_words` padded words, evaluation every `eval_frequency` steps on the first
+        `eval_docs` development documents, and `patience` evaluations without improvement
+        before stopping. Every evaluation is written to `training_metrics_path_finetuned`.
+        """
+        from spacy.cli.train import train
+        from spacy.util import load_config
+
+        _register_metrics_logger()
+
+        model_dir = Path(self.config.pretrained_model_dir)
+        output_dir = Path(self.config.finetuned_model_dir or model_dir / "finetuned_model")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        config = load_config(model_dir / "config.cfg")
+        settings = config["training"]
+        if self.training.get("batch_words", 0) > 0:
+            settings["batcher"] = {
+                "@batchers": "spacy.batch_by_padded.v1",
+                "size": self.training["batch_words"],
+                "buffer": self.training.get("bucket_size", 256),
+                "discard_oversize": False,
+            }
+        if "max_epochs" in self.training:
+            settings["max_epochs"] = self.training["max_epochs"]
+        if "eval_frequency" in self.training:
+            settings["eval_frequency"] = self.training["eval_frequency"]
+        if "patience" in self.training:
+            # spaCy counts patience in steps
+            settings["patience"] = self.training["patience"] * settings["eval_frequency"]
+        if self.training.get("eval_docs", 0) > 0:
+            config["corpora"]["dev"]["limit"] = self.training["eval_docs"]
+        settings["logger"] = {"@loggers": METRICS_LOGGER,
+                              "output_file": str(self.config.training_metrics_path_finetuned)}
+
+        config_path = output_dir / "config.cfg"
+        config.to_disk(config_path)
+
+        logger.info(f"Fine-tuning {model_dir} with {config_path}.")
+        train(config_path, output_dir, use_gpu=0 if self._use_gpu() else -1,
+              overrides={"paths.train": str(self.config.spacy_train), "paths.dev": str(self.config.spacy_dev)})
+        logger.info(f"Training completed successfully. Training metrics saved to: "
+                    f"{self.config.training_metrics_path_finetuned}")
@@ -0,0 +1,402 @@
+import os
+import re
+from pathlib import Path
+from functools import partial
+from contextlib import nullcontext
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.career_chief import logger
+from src.career_chief.utils.dataset_io import DatasetWriter, FORMAT_EXTENSIONS, infer_schema, read_dataset
+from src.career_chief.utils.model_pool import SharedModelPool
+from src.career_chief.utils.tracing import trace
+
+
+# Sentence boundaries: end punctuation followed by whitespace, or line breaks. Cleaned
+# texts keep only letters and whitespace, so their line breaks are the boundaries left
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\s*\n\s*")
+
+# Predictor batches sent to a worker process at a time
+_BATCHES_PER_TASK = 4
+
+# Arrow types of the structured SRL columns of Parquet and Arrow results: the words of
+# a description, its verbs with a BIO tag per word, and its role spans, one per row
+# with the index of their verb in srl_verbs
+SRL_COLUMN_TYPES = {
+    "srl_words": pa.list_(pa.string()),
+    "srl_verbs": pa.list_(pa.struct([
+        ("verb", pa.string()),
+        ("description", pa.string()),
+        ("tags", pa.list_(pa.string())),
+    ])),
+    "srl_roles": pa.list_(pa.struct([
+        ("verb_index", pa.int32()),
+        ("verb", pa.string()),
+        ("role", pa.string()),
+        ("text", pa.string()),
+    ])),
+}
+
+
+def load_srl_predictor(name: str):
+    """
+    Loads an AllenNLP predictor by its pretrained model id or from a model archive.
+
+    Args:
+    - name (str): A pretrained model id such as 'structured-prediction-srl', or a path or
+      URL of a model archive.
+    """
+    if "://" in name or os.path.exists(name):
+        from allennlp.predictors.predictor import Predictor
+
+        return Predictor.from_path(name)
+    from allennlp_models.pretrained import load_predictor
+
+    return load_predictor(name)
+
+
+def split_sentences(text: str, max_words: int) -> List[str]:
+    """
+    Split a text into sentences of at most `max_words` words.
+
+    Sentences end at end punctuation or line breaks; longer runs of words, such as
+    cleaned texts without punctuation, are cut into consecutive windows of `max_words`.
+
+    Args:
+    - text (str): The text.
+    - max_words (int): Maximum number of words per sentence.
+
+    Returns:
+    - List[str]: The sentences, with their words separated by single spaces.
+    """
+    sentences = []
+    for part in _SENTENCE_BOUNDARY.split(text):
+        words = part.split()
+        for start in range(0, len(words), max_words):
+            sentences.append(" ".join(words[start:start + max_words]))
+    return sentences
+
+
+def merge_sentence_outputs(outputs: List[dict]) -> dict:
+    """
+    Combine the predictor outputs of a text's sentences into the output the predictor
+    gives for the whole text: the words of all sentences, and every verb with a tag per
+    word, 'O' outside its own sentence.
+
+    Args:
+    - outputs (List[dict]): Predictor outputs of the sentences, in order.
+
+    Returns:
+    - dict: The combined output with 'words' and 'verbs'.
+    """
+    words = [word for output in outputs for word in output["words"]]
+    verbs, offset = [], 0
+    for output in outputs:
+        after = len(words) - offset - len(output["words"])
+        for verb in output["verbs"]:
+            verbs.append(dict(verb, tags=["O"] * offset + verb["tags"] + ["O"] * after))
+        offset += len(output["words"])
+    return {"words": words, "verbs": verbs}
+
+
+def role_spans(processed_output: dict) -> List[dict]:
+    """
+    Flatten the roles of a processed SRL output into one row per role span.
+
+    Args:
+    - processed_output (dict): An output of `SemanticRoleLabelingComponent.process_output`.
+
+    Returns:
+    - List[dict]: 'verb_index', 'verb', 'role' and 'text' of every span, by verb and role.
+    """
+    return [{"verb_index": verb_index, "verb": verb["verb"], "role": role, "text": text}
+            for verb_index, verb in enumerate(processed_output["verbs"])
+            for role, texts in verb["roles"].items()
+            for text in texts]
+
+
+def verb_role_table(table: pa.Table, key: Optional[str] = "job_id") -> pd.DataFrame:
+    """
+    Flatten the `srl_roles` column of structured SRL results into a verb-role table.
+
+    The list column is flattened in Arrow, so no row is parsed or visited in Python.
+
+    Args:
+    - table (pa.Table): SRL results with `srl_roles`, and `key` if it is to be kept.
+    - key (str, optional): Column identifying the descriptions. Defaults to 'job_id'.
+
+    Returns:
+    - pd.DataFrame: One row per role span: `key`, or 'row' with the row number of the
+      description if `key` is None or not a column, then 'verb_index', 'verb', 'role' and 'text'.
+    """
+    roles = table.column("srl_roles").combine_chunks()
+    spans = pc.list_flatten(roles)
+    rows = pc.list_parent_indices(roles)
+    if key is not None and key in table.column_names:
+        columns = {key: table.column(key).take(rows)}
+    else:
+        columns = {"row": rows}
+    columns.update({name: spans.field(name) for name in ("verb_index", "verb", "role", "text")})
+    return pa.table(columns).to_pandas()
+
+
+def extract_verb_roles(table: pa.Table) -> Tuple[pd.Series, pd.DataFrame, pd.DataFrame]:
+    """
+    Extract the verbs and their semantic roles from structured SRL results.
+
+    Vectorized counterpart of the research notebook's row-by-row `extract_verb_roles`,
+    which parsed every stringified result: the same verbs, role texts and verb-role
+    relationships, as columns instead of lists.
+
+    Args:
+    - table (pa.Table): SRL results with the `srl_verbs` and `srl_roles` columns.
+
+    Returns:
+    - Tuple[pd.Series, pd.DataFrame, pd.DataFrame]: Every verb occurrence; every role
+      span with its 'role' and 'text'; and the 'verb' and 'role' of every role a verb
+      occurrence has, once per occurrence.
+    """
+    verbs = pc.list_flatten(table.column("srl_verbs").combine_chunks()).field("verb").to_pandas()
+    spans = verb_role_table(table, key=None)
+    relationships = spans.drop_duplicates(["row", "verb_index", "role"])[["verb", "role"]].reset_index(drop=True)
+    return verbs, spans[["role", "text"]], relationships
+
+
+def _predict_batches(predictor, batches: List[List[str]]) -> List[dict]:
+    """Run a predictor on batches of sentences and return the outputs of all sentences."""
+    outputs = []
+    for batch in batches:
+        outputs.extend(predictor.predict_batch_json([{"sentence": sentence} for sentence in batch]))
+    return outputs
+
+
+class SemanticRoleLabelingComponent:
+    """
+    A component for semantic role labeling using a pretrained model from AllenNLP.
+    This class provides functionality to predict semantic roles of sentences and process
+    the outputs into a human-readable format, expanded to include detailed categories such as
+    temporal and quantitative expressions, skills, and organizational roles.
+
+    With a positive `batch_size` the descriptions are split into sentences, which are
+    sorted by length and run through the predictor's batch API in batches of similar
+    length, optionally on `workers` processes sharing the loaded predictor. The sentence
+    outputs are merged back per description, in the format of a whole-description
+    prediction. A `batch_size` of 0 keeps predicting whole descriptions one at a time.
+
+    Attributes:
+        config: Configuration object containing paths for data and output.
+        predictor: AllenNLP predictor for semantic role labeling.
+    """
+    def __init__(self, config):
+        """
+        Initializes the Semantic Role Labeling component with necessary configurations and model.
+        Args:
+            config: A configuration object with attributes like predictor_name, data_path and output_path.
+        """
+        self.config = config
+        self.predictor = load_srl_predictor(config.predictor_name)
+        logger.info("Semantic Role Labeling predictor loaded successfully.")
+
+    def predict(self, sentence: str) -> dict:
+        """
+        Predicts the semantic roles of a given sentence.
+        Args:
+            sentence: A string containing the input sentence for semantic role labeling.
+        Returns:
+            A dictionary containing the predicted semantic roles.
+        """
+        return self.predictor.predict(sentence)
+
+    def predict_batched(self, texts: List[str]) -> List[dict]:
+        """
+        Predicts the semantic roles of many texts sentence by sentence, in length-sorted batches.
+        Args:
+            texts: The texts.
+        Returns:
+            The predictor output of every text, merged from its sentences.
+        """
+        from tqdm.auto import tqdm
+
+        batch_size = self.config.batch_size
+        sentences, owners = [], []
+        for index, text in enumerate(texts):
+            text_sentences = split_sentences(text, self.config.max_sentence_words)
+            sentences.extend(text_sentences)
+            owners.extend([index] * len(text_sentences))
+
+        lengths = np.fromiter((sentence.count(" ") + 1 for sentence in sentences), dtype=np.int64, count=len(sentences))
+        order = np.argsort(lengths, kind="stable")
+        task_size = batch_size * _BATCHES_PER_TASK
+        tasks = [order[start:start + task_size] for start in range(0, len(order), task_size)]
+
+        def batches(positions):
+            return [[sentences[i] for i in positions[start:start + batch_size]]
+                    for start in range(0, len(positions), batch_size)]
+
+        logger.info(f"Labeling {len(sentences)} sentences of {len(texts)} texts in batches of {batch_size} "
+                    f"on {self.config.workers} process(es).")
+        pool = None
+        if self.config.workers > 1:
+            # The workers are forked from this process and share its copy of the predictor
+            pool = SharedModelPool(partial(load_srl_predictor, self.config.predictor_name), self.config.workers,
+                                   model=self.predictor, name=self.config.predictor_name)
+
+        outputs = [None] * len(sentences)
+        with trace("semantic_role_labeling.predict", rows=len(sentences)), pool or nullcontext():
+            arguments = ((batches(positions),) for positions in tasks)
+            if pool is not None:
+                results = pool.imap(_predict_batches, arguments)
+            else:
+                results = (_predict_batches(self.predictor, *args) for args in arguments)
+            for positions, task_outputs in tqdm(zip(tasks, results), total=len(tasks), desc="Labeling sentences"):
+                for position, output in zip(positions, task_outputs):
+                    outputs[position] = output
+
+        per_text = [[] for _ in texts]
+        for owner, output in zip(owners, outputs):
+            per_text[owner].append(output)
+        return [merge_sentence_outputs(text_outputs) for text_outputs in per_text]
+
+    def process_output(self, model_output: dict) -> dict:
+        """
+        Processes the raw model output to format it into a readable dictionary structure,
+        categorizing semantic roles into structured categories.
+        Args:
+            model_output: A dictionary output from the semantic role labeling model.
+        Returns:
+            A dictionary with words and their associated roles formatted in a categorized way.
+        """
+        words = model_output["words"]
+        verbs = model_output["verbs"]
+        formatted_output = {
+            "words": words,
+            "verbs": []
+        }
+        for verb in verbs:
+            tags = verb["tags"]
+            roles = self.extract_roles(words, tags)
+            formatted_output["verbs"].append({
+                "verb": verb["verb"],
+                "roles": roles
+            })
+        return formatted_output
+
+    def extract_roles(self, words, tags, verbose=False):
+        """
+        Extracts detailed semantic roles based on BIO tags.
+        Args:
+            words: A list of words from the SRL output.
+            tags: A list of BIO tags corresponding to each word.
+            verbose: Boolean, if True, print the tags as they are processed.
+        Returns:
+            A dictionary categorizing words into detailed semantic roles.
+        """
+        roles = {}
+        current_role = None
+        current_content = []
+
+        for word, tag in zip(words, tags):
+            # Optional printing for debugging
+            if verbose:
+                print(f"Processing word: '{word}' with tag: '{tag}'")
+
+            # Check if the tag is correctly formatted and split safely
+            if '-' in tag:
+                tag_type, role = tag.split('-', 1)  # Split on the first hyphen only
+            else:
+                tag_type, role = 'O', None  # Treat as outside any entity
+
+            if tag_type in ['B', 'I'] and (current_role != role):
+                if current_content:
+                    # Save the current role content
+                    if current_role:  # Ensure there's an existing role to save
+                        roles.setdefault(current_role, []).append(' '.join(current_content))
+                # Start a new role
+                current_role = role
+                current_content = [word]
+            elif tag_type == 'I' and current_role == role:
+                # Continue the same role
+                current_content.append(word)
+            else:
+                # Outside any role or different role starts without a 'B-'
+                if current_content and current_role:
+                    roles.setdefault(current_role, []).append(' '.join(current_content))
+                current_role = None
+                current_content = []
+
+        # Add the last captured role if any
+        if current_content and current_role:
+            roles.setdefault(current_role, []).append(' '.join(current_content))
+
+        return roles
+
+    def structure_outputs(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the SRL result dicts of a DataFrame with the structured SRL columns.
+        Args:
+            df: A DataFrame with the 'srl_results' and 'processed_srl_results' columns.
+        Returns:
+            The DataFrame with the columns of SRL_COLUMN_TYPES instead.
+        """
+        return df.drop(columns=['srl_results', 'processed_srl_results']).assign(
+            srl_words=[output["words"] for output in df['srl_results']],
+            srl_verbs=[[{"verb": verb["verb"], "description": verb.get("description"), "tags": verb["tags"]}
+                        for verb in output["verbs"]] for output in df['srl_results']],
+            srl_roles=[role_spans(output) for output in df['processed_srl_results']],
+        )
+
+    def save_results(self, df: pd.DataFrame) -> Path:
+        """
+        Saves the SRL results in the configured output format.
+
+        CSV files hold the result dicts as strings. Parquet and Arrow files hold them as
+        the nested columns of SRL_COLUMN_TYPES, which readers load without parsing.
+        Args:
+            df: The descriptions with their 'srl_results' and 'processed_srl_results'.
+        Returns:
+            The path of the results file.
+        """
+        file_format = self.config.output_format
+        if file_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Unsupported dataset format '{file_format}'; use one of {sorted(FORMAT_EXTENSIONS)}.")
+        output_file_path = Path(self.config.output_path) / f"srl_results{FORMAT_EXTENSIONS[file_format]}"
+
+        if file_format == "csv":
+            os.makedirs(self.config.output_path, exist_ok=True)
+            df.to_csv(output_file_path, index=False)
+        else:
+            df = self.structure_outputs(df)
+            with DatasetWriter(output_file_path, infer_schema(df, SRL_COLUMN_TYPES)) as writer:
+                writer.write(df)
+        return output_file_path
+
+    def run(self, num_jobs=None):
+        """
+        Processes a dataset to perform semantic role labeling.
+        Args:
+            num_jobs: Optional; number of job descriptions to process. If None, process all data.
+        """
+        logger.info("Reading data from {}".format(self.config.data_path))
+        df = read_dataset(self.config.data_path)
+
+        if num_jobs is not None:
+            df = df.head(num_jobs)
+        texts = df[self.config.text_column].fillna('').astype(str)
+
+        logger.info(f"Starting semantic role labeling for {len(df)} job descriptions.")
+        if self.config.batch_size > 0:
+            df['srl_results'] = self.predict_batched(texts.tolist())
+        else:
+            from tqdm.auto import tqdm
+
+            tqdm.pandas(desc="Processing Semantic Role Labeling")
+            with trace("semantic_role_labeling.predict", rows=len(df)):
+                df['srl_results'] = texts.progress_apply(self.predict)
+        df['processed_srl_results'] = df['srl_results'].apply(self.process_output)
+
+        output_file_path = self.save_results(df)
+        logger.info(f"Results saved to {output_file_path}")
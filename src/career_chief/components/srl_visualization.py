@@ -0,0 +1,121 @@
+import ast
+
+import pandas as pd
+import pyarrow as pa
+
+from src.career_chief import logger
+from src.career_chief.utils.dataset_io import dataset_format, read_table
+from src.career_chief.components.semantic_role_labeling import SRL_COLUMN_TYPES, extract_verb_roles, role_spans
+
+
+class SRLVisualization:
+    """
+    Class to visualize Semantic Role Labeling (SRL) results.
+
+    Parquet and Arrow results are read as their `srl_verbs` and `srl_roles` columns
+    only, and the verbs and roles are counted on the flattened columns. CSV results of
+    the former format are still read, by parsing their `processed_srl_results` strings.
+    """
+
+    def __init__(self, file_path):
+        """Initialize the visualization class with the path to the SRL results file."""
+        self.file_path = file_path
+        self.table = self.load_srl_data()
+
+    def load_srl_data(self):
+        """
+        Loads the verbs and role spans of the SRL results.
+
+        Returns:
+            pa.Table: The `srl_verbs` and `srl_roles` columns.
+        """
+        if dataset_format(self.file_path) != "csv":
+            return read_table(self.file_path, columns=["srl_verbs", "srl_roles"])
+
+        logger.info(f"Parsing the stringified SRL results of {self.file_path}.")
+        processed = [self.safe_load(value) for value in
+                     pd.read_csv(self.file_path, usecols=["processed_srl_results"])["processed_srl_results"]]
+        return pa.table({
+            "srl_verbs": pa.array([[{"verb": verb["verb"]} for verb in output["verbs"]] for output in processed],
+                                  type=SRL_COLUMN_TYPES["srl_verbs"]),
+            "srl_roles": pa.array([role_spans(output) for output in processed], type=SRL_COLUMN_TYPES["srl_roles"]),
+        })
+
+    @staticmethod
+    def safe_load(value):
+        """
+        Parses a stringified processed SRL result of a CSV file.
+
+        Args:
+            value (str): The result dict as written by pandas.
+
+        Returns:
+            dict: The result, or one without verbs if it cannot be parsed.
+        """
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError) as e:
+            logger.warning(f"Failed to parse SRL result: {e}")
+            return {"verbs": []}
+
+    def visualize_top_verbs_and_roles(self, verbs, roles, top=20):
+        """
+        Visualizes the most frequent verbs and the frequency of semantic roles.
+
+        Args:
+            verbs (pd.Series): Every verb occurrence.
+            roles (pd.DataFrame): Every role span, with its 'role'.
+            top (int): Number of verbs shown. Defaults to 20.
+        """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        verb_counts = verbs.value_counts().nlargest(top)
+        plt.figure(figsize=(12, 8))
+        sns.barplot(y=verb_counts.index, x=verb_counts.values, palette='coolwarm')
+        plt.title(f'Top {top} Verbs in Semantic Role Labeling')
+        plt.xlabel('Frequency')
+        plt.ylabel('Verbs')
+        plt.show()
+
+        role_counts = roles['role'].value_counts()
+        plt.figure(figsize=(10, 6))
+        sns.barplot(x=role_counts.values, y=role_counts.index, palette='coolwarm')
+        plt.title('Frequency of Semantic Roles')
+        plt.xlabel('Count')
+        plt.ylabel('Roles')
+        plt.show()
+
+    def visualize_relationships(self, relationships):
+        """
+        Visualizes the relationships between verbs and roles using a network graph.
+
+        Args:
+            relationships (pd.DataFrame): The 'verb' and 'role' of every relationship.
+        """
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        G = nx.Graph()
+        G.add_edges_from(relationships[['verb', 'role']].drop_duplicates().itertuples(index=False))
+        plt.figure(figsize=(12, 8))
+        pos = nx.spring_layout(G, seed=7)
+        nx.draw_networkx_nodes(G, pos, node_size=4000, node_color="lightblue")
+        nx.draw_networkx_edges(G, pos, width=2)
+        nx.draw_networkx_labels(G, pos, font_size=12, font_family="sans-serif")
+        plt.title('Network of Verbs and Their Roles')
+        plt.axis("off")
+        plt.show()
+
+    def run(self):
+        """
+        Executes the extraction and visualization processes for the SRL results.
+        """
+        verbs, roles, relationships = extract_verb_roles(self.table)
+        self.visualize_top_verbs_and_roles(verbs, roles)
+        self.visualize_relationships(relationships)
+
+
+if __name__ == "__main__":
+    srl_vis = SRLVisualization('artifacts/model_training/allennlp-models/output/srl_results.parquet')
+    srl_vis.run()
@@ -0,0 +1,126 @@
+import os
+import re
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.career_chief import logger
+
+
+# Compiled normalizers keyed by dictionary path, invalidated when the file changes
+_normalizer_cache = {}
+
+
+def _trie_to_pattern(node: dict) -> str:
+    """
+    Convert a character trie into an equivalent regular expression.
+
+    Sharing prefixes means the regex engine follows one branch per character instead of
+    trying every term at every position, which keeps matching fast for large dictionaries.
+    An empty key marks the end of a term.
+    """
+    terminal = "" in node
+    single_characters, branches = [], []
+    for character in sorted(key for key in node if key):
+        child = node[character]
+        if list(child) == [""]:
+            single_characters.append(re.escape(character))
+        else:
+            branches.append(re.escape(character) + _trie_to_pattern(child))
+
+    if single_characters:
+        branches.append(single_characters[0] if len(single_characters) == 1 else f"[{''.join(single_characters)}]")
+
+    if len(branches) == 1 and not (terminal and len(branches[0]) > 1):
+        pattern = branches[0]
+    else:
+        pattern = f"(?:{'|'.join(branches)})"
+
+    # Quantifiers are greedy, so the longest term is tried first
+    return f"{pattern}?" if terminal else pattern
+
+
+class TermNormalizer:
+    """
+    Replaces every dictionary term in a text in a single pass.
+
+    All terms are compiled once into one case-insensitive regular expression built from
+    a character trie. A term only matches as a whole word (it is not preceded or followed
+    by a word character), and overlapping terms resolve to the longest match. Terms are
+    matched literally and replacements are not normalized again.
+
+    Attributes:
+    - replacements (Dict[str, str]): Full forms keyed by lower-cased term.
+    - pattern (re.Pattern): The compiled matcher, or None for an empty dictionary.
+    """
+
+    def __init__(self, normalization_dict: Dict[str, str]):
+        """
+        Initialize the TermNormalizer.
+
+        Args:
+        - normalization_dict (Dict[str, str]): Full forms keyed by abbreviation or term.
+          Terms are case-insensitive; the first spelling of a term wins.
+        """
+        self.replacements = {}
+        for term, full_form in normalization_dict.items():
+            if term:
+                self.replacements.setdefault(term.lower(), full_form)
+
+        trie = {}
+        for term in self.replacements:
+            node = trie
+            for character in term:
+                node = node.setdefault(character, {})
+            node[""] = {}
+
+        self.pattern = re.compile(rf"(?<!\w){_trie_to_pattern(trie)}(?!\w)", re.IGNORECASE) if trie else None
+
+    def _replace(self, match: re.Match) -> str:
+        term = match.group(0)
+        return self.replacements.get(term.lower(), term)
+
+    def normalize(self, text: str) -> str:
+        """
+        Replace all dictionary terms in a text.
+
+        Args:
+        - text (str): The text to normalize.
+
+        Returns:
+        - str: The normalized text.
+        """
+        if self.pattern is None or not isinstance(text, str):
+            return text
+        return self.pattern.sub(self._replace, text)
+
+
+def load_normalizer(path: Path) -> TermNormalizer:
+    """
+    Load a JSON normalization dictionary and compile it into a TermNormalizer.
+
+    The compiled normalizer is cached per process and rebuilt only when the file's
+    size or modification time changes.
+
+    Args:
+    - path (Path): Path to the JSON dictionary of full forms keyed by term.
+
+    Returns:
+    - TermNormalizer: The compiled normalizer.
+
+    Raises:
+    - FileNotFoundError: If the dictionary does not exist.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    cached: Optional[tuple] = _normalizer_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with open(key) as f:
+        normalizer = TermNormalizer(json.load(f))
+    _normalizer_cache[key] = (signature, normalizer)
+    logger.info(f"Normalization dictionary with {len(normalizer.replacements)} terms compiled from {path}.")
+    return normalizer
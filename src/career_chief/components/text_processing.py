@@ -0,0 +1,142 @@
+import re
+from multiprocessing import shared_memory, util as multiprocessing_util
+from typing import Callable, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+
+from src.career_chief import logger
+
+
+_NOISE_PATTERN = re.compile(r'[^a-zA-Z\s]')
+
+
+def remove_noise(text: str) -> str:
+    """Remove every character that is not an ASCII letter or whitespace."""
+    return _NOISE_PATTERN.sub('', text)
+
+
+# State of a worker process, set by _init_worker
+_worker_functions: List[Callable[[str], str]] = []
+_worker_texts: Optional[pa.Array] = None
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_worker(functions: List[Callable[[str], str]], memory_name: str, length: int, layout: List[tuple]):
+    """
+    Attach a worker process to the shared text buffers and keep the cleaning functions.
+
+    Args:
+    - functions (List[Callable]): Functions applied to every text, in order.
+    - memory_name (str): Name of the shared memory block holding the Arrow buffers.
+    - length (int): Number of texts.
+    - layout (List[tuple]): (start, size) of the validity, offsets and data buffers in the block;
+      a size of -1 marks a missing validity buffer.
+    """
+    global _worker_functions, _worker_texts, _worker_memory
+    _worker_functions = functions
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    buffers = [None if size < 0 else pa.py_buffer(_worker_memory.buf[start:start + size]) for start, size in layout]
+    _worker_texts = pa.Array.from_buffers(pa.large_string(), length, buffers)
+    multiprocessing_util.Finalize(None, _detach_worker, exitpriority=10)
+
+
+def _detach_worker():
+    """Drop the views into the shared memory block so it can be closed when the worker exits."""
+    global _worker_texts
+    _worker_texts = None
+    _worker_memory.close()
+
+
+def _apply(functions: List[Callable[[str], str]], texts: Sequence[Optional[str]]) -> list:
+    results = []
+    for text in texts:
+        if text is not None:
+            for function in functions:
+                text = function(text)
+        results.append(text)
+    return results
+
+
+def _process_range(start: int, stop: int) -> pa.Array:
+    """Clean the texts start..stop of the shared array and return them as an Arrow array."""
+    texts = _worker_texts.slice(start, stop - start).to_pylist()
+    return pa.array(_apply(_worker_functions, texts), type=pa.large_string())
+
+
+class ParallelTextProcessor:
+    """
+    Applies text cleaning functions to a column of texts in a process pool.
+
+    The texts are packed into an Arrow string array whose buffers are copied once
+    into a shared memory block. Workers attach to the block and read their chunk
+    of rows from it in place, so no DataFrame or list of strings is pickled to them.
+    Each worker returns its cleaned chunk as an Arrow array, and the chunks are
+    joined in row order.
+
+    Attributes:
+    - functions (List[Callable[[str], str]]): Functions applied to every text, in order.
+      They must be picklable, e.g. module-level functions or bound methods.
+    - workers (int): Number of worker processes; 1 processes the texts in this process.
+    - chunk_size (int): Number of texts per task.
+    """
+
+    def __init__(self, functions: List[Callable[[str], str]], workers: int = 1, chunk_size: int = 10_000):
+        """
+        Initialize the ParallelTextProcessor.
+
+        Args:
+        - functions (List[Callable[[str], str]]): Functions applied to every text, in order.
+        - workers (int, optional): Number of worker processes. Defaults to 1.
+        - chunk_size (int, optional): Number of texts per task. Defaults to 10,000.
+        """
+        self.functions = list(functions)
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+
+    def map(self, texts: pd.Series) -> pd.Series:
+        """
+        Apply the functions to every text. Missing values are passed through.
+
+        Args:
+        - texts (pd.Series): The texts.
+
+        Returns:
+        - pd.Series: The cleaned texts, with the index of the input.
+        """
+        if self.workers == 1 or len(texts) <= self.chunk_size:
+            values = [None if pd.isna(text) else text for text in texts]
+            return pd.Series(_apply(self.functions, values), index=texts.index, dtype=object)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        array = pa.Array.from_pandas(texts, type=pa.large_string())
+        validity, offsets, data = array.buffers()
+        buffers = [validity, offsets, data]
+
+        layout, position = [], 0
+        for buffer in buffers:
+            if buffer is None:
+                layout.append((0, -1))
+            else:
+                layout.append((position, buffer.size))
+                position += buffer.size
+
+        memory = shared_memory.SharedMemory(create=True, size=max(1, position))
+        try:
+            for buffer, (start, size) in zip(buffers, layout):
+                if size > 0:
+                    memory.buf[start:start + size] = memoryview(buffer).cast('B')
+            del array, buffers, validity, offsets, data
+
+            ranges = [(start, min(start + self.chunk_size, len(texts))) for start in range(0, len(texts), self.chunk_size)]
+            with ProcessPoolExecutor(max_workers=self.workers,
+                                     initializer=_init_worker,
+                                     initargs=(self.functions, memory.name, len(texts), layout)) as executor:
+                chunks = list(executor.map(_process_range, *zip(*ranges)))
+        finally:
+            memory.close()
+            memory.unlink()
+
+        logger.info(f"Processed {len(texts)} texts in {len(ranges)} chunks on {self.workers} worker processes.")
+        return pd.Series(pa.chunked_array(chunks, type=pa.large_string()).to_pylist(), index=texts.index, dtype=object)
@@ -3,6 +3,8 @@ from src.career_chief.utils.common import read_yaml, create_directories
 from src.career_chief import logger
 from src.career_chief.entity.config_entity import (DataIngestionConfig, 
                                                    DataValidationConfig, 
+                                                   DataDeduplicationConfig,
+                                                   DataTransformationConfig,
                                                    SpacyNERConfig,
                                                    BERTopicConfig,
                                                    SemanticRoleLabelingConfig,
@@ -31,6 +33,9 @@ class ConfigurationManager:
         """
         Initialize ConfigurationManager with configurations, parameters, and schema.
 
+        The files are parsed through `read_yaml`, which caches them per process, so 
+        creating several managers only re-reads files that changed on disk.
+
         Args:
         - config_filepath (Path): Path to the configuration file.
         - params_filepath (Path): Path to the parameters file.
@@ -44,7 +49,8 @@ class ConfigurationManager:
         self.schema = self._read_config_file(schema_filepath, "initial_schema")
 
         # Create the directory for storing artifacts if it doesn't exist
-        create_directories([self.config.artifacts_root])
+        if not os.path.isdir(self.config.artifacts_root):
+            create_directories([self.config.artifacts_root])
 
     def _read_config_file(self, filepath: str, config_name: str) -> dict:
         """
@@ -88,6 +94,9 @@ class ConfigurationManager:
             return DataIngestionConfig(
                 root_dir=Path(config.root_dir),
                 local_data_file=Path(config.local_data_file),
+                row_group_size=config.get('row_group_size', 100_000),
+                allow_hardlinks=config.get('allow_hardlinks', False),
+                schema=self.schema.columns,
             )
 
         except AttributeError as e:
@@ -122,7 +131,10 @@ class ConfigurationManager:
                 root_dir=Path(config.root_dir),
                 data_source_file=Path(config.data_source_file),
                 status_file=Path(config.status_file),
-                schema=schema
+                schema=schema,
+                streaming=config.get('streaming', False),
+                chunk_size=config.get('chunk_size', 100_000),
+                quality_report_file=Path(config.quality_report_file) if config.get('quality_report_file') else None
             )
 
         except AttributeError as e:
@@ -131,6 +143,87 @@ class ConfigurationManager:
             raise e
         
 
+    def get_data_deduplication_config(self) -> DataDeduplicationConfig:
+        """
+        Extracts data deduplication configurations and constructs a DataDeduplicationConfig object.
+
+        Returns:
+        - DataDeduplicationConfig: Object containing data deduplication configuration.
+
+        Raises:
+        - AttributeError: If the 'data_deduplication' attribute does not exist in the config.
+        """
+        try:
+            config = self.config.data_deduplication
+
+            # Ensure the directories for the deduplication artifacts exist
+            create_directories([config.root_dir, config.index_dir])
+
+            return DataDeduplicationConfig(
+                root_dir=Path(config.root_dir),
+                data_source_file=Path(config.data_source_file),
+                canonical_map_file=Path(config.canonical_map_file),
+                deduplicated_file=Path(config.deduplicated_file),
+                index_dir=Path(config.index_dir),
+                num_perm=config.get('num_perm', 128),
+                bands=config.get('bands', 32),
+                shingle_size=config.get('shingle_size', 5),
+                similarity_threshold=config.get('similarity_threshold', 0.8),
+                seed=config.get('seed', 42)
+            )
+
+        except AttributeError as e:
+            logger.error("The 'data_deduplication' attribute does not exist in the config file.")
+            raise e
+
+
+    def get_data_transformation_config(self) -> DataTransformationConfig:
+        """
+        Extract and return data transformation configurations as a DataTransformationConfig object.
+
+        This method fetches settings related to data transformation, like directories and file paths,
+        and returns them as a DataTransformationConfig object.
+
+        Returns:
+        - DataTransformationConfig: Object containing data transformation configuration settings.
+
+        Raises:
+        - AttributeError: If the 'data_transformation' attribute does not exist in the config file.
+        """
+        try:
+            config = self.config.data_transformation
+
+            # Ensure the root directory for data transformation exists
+            create_directories([config.root_dir])
+
+            # Construct and return the DataTransformationConfig object
+            return DataTransformationConfig(
+                root_dir=Path(config.root_dir),
+                data_source_file=Path(config.data_source_file),
+                data_validation=Path(config.data_validation),
+                normalization_dict=Path(config.normalization_dict),
+                tokenize_batch_size=config.get('tokenize_batch_size', 1000),
+                max_token_length=config.get('max_token_length', 512),
+                tokens_dir=Path(config.tokens_dir) if config.get('tokens_dir') else None,
+                ner_batch_size=config.get('ner_batch_size', 32),
+                ner_workers=config.get('ner_workers', 1),
+                text_workers=config.get('text_workers', 1),
+                text_chunk_size=config.get('text_chunk_size', 10_000),
+                val_size=config.get('val_size', 0.1),
+                test_size=config.get('test_size', 0.2),
+                split_key=config.get('split_key', 'job_id'),
+                split_salt=config.get('split_salt', ''),
+                output_format=config.get('output_format', 'parquet'),
+                ner_cache_path=Path(config.ner_cache_path) if config.get('ner_cache_path') else None,
+                ner_cache_max_mb=config.get('ner_cache_max_mb'),
+            )
+
+        except AttributeError as e:
+            # Log the error and re-raise the exception for handling by the caller
+            logger.error("The 'data_transformation' attribute does not exist in the config file.")
+            raise e
+
+
     def get_spacy_ner_config(self) -> SpacyNERConfig:
         """
         Fetches and constructs the spaCy NER training configuration.
@@ -165,8 +258,21 @@ class ConfigurationManager:
                 gpu_allocator=ner_config.get('gpu_allocator', False),
                 components=ner_config.get('components', []),
                 training=ner_config['training'],
-                training_metrics_path_custom=ner_config['training_metrics_path_custom'],
-                training_metrics_path_finetuned=ner_config['training_metrics_path_finetuned']
+                training_metrics_path_custom=Path(ner_config['training_metrics_path_custom']),
+                training_metrics_path_finetuned=Path(ner_config['training_metrics_path_finetuned']),
+                extraction_model_path=Path(ner_config['extraction_model_path']) if ner_config.get('extraction_model_path') else None,
+                extraction_batch_size=ner_config.get('extraction_batch_size', 64),
+                extraction_n_process=ner_config.get('extraction_n_process', 1),
+                extraction_chunk_size=ner_config.get('extraction_chunk_size', 1000),
+                extraction_cache_path=Path(ner_config['extraction_cache_path']) if ner_config.get('extraction_cache_path') else None,
+                extraction_cache_max_mb=ner_config.get('extraction_cache_max_mb'),
+                dev_size=ner_config.get('dev_size', 0.2),
+                annotation_shard_size=ner_config.get('annotation_shard_size', 1000),
+                annotation_workers=ner_config.get('annotation_workers', 1),
+                merge_chunk_size=ner_config.get('merge_chunk_size', 50_000),
+                train_custom_model=ner_config.get('train_custom_model', False),
+                finetune_pretrained_model=ner_config.get('finetune_pretrained_model', False),
+                finetuned_model_dir=Path(ner_config['finetuned_model_dir']) if ner_config.get('finetuned_model_dir') else None,
             )
         except KeyError as e:
             logger.error(f"A required configuration is missing in the 'spacy_ner' section: {e}")
@@ -197,7 +303,14 @@ class ConfigurationManager:
                 root_dir=Path(semantic_role_labeling_config['root_dir']),
                 data_path=Path(semantic_role_labeling_config['data_path']),
                 output_path=Path(semantic_role_labeling_config['output_path']),
-                model_path=semantic_role_labeling_config['model_path']
+                model_path=semantic_role_labeling_config['model_path'],
+                predictor_name=semantic_role_labeling_config.get('predictor_name', 'structured-prediction-srl'),
+                text_column=semantic_role_labeling_config.get('text_column', 'cleaned_text'),
+                batch_size=semantic_role_labeling_config.get('batch_size', 32),
+                workers=semantic_role_labeling_config.get('workers', 1),
+                max_sentence_words=semantic_role_labeling_config.get('max_sentence_words', 60),
+                num_jobs=semantic_role_labeling_config.get('num_jobs'),
+                output_format=semantic_role_labeling_config.get('output_format', 'parquet'),
             )
         except KeyError as e:
             logger.error(f"A required configuration is missing in the 'semantic_role_labeling_config' section: {e}")
@@ -208,11 +321,18 @@ class ConfigurationManager:
         try:
             get_contextual_embeddings_config = self.config['contextual_embeddings']
             
+            output_path = Path(get_contextual_embeddings_config['output_path'])
+            index_path = get_contextual_embeddings_config.get('index_path') or output_path.with_name(f"{output_path.stem}_index.parquet")
+
             return ContextualEmbedderConfig(
                 root_dir=Path(get_contextual_embeddings_config['root_dir']),
                 results_path=Path(get_contextual_embeddings_config['results_path']),
-                output_path=Path(get_contextual_embeddings_config['output_path']),
-                model_name=get_contextual_embeddings_config['model_name']
+                output_path=output_path,
+                model_name=get_contextual_embeddings_config['model_name'],
+                index_path=Path(index_path),
+                batch_size=get_contextual_embeddings_config.get('batch_size', 64),
+                sort_by_length=get_contextual_embeddings_config.get('sort_by_length', True),
+                dtype=get_contextual_embeddings_config.get('dtype', 'float16'),
             )
         except KeyError as e:
             logger.error(f"A required configuration is missing in the 'contextual embeddings config' section: {e}")
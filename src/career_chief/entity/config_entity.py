@@ -10,9 +10,15 @@ class DataIngestionConfig:
     Attributes:
     - root_dir: Directory where data ingestion artifacts are stored.
     - local_data_file: Path to the local file where the data is already saved.
+    - row_group_size: Number of rows per row group in the Parquet copy of the data.
+    - allow_hardlinks: Whether the artifact may be hardlinked to the local data file.
+    - schema: Column definitions used to type the data when it is read.
     """
     root_dir: Path  # Directory where data ingestion artifacts are stored
     local_data_file: Path  # Path to the local file where the data is already saved
+    row_group_size: int = 100_000  # Rows per row group in the Parquet copy of the data
+    allow_hardlinks: bool = False  # Hardlink the artifact to the local file instead of copying it
+    schema: Dict[str, Dict[str, str]] = None  # Column definitions used to type the data
 
 
 @dataclass(frozen=True)
@@ -37,12 +43,53 @@ class DataValidationConfig:
         
     schema : Dict[str, Dict[str, str]]
         Dictionary containing initial schema configurations for data validation.
+
+    streaming : bool
+        Whether to validate the data source in fixed-size chunks instead of loading it at once.
+
+    chunk_size : int
+        Number of rows read per chunk in streaming mode.
+
+    quality_report_file : Path
+        JSON report of the row-level data quality rules. The rules are skipped if unset.
     """
     
     root_dir: Path  # Directory for storing validation results and related artifacts
     data_source_file: Path  # Path to the ingested or feature-engineered data file
     status_file: Path  # File for logging the validation status
     schema: Dict[str, Dict[str, str]]  # Dictionary containing initial schema configurations
+    streaming: bool = False  # Validate the data source chunk by chunk
+    chunk_size: int = 100_000  # Rows per chunk in streaming mode
+    quality_report_file: Path = None  # JSON report of the row-level data quality rules
+
+@dataclass(frozen=True)
+class DataDeduplicationConfig:
+    """
+    Configuration for the deduplication of job postings.
+    
+    Attributes:
+    - root_dir: Directory where deduplication artifacts are stored.
+    - data_source_file: Path to the ingested dataset (CSV or Parquet) to deduplicate.
+    - canonical_map_file: Path to the CSV mapping every job_id to its canonical job_id.
+    - deduplicated_file: Path of the ingested data restricted to the canonical postings.
+    - index_dir: Directory holding the persistent MinHash LSH index.
+    - num_perm: Number of MinHash permutations per signature.
+    - bands: Number of LSH bands the signature is split into.
+    - shingle_size: Number of consecutive words per shingle.
+    - similarity_threshold: Minimum estimated Jaccard similarity of two near-duplicates.
+    - seed: Seed of the MinHash permutations; changing it invalidates the index.
+    """
+    root_dir: Path  # Directory where deduplication artifacts are stored
+    data_source_file: Path  # Path to the ingested data file to deduplicate
+    canonical_map_file: Path  # CSV mapping every job_id to its canonical job_id
+    deduplicated_file: Path  # Ingested data restricted to the canonical postings
+    index_dir: Path  # Directory holding the persistent MinHash LSH index
+    num_perm: int  # Number of MinHash permutations per signature
+    bands: int  # Number of LSH bands
+    shingle_size: int  # Number of consecutive words per shingle
+    similarity_threshold: float  # Minimum estimated Jaccard similarity of two near-duplicates
+    seed: int  # Seed of the MinHash permutations
+
 
 @dataclass(frozen=True)
 class DataTransformationConfig:
@@ -55,12 +102,42 @@ class DataTransformationConfig:
     Attributes:
     - root_dir: Directory where data transformation results and artifacts are stored.
     - data_source_file: Path to the file where the ingested data is stored that needs to be transformed.
+    - data_validation: Path to the validation status file.
+    - normalization_dict: Path to the JSON dictionary of full forms keyed by technical term.
+    - tokenize_batch_size: Number of texts per tokenizer call; 0 tokenizes row by row.
+    - max_token_length: Maximum number of tokens kept per text.
+    - tokens_dir: Directory for the ragged token id arrays. If unset, token ids are kept in a 'tokens' column.
+    - ner_batch_size: Number of texts per NER forward pass; 0 runs the NER pipeline row by row.
+    - ner_workers: Number of worker processes running NER, forked after the model is loaded so they share it.
+    - text_workers: Number of worker processes for noise removal and term normalization.
+    - text_chunk_size: Number of texts per cleaning task sent to a worker.
+    - val_size: Fraction of postings assigned to the validation set.
+    - test_size: Fraction of postings assigned to the test set.
+    - split_key: Column whose hash decides the split of a row.
+    - split_salt: Mixed into the split hash; changing it reshuffles the splits.
+    - output_format: Format of the split files: 'parquet', 'arrow' or 'csv'.
+    - ner_cache_path: SQLite file caching the NER output of every text. If unset, nothing is cached.
+    - ner_cache_max_mb: Size above which the least recently used NER cache entries are evicted.
     """
     
     root_dir: Path  # Directory for storing transformation results and related artifacts
     data_source_file: Path  # Path to the ingested data file for transformation
     data_validation: Path # Path to the validated output file
     normalization_dict: Path # Path to our abbreviation normalized dictionary
+    tokenize_batch_size: int = 1000  # Texts per tokenizer call; 0 tokenizes row by row
+    max_token_length: int = 512  # Maximum number of tokens kept per text
+    tokens_dir: Path = None  # Directory for the ragged token id arrays
+    ner_batch_size: int = 32  # Texts per NER forward pass; 0 runs row by row
+    ner_workers: int = 1  # Worker processes running NER
+    text_workers: int = 1  # Worker processes cleaning the texts
+    text_chunk_size: int = 10_000  # Texts per cleaning task
+    val_size: float = 0.1  # Fraction of postings in the validation set
+    test_size: float = 0.2  # Fraction of postings in the test set
+    split_key: str = "job_id"  # Column hashed to assign splits
+    split_salt: str = ""  # Mixed into the split hash
+    output_format: str = "parquet"  # Format of the split files
+    ner_cache_path: Path = None  # SQLite cache of NER outputs
+    ner_cache_max_mb: float = None  # Size limit of the NER cache
 
 
 @dataclass
@@ -73,11 +150,11 @@ class SpacyNERConfig:
         ner_job_description_extractor_dir (Path): Directory containing the NER job description extractor model.
         json_annotated_path (Path): Path to the JSON file with annotations from Label Studio.
         output_path (Path): Destination path for the converted spaCy data format.
-        train_data_path (Path): Path to the CSV file containing unannotated training data.
-        test_data_path (Path): Path to the CSV file containing unannotated test data.
-        val_data_path (Path): Path to the CSV file containing unannotated validation data.
-        spacy_train (Path): Path for the processed spaCy training data.
-        spacy_dev (Path): Path for the processed spaCy development (validation) data.
+        train_data_path (Path): Path to the dataset (CSV, Parquet or Arrow) containing unannotated training data.
+        test_data_path (Path): Path to the dataset (CSV, Parquet or Arrow) containing unannotated test data.
+        val_data_path (Path): Path to the dataset (CSV, Parquet or Arrow) containing unannotated validation data.
+        spacy_train (Path): Directory of the DocBin shards of the processed spaCy training data.
+        spacy_dev (Path): Directory of the DocBin shards of the processed spaCy development (validation) data.
         original_dataset_path (Path): Path to the original dataset used for entity extraction.
         train_data_extracted_entities (Path): Path for the CSV file with entities extracted from the training data.
         merged_output_path (Path): Path for the merged dataset after combining original data with extracted entities.
@@ -86,6 +163,21 @@ class SpacyNERConfig:
         gpu_allocator (str): The GPU allocator for training, e.g., 'pytorch'.
         components (List[Dict[str, Any]]): Configuration for the NER pipeline components.
         training (Dict[str, Any]): Dictionary containing the training parameters.
+        training_metrics_path_custom (Path): Path for the CSV file with the custom model's training metrics.
+        training_metrics_path_finetuned (Path): Path for the CSV file with the fine-tuned model's training metrics.
+        extraction_model_path (Path): Fine-tuned model used to extract entities from the training data.
+        extraction_batch_size (int): Number of documents per `nlp.pipe` batch; 0 extracts one document at a time.
+        extraction_n_process (int): Number of processes running `nlp.pipe`.
+        extraction_chunk_size (int): Number of jobs written to the extracted entities file at a time.
+        extraction_cache_path (Path): SQLite file caching the entities of every description; None disables the cache.
+        extraction_cache_max_mb (float): Size above which the least recently used cache entries are evicted.
+        dev_size (float): Fraction of the annotated tasks used for development.
+        annotation_shard_size (int): Maximum number of documents per DocBin shard.
+        annotation_workers (int): Number of processes converting the annotated tasks.
+        merge_chunk_size (int): Number of rows of the larger dataset merged at a time.
+        train_custom_model (bool): Whether the stage trains the custom model from a blank pipeline.
+        finetune_pretrained_model (bool): Whether the stage fine-tunes the pretrained model.
+        finetuned_model_dir (Path): Output directory of the fine-tuning; defaults to pretrained_model_dir/finetuned_model.
     """
     root_dir: Path
     ner_job_description_extractor_dir: Path
@@ -106,6 +198,21 @@ class SpacyNERConfig:
     training: Dict[str, Any]
     training_metrics_path_custom: Path
     training_metrics_path_finetuned: Path
+    extraction_model_path: Path = None
+    extraction_batch_size: int = 64
+    extraction_n_process: int = 1
+    extraction_chunk_size: int = 1000
+    extraction_cache_path: Path = None
+    extraction_cache_max_mb: float = None
+    dev_size: float = 0.2
+    annotation_shard_size: int = 1000
+    annotation_workers: int = 1
+    merge_chunk_size: int = 50_000
+    train_custom_model: bool = False
+    finetune_pretrained_model: bool = False
+    finetuned_model_dir: Path = None
+    training_metrics_path_custom: Path
+    training_metrics_path_finetuned: Path
 
 
 @dataclass
@@ -117,10 +224,33 @@ class BERTopicConfig:
 
 @dataclass
 class SemanticRoleLabelingConfig:
+    """
+    Represents the configuration for semantic role labeling (SRL).
+
+    Attributes:
+        root_dir (Path): Directory for SRL artifacts.
+        data_path (Path): Dataset (CSV, Parquet or Arrow) with the job descriptions.
+        output_path (Path): Directory of the SRL results.
+        model_path (Path): Open information extraction model archive.
+        predictor_name (str): Pretrained AllenNLP model id, or path or URL of a model archive, used for SRL.
+        text_column (str): Column holding the descriptions.
+        batch_size (int): Number of sentences per predictor batch; 0 predicts whole descriptions one at a time.
+        workers (int): Number of processes running the predictor.
+        max_sentence_words (int): Maximum number of words per sentence; longer ones are cut into windows.
+        num_jobs (int): Number of descriptions labeled, or None for all of them.
+        output_format (str): Format of the results file: 'parquet', 'arrow' or 'csv'.
+    """
     root_dir: Path
     data_path: Path
     output_path: Path
     model_path: Path
+    predictor_name: str = "structured-prediction-srl"
+    text_column: str = "cleaned_text"
+    batch_size: int = 32
+    workers: int = 1
+    max_sentence_words: int = 60
+    num_jobs: int = None
+    output_format: str = "parquet"
 
 
 @dataclass
@@ -136,3 +266,15 @@ class ContextualEmbedderConfig:
     
     # The name of the model to be used from SentenceTransformers for generating embeddings.
     model_name: str
+
+    # Path of the job id of every row of the embedding matrix; defaults to '<output_path>_index.parquet'.
+    index_path: Path = None
+
+    # Texts encoded per batch; 0 encodes them one at a time.
+    batch_size: int = 64
+
+    # Whether texts of similar length are batched together.
+    sort_by_length: bool = True
+
+    # Data type of the saved embedding matrix, 'float16' or 'float32'.
+    dtype: str = "float16"
@@ -1,13 +1,17 @@
-from IPython.display import display
-
 from src.career_chief import logger
 from src.career_chief.config.configuration import ConfigurationManager
-from src.career_chief.components.data_ingestion import DataIngestion
 
 class DataIngestionPipeline:
 
     STAGE_NAME = "Data Ingestion Stage"
 
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "data_ingestion"
+    INPUT_KEYS = ["local_data_file"]
+    OUTPUT_KEYS = ["root_dir"]
+    PARAMS_KEYS = []
+    USES_SCHEMA = True
+
     def __init__(self):
         self.config_manager = ConfigurationManager()
 
@@ -15,6 +19,9 @@ class DataIngestionPipeline:
         """
         Main method to run the data ingestion process.
         """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.data_ingestion import DataIngestion
+
         try:
             logger.info("Fetching data ingestion configuration...")
             data_ingestion_config = self.config_manager.get_data_ingestion_config()
@@ -23,7 +30,12 @@ class DataIngestionPipeline:
             data_ingestion = DataIngestion(config=data_ingestion_config)
             
             logger.info(f"Copying training data from {data_ingestion_config.local_data_file} to {data_ingestion_config.root_dir}...")
-            data_ingestion.transfer_data()
+            data_transferred = data_ingestion.transfer_data()
+
+            # The Parquet copy only needs rebuilding when the CSV artifact changed
+            if data_transferred or not data_ingestion.get_parquet_path(data_ingestion_config.local_data_file.name).exists():
+                logger.info("Converting training data to a Parquet dataset...")
+                data_ingestion.convert_to_parquet(data_ingestion_config.local_data_file.name)
             
         except Exception as e:
             logger.exception("An error occurred during the data ingestion process.")
@@ -31,8 +43,12 @@ class DataIngestionPipeline:
         
     def show_data(self):
         """
-        Main method to run the data ingestion process and display the top 10 records of the dataset in a nicely formatted manner using IPython's display in Jupyter notebooks.
+        Display the ingested dataset in a nicely formatted manner using IPython's display in Jupyter notebooks.
+        Not part of `run_pipeline`, which must run without IPython; call it from a notebook.
         """
+        from IPython.display import display
+        from src.career_chief.components.data_ingestion import DataIngestion
+
         try:
             logger.info("Fetching data ingestion configuration...")
             data_ingestion_config = self.config_manager.get_data_ingestion_config()
@@ -56,7 +72,7 @@ class DataIngestionPipeline:
         Run the data ingestion training pipeline.
         """
         try:
-            self.show_data()
+            self.run_data_ingestion()
 
         except Exception as e:
             # No need to log the exception here since it's already logged in the run_data_ingestion method.
@@ -1,7 +1,6 @@
 
 from src.career_chief import logger
 from src.career_chief.config.configuration import ConfigurationManager
-from src.career_chief.components.data_validation import DataValidation
 
 class DataValidationPipeline:
     """
@@ -12,10 +11,21 @@ class DataValidationPipeline:
 
     Attributes:
         STAGE_NAME (str): The name of this pipeline stage.
+        CONFIG_SECTION (str): The config.yaml section this stage reads.
+        INPUT_KEYS (list): Keys of that section holding input artifact paths.
+        OUTPUT_KEYS (list): Keys of that section holding output artifact paths.
+        PARAMS_KEYS (list): params.yaml keys this stage depends on.
     """
 
     STAGE_NAME = "Data Validation Pipeline"
 
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "data_validation"
+    INPUT_KEYS = ["data_source_file"]
+    OUTPUT_KEYS = ["status_file", "quality_report_file"]
+    PARAMS_KEYS = []
+    USES_SCHEMA = True
+
     def __init__(self):
         """
         Initializes the pipeline with a configuration manager.
@@ -28,7 +38,14 @@ class DataValidationPipeline:
         
         This method orchestrates the different validation functions to ensure the
         dataset's integrity.
+
+        Raises:
+            ValueError: If any validation failed, so that the stage is not recorded as completed
+            and the stages depending on it do not run.
         """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.data_validation import DataValidation
+
         try:
             logger.info("Fetching initial data validation configuration...")
             data_validation_config = self.config_manager.get_data_validation_config()
@@ -37,12 +54,14 @@ class DataValidationPipeline:
             data_validation = DataValidation(config=data_validation_config)
 
             logger.info("Executing Data Validations...")
-            data_validation.run_all_validations()
+            if not data_validation.run_all_validations():
+                raise ValueError(f"Data validation failed; see {data_validation_config.status_file}.")
 
             logger.info("Data Validation Pipeline completed successfully.")
 
         except Exception as e:
-            logger.error(f"Error encountered during the data validation: {e}")
+            logger.exception("An error occurred during the data validation.")
+            raise e
     
     def run_pipeline(self):
         """
@@ -0,0 +1,69 @@
+from src.career_chief import logger
+from src.career_chief.config.configuration import ConfigurationManager
+
+class DataDeduplicationPipeline:
+    """
+    This pipeline removes repeated job postings right after ingestion.
+    Google Jobs scrapes contain the same posting many times, syndicated through
+    different sources; mapping each of them to one canonical posting keeps the
+    duplicates out of the expensive NER, SRL and embedding stages.
+
+    Attributes:
+        STAGE_NAME (str): The name of this pipeline stage.
+        CONFIG_SECTION (str): The config.yaml section this stage reads.
+        INPUT_KEYS (list): Keys of that section holding input artifact paths.
+        OUTPUT_KEYS (list): Keys of that section holding output artifact paths.
+        PARAMS_KEYS (list): params.yaml keys this stage depends on.
+    """
+
+    STAGE_NAME = "Data Deduplication Pipeline"
+
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "data_deduplication"
+    INPUT_KEYS = ["data_source_file"]
+    OUTPUT_KEYS = ["canonical_map_file", "deduplicated_file", "index_dir"]
+    PARAMS_KEYS = []
+
+    def __init__(self):
+        """
+        Initializes the pipeline with a configuration manager.
+        """
+        self.config_manager = ConfigurationManager()
+
+    def run_data_deduplication(self):
+        """
+        Run the exact and near-duplicate detection and save the canonical-id mapping
+        and the deduplicated postings.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.data_deduplication import DataDeduplication
+
+        try:
+            logger.info("Fetching data deduplication configuration...")
+            data_deduplication_config = self.config_manager.get_data_deduplication_config()
+
+            logger.info("Initializing data deduplication process...")
+            data_deduplication = DataDeduplication(config=data_deduplication_config)
+
+            logger.info("Detecting duplicate job postings...")
+            data_deduplication.run()
+
+        except Exception as e:
+            logger.exception("An error occurred during the data deduplication process.")
+            raise e
+
+    def run_pipeline(self):
+        """
+        Run the entire Data Deduplication Pipeline.
+        """
+        try:
+            logger.info(f">>>>>> Stage: {DataDeduplicationPipeline.STAGE_NAME} started <<<<<<")
+            self.run_data_deduplication()
+            logger.info(f">>>>>> Stage {DataDeduplicationPipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
+        except Exception as e:
+            logger.error(f"Error encountered during the {DataDeduplicationPipeline.STAGE_NAME}: {e}")
+            raise e
+
+if __name__ == '__main__':
+    pipeline = DataDeduplicationPipeline()
+    pipeline.run_pipeline()
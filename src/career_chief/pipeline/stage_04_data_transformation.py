@@ -0,0 +1,73 @@
+from src.career_chief import logger
+from src.career_chief.config.configuration import ConfigurationManager
+
+class DataTransformationPipeline:
+    """
+    Orchestrates the data transformation process including preprocessing, NER,
+    and splitting the data into training, validation, and testing datasets.
+
+    Attributes:
+        STAGE_NAME (str): The name of this pipeline stage.
+        CONFIG_SECTION (str): The config.yaml section this stage reads.
+        INPUT_KEYS (list): Keys of that section holding input artifact paths.
+        OUTPUT_KEYS (list): Keys of that section holding output artifact paths.
+        PARAMS_KEYS (list): params.yaml keys this stage depends on.
+    """
+
+    STAGE_NAME = "Data Transformation Pipeline"
+
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "data_transformation"
+    INPUT_KEYS = ["data_source_file", "data_validation", "normalization_dict"]
+    OUTPUT_KEYS = ["root_dir"]
+    PARAMS_KEYS = []
+
+    def __init__(self):
+        """
+        Initializes the pipeline with a configuration manager.
+        """
+        self.config_manager = ConfigurationManager()
+
+    def run_data_transformation(self):
+        """
+        Preprocess and transform the data, then save the training, validation and testing sets.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.data_transformation import DataTransformation
+
+        try:
+            logger.info("Fetching data transformation configuration...")
+            transformation_config = self.config_manager.get_data_transformation_config()
+
+            logger.info("Initializing data transformation process...")
+            data_transformation = DataTransformation(transformation_config)
+
+            logger.info(f"{self.STAGE_NAME}: Starting the data transformation process.")
+            data_transformation.preprocess_and_transform()
+
+            # Saving the processed data
+            sizes = data_transformation.save_splits()
+
+            logger.info(f"Training dataset size: {sizes['train']}")
+            logger.info(f"Validation dataset size: {sizes['val']}")
+            logger.info(f"Testing dataset size: {sizes['test']}")
+
+        except Exception as e:
+            logger.exception("An error occurred during the data transformation process.")
+            raise e
+
+    def run_pipeline(self):
+        """
+        Run the entire Data Transformation Pipeline.
+        """
+        try:
+            logger.info(f">>>>>> Stage: {DataTransformationPipeline.STAGE_NAME} started <<<<<<")
+            self.run_data_transformation()
+            logger.info(f">>>>>> Stage {DataTransformationPipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
+        except Exception as e:
+            logger.error(f"Error encountered during the {DataTransformationPipeline.STAGE_NAME}: {e}")
+            raise e
+
+if __name__ == '__main__':
+    pipeline = DataTransformationPipeline()
+    pipeline.run_pipeline()
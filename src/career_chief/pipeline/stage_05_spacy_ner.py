@@ -0,0 +1,155 @@
+from src.career_chief import logger
+from src.career_chief.config.configuration import ConfigurationManager
+
+class SpacyCustomNERModelPipeline:
+    """
+    Orchestrates the spaCy Named Entity Recognition (NER) steps: the Label Studio
+    annotations are converted into sharded spaCy training and development data, the
+    NER models are optionally trained on them, the fine-tuned model extracts the entities of every training posting into
+    `train_data_extracted_entities`, and the entities are merged with the original
+    postings into `merged_output_path`.
+
+    Attributes:
+        STAGE_NAME (str): The name of this pipeline stage.
+        CONFIG_SECTION (str): The config.yaml section this stage reads.
+        INPUT_KEYS (list): Keys of that section holding input artifact paths.
+        OUTPUT_KEYS (list): Keys of that section holding output artifact paths.
+        PARAMS_KEYS (list): params.yaml keys this stage depends on.
+    """
+
+    STAGE_NAME = "Custom NER spaCy Model Pipeline"
+
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "spacy_ner"
+    INPUT_KEYS = ["json_annotated_path", "train_data_path", "extraction_model_path", "original_dataset_path"]
+    OUTPUT_KEYS = ["spacy_train", "spacy_dev", "custom_model_dir", "finetuned_model_dir", "training_metrics_path_custom",
+                   "training_metrics_path_finetuned", "train_data_extracted_entities", "merged_output_path"]
+    PARAMS_KEYS = []
+
+    def __init__(self):
+        """
+        Initializes the pipeline with a configuration manager.
+        """
+        self.config_manager = ConfigurationManager()
+
+    def run_annotation_conversion(self):
+        """
+        Convert the Label Studio export into sharded spaCy training and development data.
+
+        The step is skipped, keeping the existing shards, if there is no export.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.annotation_conversion import AnnotationConverter
+
+        try:
+            config = self.config_manager.get_spacy_ner_config()
+            if not config.json_annotated_path.exists():
+                logger.warning(f"{self.STAGE_NAME}: No annotation export at {config.json_annotated_path}; "
+                               f"keeping the existing spaCy training data.")
+                return
+
+            converter = AnnotationConverter(json_path=config.json_annotated_path,
+                                            train_dir=config.spacy_train,
+                                            dev_dir=config.spacy_dev,
+                                            dev_size=config.dev_size,
+                                            shard_size=config.annotation_shard_size,
+                                            workers=config.annotation_workers)
+
+            logger.info(f"{self.STAGE_NAME}: Converting the annotated data.")
+            converter.convert()
+
+        except Exception as e:
+            logger.exception("An error occurred during annotation conversion.")
+            raise e
+
+    def run_model_training(self):
+        """
+        Train the custom NER model and fine-tune the pretrained one, if enabled by
+        `train_custom_model` and `finetune_pretrained_model`.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.ner_training import SpacyCustomNERModel
+
+        try:
+            config = self.config_manager.get_spacy_ner_config()
+            if not (config.train_custom_model or config.finetune_pretrained_model):
+                return
+
+            model = SpacyCustomNERModel(config=config)
+            if config.train_custom_model:
+                logger.info(f"{self.STAGE_NAME}: Training the custom NER model.")
+                model.train_ner_model()
+            if config.finetune_pretrained_model:
+                logger.info(f"{self.STAGE_NAME}: Fine-tuning the pretrained NER model.")
+                model.finetune_pretrained_ner_model()
+
+        except Exception as e:
+            logger.exception("An error occurred during NER model training.")
+            raise e
+
+    def run_entity_extraction(self):
+        """
+        Extract the entities of the training job descriptions with the fine-tuned model.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.entity_extraction import EntityExtractorFromJobDescriptions
+
+        try:
+            logger.info("Fetching spaCy NER configuration...")
+            config = self.config_manager.get_spacy_ner_config()
+
+            extractor = EntityExtractorFromJobDescriptions(model_path=config.extraction_model_path,
+                                                           data_path=config.train_data_path,
+                                                           output_path=config.train_data_extracted_entities,
+                                                           batch_size=config.extraction_batch_size,
+                                                           n_process=config.extraction_n_process,
+                                                           chunk_size=config.extraction_chunk_size,
+                                                           cache_path=config.extraction_cache_path,
+                                                           cache_max_mb=config.extraction_cache_max_mb)
+
+            logger.info(f"{self.STAGE_NAME}: Extracting entities from the training data.")
+            extractor.extract_and_save_entities()
+
+        except Exception as e:
+            logger.exception("An error occurred during entity extraction.")
+            raise e
+
+    def run_dataset_merge(self):
+        """
+        Merge the original postings with their extracted entities.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.dataset_merger import DatasetMerger
+
+        try:
+            config = self.config_manager.get_spacy_ner_config()
+            merger = DatasetMerger(dataset_path=config.original_dataset_path,
+                                   extracted_entities_path=config.train_data_extracted_entities,
+                                   output_path=config.merged_output_path,
+                                   chunk_size=config.merge_chunk_size)
+
+            logger.info(f"{self.STAGE_NAME}: Merging the original postings with the extracted entities.")
+            merger.merge()
+
+        except Exception as e:
+            logger.exception("An error occurred during the dataset merge.")
+            raise e
+
+    def run_pipeline(self):
+        """
+        Run the entire Custom NER spaCy Model Pipeline.
+        """
+        try:
+            logger.info(f">>>>>> Stage: {SpacyCustomNERModelPipeline.STAGE_NAME} started <<<<<<")
+            self.run_annotation_conversion()
+            self.run_model_training()
+            self.run_entity_extraction()
+            self.run_dataset_merge()
+            logger.info(f">>>>>> Stage {SpacyCustomNERModelPipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
+        except Exception as e:
+            logger.error(f"Error encountered during the {SpacyCustomNERModelPipeline.STAGE_NAME}: {e}")
+            raise e
+
+if __name__ == '__main__':
+    pipeline = SpacyCustomNERModelPipeline()
+    pipeline.run_pipeline()
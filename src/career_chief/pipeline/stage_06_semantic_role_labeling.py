@@ -0,0 +1,65 @@
+from src.career_chief import logger
+from src.career_chief.config.configuration import ConfigurationManager
+
+class SemanticRoleLabelingPipeline:
+    """
+    Runs semantic role labeling (SRL) on the job descriptions of `data_path` and saves
+    the raw and processed SRL results of every description to `output_path`.
+
+    Attributes:
+        STAGE_NAME (str): The name of this pipeline stage.
+        CONFIG_SECTION (str): The config.yaml section this stage reads.
+        INPUT_KEYS (list): Keys of that section holding input artifact paths.
+        OUTPUT_KEYS (list): Keys of that section holding output artifact paths.
+        PARAMS_KEYS (list): params.yaml keys this stage depends on.
+    """
+
+    STAGE_NAME = "Semantic Role Labeling Pipeline"
+
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "semantic_role_labeling"
+    INPUT_KEYS = ["data_path"]
+    OUTPUT_KEYS = ["output_path"]
+    PARAMS_KEYS = []
+
+    def __init__(self):
+        """
+        Initializes the pipeline with a configuration manager.
+        """
+        self.config_manager = ConfigurationManager()
+
+    def run_semantic_role_labeling(self):
+        """
+        Label the semantic roles of the job descriptions and save the results.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.semantic_role_labeling import SemanticRoleLabelingComponent
+
+        try:
+            config = self.config_manager.get_semantic_role_labeling_config()
+
+            logger.info(f"{self.STAGE_NAME}: Loading the SRL predictor.")
+            component = SemanticRoleLabelingComponent(config=config)
+
+            logger.info(f"{self.STAGE_NAME}: Starting semantic role labeling.")
+            component.run(num_jobs=config.num_jobs)
+
+        except Exception as e:
+            logger.exception("An error occurred during semantic role labeling.")
+            raise e
+
+    def run_pipeline(self):
+        """
+        Run the entire Semantic Role Labeling Pipeline.
+        """
+        try:
+            logger.info(f">>>>>> Stage: {SemanticRoleLabelingPipeline.STAGE_NAME} started <<<<<<")
+            self.run_semantic_role_labeling()
+            logger.info(f">>>>>> Stage {SemanticRoleLabelingPipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
+        except Exception as e:
+            logger.error(f"Error encountered during the {SemanticRoleLabelingPipeline.STAGE_NAME}: {e}")
+            raise e
+
+if __name__ == '__main__':
+    pipeline = SemanticRoleLabelingPipeline()
+    pipeline.run_pipeline()
@@ -0,0 +1,69 @@
+from src.career_chief import logger
+from src.career_chief.config.configuration import ConfigurationManager
+
+class ContextualEmbedderPipeline:
+    """
+    A pipeline to combine the entities, topics and semantic roles of every job into a
+    text, embed the texts, and save the embedding matrix with its job id index.
+
+    Attributes:
+        STAGE_NAME (str): The name of this pipeline stage.
+        CONFIG_SECTION (str): The config.yaml section this stage reads.
+        INPUT_KEYS (list): Keys of that section holding input artifact paths.
+        OUTPUT_KEYS (list): Keys of that section holding output artifact paths.
+        PARAMS_KEYS (list): params.yaml keys this stage depends on.
+    """
+
+    STAGE_NAME = "Contextual Embedding Pipeline"
+
+    # Declared for the orchestrator's stage cache
+    CONFIG_SECTION = "contextual_embeddings"
+    INPUT_KEYS = ["results_path"]
+    OUTPUT_KEYS = ["output_path", "index_path"]
+    PARAMS_KEYS = []
+
+    def __init__(self):
+        """
+        Initializes the pipeline with the configuration manager to obtain settings.
+        """
+        self.config_manager = ConfigurationManager()
+
+    def run_contextual_embeddings(self):
+        """
+        Preprocess the texts, create their embeddings, and save them locally.
+        """
+        # Imported here so that importing the stage (e.g. for `main.py --help`) stays cheap
+        from src.career_chief.components.contextual_embedding import ContextualEmbedder
+
+        try:
+            logger.info(f"{self.STAGE_NAME}: Fetching configuration for Contextual Embedder.")
+            embeddings_config = self.config_manager.get_contextual_embeddings_config()
+
+            logger.info(f"{self.STAGE_NAME}: Initializing the Contextual Embedder.")
+            contextual_embedder = ContextualEmbedder(embeddings_config)
+
+            logger.info(f"{self.STAGE_NAME}: Starting preprocessing and embedding creation.")
+            contextual_embedder.create_embeddings()
+
+            logger.info(f"{self.STAGE_NAME}: Saving embeddings.")
+            contextual_embedder.save_embeddings()
+
+        except Exception as e:
+            logger.exception("An error occurred during contextual embedding.")
+            raise e
+
+    def run_pipeline(self):
+        """
+        Run the entire Contextual Embedding Pipeline.
+        """
+        try:
+            logger.info(f">>>>>> Stage: {ContextualEmbedderPipeline.STAGE_NAME} started <<<<<<")
+            self.run_contextual_embeddings()
+            logger.info(f">>>>>> Stage {ContextualEmbedderPipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
+        except Exception as e:
+            logger.error(f"Error encountered during the {ContextualEmbedderPipeline.STAGE_NAME}: {e}")
+            raise e
+
+if __name__ == '__main__':
+    pipeline = ContextualEmbedderPipeline()
+    pipeline.run_pipeline()
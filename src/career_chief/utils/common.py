@@ -8,9 +8,11 @@ Purpose:
 from pathlib import Path
 from typing import Any, List
 import os
+import copy
+import shutil
+import hashlib
 import yaml
 import json
-import joblib
 
 from box import ConfigBox
 from box.exceptions import BoxValueError
@@ -19,12 +21,18 @@ from ensure import ensure_annotations
 from src.career_chief import logger
 
 
+# Parsed yaml content keyed by absolute path, stored with the (mtime_ns, size) it was parsed at
+_yaml_cache = {}
+
 
 @ensure_annotations
 def read_yaml(path_to_yaml: Path) -> ConfigBox:
     """
     Reads a yaml file, and returns a ConfigBox object.
 
+    Parsed content is cached for the lifetime of the process and reused as long as 
+    the file's mtime and size are unchanged. Every call returns an independent copy.
+
     Args:
         path_to_yaml (Path): Path to the yaml file.
 
@@ -36,10 +44,20 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
         ConfigBox: The yaml content as a ConfigBox object.
     """
     try:
+        cache_key = os.path.abspath(path_to_yaml)
+        stat = os.stat(path_to_yaml)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = _yaml_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return ConfigBox(copy.deepcopy(cached[1]))
+
         with open(path_to_yaml) as yaml_file:
             content = yaml.safe_load(yaml_file)
+            config_box = ConfigBox(content)
+            _yaml_cache[cache_key] = (signature, copy.deepcopy(content))
             logger.info(f"yaml file: {path_to_yaml} loaded successfully")
-            return ConfigBox(content)
+            return config_box
     except BoxValueError:
         logger.info("Value exception: empty yaml file")
         raise ValueError("yaml file is empty")
@@ -130,6 +148,8 @@ def save_bin(data: Any, path: Path):
         data (Any): data to be saved as binary
         path (Path): path to binary file
     """
+    import joblib
+
     try:
         joblib.dump(value=data, filename=path)
         logger.info(f"binary file saved at: {path}")
@@ -152,6 +172,8 @@ def load_bin(path: Path) -> Any:
     Returns:
         Any: object stored in the file
     """
+    import joblib
+
     try:
         data = joblib.load(path)
         logger.info(f"binary file loaded from: {path}")
@@ -189,4 +211,98 @@ def get_size(path: Path) -> str:
         raise
     except OSError as e:
         logger.error(f"Failed to get size for {path}. Error: {e}")
-        raise
\ No newline at end of file
+        raise
+
+@ensure_annotations
+def get_file_hash(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 content hash of a file, reading it in fixed-size blocks.
+
+    Args:
+        path (Path): path to the file
+        chunk_size (int, optional): block size in bytes. Defaults to 8 MB.
+
+    Returns:
+        str: hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    except FileNotFoundError:
+        logger.error(f"File not found at {path}")
+        raise
+    except PermissionError:
+        logger.error(f"Permission denied to read {path}")
+        raise
+
+
+def _reflink(src: Path, dst: Path):
+    """Clone src into dst with the Linux FICLONE ioctl (copy-on-write filesystems only)."""
+    import fcntl
+
+    FICLONE = 0x40049409
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+def _sendfile(src: Path, dst: Path):
+    """
+    Copy src into dst inside the kernel with os.sendfile, avoiding user-space buffers.
+
+    Raises OSError if src ends before its size at the start was copied (e.g. it was
+    truncated meanwhile), so that transfer_file does not keep a truncated copy.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+            if sent == 0:
+                raise OSError(f"sendfile copied {offset} of {offset + remaining} bytes of {src}")
+            offset += sent
+            remaining -= sent
+
+
+@ensure_annotations
+def transfer_file(src: Path, dst: Path, allow_hardlinks: bool = False) -> str:
+    """
+    Place a copy of src at dst using the cheapest mechanism the filesystem supports.
+
+    The strategies are tried in order: reflink (copy-on-write clone), hardlink (only if
+    allowed, since the artifact then shares its inode with the source), os.sendfile,
+    and finally shutil.copy2. The file is written to a temporary name next to dst and
+    moved into place, so an interrupted transfer never leaves a partial artifact.
+
+    Args:
+        src (Path): path to the source file
+        dst (Path): destination path of the file
+        allow_hardlinks (bool, optional): permit hardlinking dst to src. Defaults to False.
+
+    Returns:
+        str: the strategy that was used ('reflink', 'hardlink', 'sendfile' or 'copy')
+    """
+    tmp_dst = dst.with_name(f".{dst.name}.tmp")
+    strategies = [("reflink", _reflink)]
+    if allow_hardlinks:
+        strategies.append(("hardlink", os.link))
+    if hasattr(os, "sendfile"):
+        strategies.append(("sendfile", _sendfile))
+    strategies.append(("copy", shutil.copyfile))
+
+    for name, strategy in strategies:
+        if tmp_dst.exists():
+            tmp_dst.unlink()
+        try:
+            strategy(src, tmp_dst)
+        except OSError as e:
+            logger.debug(f"Transfer strategy '{name}' unavailable for {src}: {e}")
+            continue
+        if name != "hardlink":
+            shutil.copystat(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+        return name
+
+    raise OSError(f"Failed to transfer {src} to {dst}")
@@ -0,0 +1,255 @@
+"""
+dag_scheduler.py
+
+Purpose:
+    Runs pipeline stages as a dependency graph instead of a fixed list. The graph is
+    derived from the input and output artifact paths each stage declares: a stage
+    depends on every stage that writes a path it reads. Independent branches run
+    concurrently in a process pool, and a failing stage only stops its descendants.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from src.career_chief import logger
+from src.career_chief.utils.stage_cache import StageCache
+from src.career_chief.utils.tracing import trace, collect_events, add_events
+
+
+# Stage states reported by StageScheduler.run
+COMPLETED = "completed"
+CACHED = "cached"
+FAILED = "failed"
+UPSTREAM_FAILED = "upstream_failed"
+
+
+def _run_stage(stage_cls) -> list:
+    """
+    Instantiate and run a pipeline stage. Executed inside a worker process.
+
+    Args:
+        stage_cls: The pipeline class to run.
+
+    Returns:
+        list: The trace events recorded while the stage ran.
+
+    Raises:
+        Exception: The stage's error, with the events recorded until it failed attached
+        as its `trace_events` attribute.
+    """
+    # Spans already buffered in this worker, copied from the parent at the fork or left
+    # by an earlier task, do not belong to this stage
+    collect_events()
+    try:
+        with trace(stage_cls.STAGE_NAME, category="stage"):
+            stage_cls().run_pipeline()
+    except Exception as e:
+        e.trace_events = collect_events()
+        raise
+    return collect_events()
+
+
+def _overlaps(input_path: str, output_path: str) -> bool:
+    """
+    Check whether reading input_path depends on writing output_path, i.e. the two paths
+    are equal or one of them lies inside the other.
+    """
+    input_parts = Path(os.path.normpath(input_path)).parts
+    output_parts = Path(os.path.normpath(output_path)).parts
+    shortest = min(len(input_parts), len(output_parts))
+    return input_parts[:shortest] == output_parts[:shortest]
+
+
+class StageScheduler:
+    """
+    Schedules pipeline stages over the dependency graph implied by their declared
+    CONFIG_SECTION, INPUT_KEYS and OUTPUT_KEYS.
+
+    Attributes:
+    - stages (Dict[str, type]): Pipeline classes keyed by their config section, in declaration order.
+    - config_manager (ConfigurationManager): Source of the declared artifact paths.
+    - stage_cache (StageCache): Cache used to skip stages whose inputs are unchanged.
+    - max_workers (int): Number of worker processes running stages concurrently.
+    - dependencies (Dict[str, Set[str]]): Upstream stages of every stage.
+    """
+
+    def __init__(self, stages: list, config_manager, stage_cache: StageCache, max_workers: int = 1):
+        """
+        Initialize the StageScheduler and build the dependency graph.
+
+        Args:
+        - stages (list): Pipeline classes to schedule.
+        - config_manager (ConfigurationManager): Source of the declared artifact paths.
+        - stage_cache (StageCache): Cache used to skip stages whose inputs are unchanged.
+        - max_workers (int, optional): Number of worker processes. Defaults to 1.
+
+        Raises:
+        - ValueError: If two stages share a config section or the graph contains a cycle.
+        """
+        self.stages = {}
+        for stage in stages:
+            if stage.CONFIG_SECTION in self.stages:
+                raise ValueError(f"Duplicate stage for config section '{stage.CONFIG_SECTION}'.")
+            self.stages[stage.CONFIG_SECTION] = stage
+        self.config_manager = config_manager
+        self.stage_cache = stage_cache
+        self.max_workers = max(1, max_workers)
+        self.dependencies = self._build_dependencies()
+        self.levels = self._topological_levels()
+
+    def _declared_paths(self, config: dict, stage, keys: List[str]) -> List[str]:
+        section = config[stage.CONFIG_SECTION]
+        return [str(section[key]) for key in keys]
+
+    def _build_dependencies(self) -> Dict[str, Set[str]]:
+        """
+        Derive the upstream stages of every stage from the declared artifact paths.
+
+        Returns:
+        - Dict[str, Set[str]]: Upstream config sections keyed by config section.
+        """
+        config = self.config_manager.config
+        inputs = {key: self._declared_paths(config, stage, stage.INPUT_KEYS) for key, stage in self.stages.items()}
+        outputs = {key: self._declared_paths(config, stage, stage.OUTPUT_KEYS) for key, stage in self.stages.items()}
+
+        dependencies = {key: set() for key in self.stages}
+        for key in self.stages:
+            for upstream in self.stages:
+                if upstream == key:
+                    continue
+                if any(_overlaps(i, o) for i in inputs[key] for o in outputs[upstream]):
+                    dependencies[key].add(upstream)
+        return dependencies
+
+    def _topological_levels(self) -> List[List[str]]:
+        """
+        Group stages into levels; every stage only depends on stages in earlier levels.
+
+        Returns:
+        - List[List[str]]: Config sections per level, in declaration order.
+
+        Raises:
+        - ValueError: If the dependency graph contains a cycle.
+        """
+        remaining = dict(self.dependencies)
+        placed = set()
+        levels = []
+        while remaining:
+            level = [key for key, deps in remaining.items() if deps <= placed]
+            if not level:
+                raise ValueError(f"Stage dependency cycle detected among: {', '.join(remaining)}.")
+            levels.append(level)
+            placed.update(level)
+            for key in level:
+                del remaining[key]
+        return levels
+
+    def describe_plan(self, force: bool = False, only: Optional[List[str]] = None) -> str:
+        """
+        Describe the execution plan without running anything.
+
+        Args:
+        - force (bool, optional): Whether the cache would be bypassed. Defaults to False.
+        - only (List[str], optional): Restrict the plan to these stages.
+
+        Returns:
+        - str: A human-readable execution plan.
+        """
+        lines = [f"Execution plan ({self.max_workers} worker(s)):"]
+        will_run = set()
+        for number, level in enumerate(self.levels, start=1):
+            level_lines = []
+            for key in level:
+                if only and key not in only:
+                    continue
+                pipeline = self.stages[key]()
+                if force or only:
+                    action = "run (forced)"
+                elif self.dependencies[key] & will_run:
+                    action = "run unless upstream outputs are unchanged"
+                elif self.stage_cache.is_fresh(pipeline, self.stage_cache.fingerprint(pipeline)):
+                    action = "skip (cached)"
+                else:
+                    action = "run"
+                if not action.startswith("skip"):
+                    will_run.add(key)
+                upstream = ", ".join(sorted(self.dependencies[key])) or "none"
+                level_lines.append(f"    - {key} [{pipeline.STAGE_NAME}] depends on: {upstream} -> {action}")
+            if level_lines:
+                lines.append(f"  Level {number}:")
+                lines.extend(level_lines)
+        return "\n".join(lines)
+
+    def run(self, force: bool = False, only: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Run the selected stages, starting each one as soon as all of its upstream stages
+        have completed or were served from the cache.
+
+        Args:
+        - force (bool, optional): Ignore the stage cache. Defaults to False.
+        - only (List[str], optional): Run only these stages, bypassing the cache.
+
+        Returns:
+        - Dict[str, str]: Final state of every selected stage ('completed', 'cached',
+          'failed' or 'upstream_failed').
+        """
+        selected = [key for key in self.stages if not only or key in only]
+        pending = list(selected)
+        states = {}
+        running = {}
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for key in list(pending):
+                        upstream = self.dependencies[key] & set(selected)
+                        if any(states.get(dep) in (FAILED, UPSTREAM_FAILED) for dep in upstream):
+                            states[key] = UPSTREAM_FAILED
+                            logger.error(f"Stage {key} not started because an upstream stage failed.")
+                        elif all(states.get(dep) in (COMPLETED, CACHED) for dep in upstream):
+                            self._start(key, executor, running, states, force or bool(only))
+                        else:
+                            continue
+                        pending.remove(key)
+                        progressed = True
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key, pipeline, fingerprint = running.pop(future)
+                    try:
+                        add_events(future.result())
+                        self.stage_cache.record(pipeline, fingerprint)
+                        states[key] = COMPLETED
+                        logger.info(f">>>>>> Stage {pipeline.STAGE_NAME} completed <<<<<< \n\nx==========x")
+                    except Exception as e:
+                        add_events(getattr(e, "trace_events", []))
+                        states[key] = FAILED
+                        logger.error(f"Error encountered during the {pipeline.STAGE_NAME}: {e}", exc_info=e)
+        return states
+
+    def _start(self, key: str, executor: ProcessPoolExecutor, running: dict, states: dict, bypass_cache: bool):
+        """
+        Skip a stage served by the cache or submit it to the worker pool.
+        """
+        try:
+            pipeline = self.stages[key]()
+            fingerprint = self.stage_cache.fingerprint(pipeline)
+        except Exception as e:
+            states[key] = FAILED
+            logger.error(f"Error preparing stage {key}: {e}", exc_info=e)
+            return
+
+        if not bypass_cache and self.stage_cache.is_fresh(pipeline, fingerprint):
+            states[key] = CACHED
+            logger.info(f">>>>>> Stage {pipeline.STAGE_NAME} skipped: inputs unchanged, reusing recorded outputs <<<<<<")
+            return
+
+        logger.info(f">>>>>> Stage: {pipeline.STAGE_NAME} started <<<<<<")
+        running[executor.submit(_run_stage, self.stages[key])] = (key, pipeline, fingerprint)
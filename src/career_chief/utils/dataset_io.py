@@ -0,0 +1,292 @@
+"""
+dataset_io.py
+
+Purpose:
+    Reading and writing of tabular datasets in CSV, Parquet or Arrow IPC, chosen
+    from the file extension. Parquet and Arrow keep column types, including nested
+    list and struct columns such as token ids and NER results, so readers get them
+    back without parsing strings. Arrow IPC files are memory-mapped when read.
+    A Parquet dataset may also be a directory of part files, such as the one written
+    by data_ingestion; its parts are read in the order of their numbers.
+
+Usage:
+    with DatasetWriter("artifacts/data_transformation/train_data.parquet", schema) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    df = read_dataset("artifacts/data_transformation/train_data.parquet", columns=["job_id", "tokens"])
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from src.career_chief import logger
+
+
+# File extension of every supported format
+FORMAT_EXTENSIONS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+
+_FORMATS_BY_EXTENSION = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet",
+                         ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+
+# Number of rows sampled to infer the Arrow type of an object column
+_INFER_SAMPLE_ROWS = 1000
+
+_NUMBER_PATTERN = re.compile(r"(\d+)")
+
+
+def dataset_format(path: Path) -> str:
+    """
+    Get the format of a dataset file from its extension.
+
+    Args:
+    - path (Path): The dataset file.
+
+    Returns:
+    - str: 'csv', 'parquet' or 'arrow'.
+
+    Raises:
+    - ValueError: If the extension is not supported.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in _FORMATS_BY_EXTENSION:
+        raise ValueError(f"Unsupported dataset extension '{suffix}' of {path}; "
+                         f"use one of {sorted(_FORMATS_BY_EXTENSION)}.")
+    return _FORMATS_BY_EXTENSION[suffix]
+
+
+def _part_order(path: Path) -> list:
+    """Sort key putting 'part.2.parquet' before 'part.10.parquet'."""
+    return [int(piece) if piece.isdigit() else piece for piece in _NUMBER_PATTERN.split(path.as_posix())]
+
+
+def _parquet_dataset(path: Path):
+    """
+    Open a Parquet file, or a directory of Parquet part files, as one pyarrow dataset.
+
+    The parts of a directory are ordered by their numbers rather than by name, so rows
+    come back in the order they were written. Files starting with '_' or '.', such as
+    '_metadata', are not parts.
+    """
+    import pyarrow.dataset as ds
+
+    path = Path(path)
+    if not path.is_dir():
+        return ds.dataset(str(path), format="parquet")
+    parts = [part for part in path.rglob("*.parquet") if not part.name.startswith(("_", "."))]
+    if not parts:
+        raise FileNotFoundError(f"No Parquet part files found in {path}")
+    return ds.dataset([str(part) for part in sorted(parts, key=_part_order)], format="parquet")
+
+
+def infer_schema(df: pd.DataFrame, types: Optional[Dict[str, pa.DataType]] = None) -> pa.Schema:
+    """
+    Build an Arrow schema for a DataFrame that holds for every chunk of it.
+
+    Typed columns map directly. The type of an object column is inferred from a sample
+    of its non-missing values, so a chunk in which a column happens to be empty does
+    not decide its type. Categorical columns are stored as their category type.
+
+    Args:
+    - df (pd.DataFrame): The data.
+    - types (Dict[str, pa.DataType], optional): Types of columns that must not be inferred,
+      e.g. nested list or struct columns.
+
+    Returns:
+    - pa.Schema: The schema.
+    """
+    types = types or {}
+    fields = []
+    for name, column in df.items():
+        if name in types:
+            dtype = types[name]
+        elif column.dtype == object:
+            sample = column.dropna().head(_INFER_SAMPLE_ROWS).tolist()
+            dtype = pa.infer_type(sample) if sample else pa.large_string()
+        else:
+            dtype = pa.Schema.from_pandas(df[[name]].head(0), preserve_index=False).field(name).type
+        if pa.types.is_dictionary(dtype):
+            dtype = dtype.value_type
+        fields.append(pa.field(name, dtype))
+    return pa.schema(fields)
+
+
+class DatasetWriter:
+    """
+    Writes a dataset chunk by chunk into one CSV, Parquet or Arrow IPC file.
+
+    Parquet and Arrow files are written with a fixed schema, so every chunk is stored
+    with the same column types.
+
+    Attributes:
+    - path (Path): The output file; its extension selects the format.
+    - format (str): 'csv', 'parquet' or 'arrow'.
+    - rows (int): Number of rows written so far.
+    - schema (pa.Schema): Schema of the Parquet or Arrow file. Inferred from the first
+      chunk if not given.
+    """
+
+    def __init__(self, path: Path, schema: Optional[pa.Schema] = None):
+        """
+        Initialize the DatasetWriter. The file is created on the first write.
+
+        Args:
+        - path (Path): The output file.
+        - schema (pa.Schema, optional): Schema of the Parquet or Arrow file.
+        """
+        self.path = Path(path)
+        self.format = dataset_format(self.path)
+        self.schema = schema
+        self.rows = 0
+        self._writer = None
+
+    def _open(self, chunk: pd.DataFrame):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "csv":
+            self._writer = open(self.path, "w", newline="", encoding="utf-8")
+            return
+
+        if self.schema is None:
+            self.schema = infer_schema(chunk)
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+        else:
+            self._writer = pa.ipc.new_file(self.path, self.schema)
+
+    def write(self, chunk: pd.DataFrame):
+        """
+        Append rows to the file.
+
+        Args:
+        - chunk (pd.DataFrame): The rows, with the same columns for every chunk.
+        """
+        first = self._writer is None
+        if first:
+            self._open(chunk)
+        if self.format == "csv":
+            chunk.to_csv(self._writer, header=first, index=False)
+        else:
+            self._writer.write_table(pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False))
+        self.rows += len(chunk)
+
+    def close(self, empty: Optional[pd.DataFrame] = None):
+        """
+        Finish the file.
+
+        Args:
+        - empty (pd.DataFrame, optional): Rows written if nothing was written yet, so an
+          empty dataset still produces a readable file with its columns.
+        """
+        if self._writer is None and empty is not None:
+            self.write(empty.iloc[:0])
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_table(path: Path, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Read a Parquet or Arrow dataset as an Arrow table.
+
+    Arrow IPC files are memory-mapped, so only the columns that are used get read.
+
+    Args:
+    - path (Path): The dataset file.
+    - columns (List[str], optional): Columns to read. Defaults to all.
+
+    Returns:
+    - pa.Table: The dataset.
+
+    Raises:
+    - ValueError: If the file is a CSV file or has an unsupported extension.
+    """
+    file_format = dataset_format(path)
+    if file_format == "parquet":
+        return _parquet_dataset(path).to_table(columns=columns)
+    if file_format == "arrow":
+        table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+        return table.select(columns) if columns else table
+    raise ValueError(f"{path} is a CSV file; use read_dataset instead.")
+
+
+def dataset_schema(path: Path) -> pa.Schema:
+    """
+    Read the schema of a Parquet or Arrow dataset without reading its rows.
+
+    Args:
+    - path (Path): The dataset file.
+
+    Returns:
+    - pa.Schema: The column names and types.
+
+    Raises:
+    - ValueError: If the file is a CSV file or has an unsupported extension.
+    """
+    file_format = dataset_format(path)
+    if file_format == "parquet":
+        return _parquet_dataset(path).schema
+    if file_format == "arrow":
+        return pa.ipc.open_file(pa.memory_map(str(path))).schema
+    raise ValueError(f"{path} is a CSV file and has no stored schema.")
+
+
+def read_dataset(path: Path, columns: Optional[List[str]] = None, dtype: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Read a CSV, Parquet or Arrow dataset into a DataFrame.
+
+    Nested columns of Parquet and Arrow files come back as arrays of values or dicts.
+    CSV files are parsed as plain text columns.
+
+    Args:
+    - path (Path): The dataset file.
+    - columns (List[str], optional): Columns to read. Defaults to all.
+    - dtype (dict, optional): Types of CSV columns that must not be inferred, e.g.
+      {'job_id': str} to keep leading zeros. Parquet and Arrow columns keep their stored types.
+
+    Returns:
+    - pd.DataFrame: The dataset.
+    """
+    if dataset_format(path) == "csv":
+        df = pd.read_csv(path, usecols=columns, dtype=dtype)
+    else:
+        df = read_table(path, columns).to_pandas()
+    logger.info(f"Dataset with {len(df)} rows loaded from {path}.")
+    return df
+
+
+def iter_dataset(path: Path, chunk_size: int, columns: Optional[List[str]] = None,
+                 dtype: Optional[dict] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV, Parquet or Arrow dataset in chunks of rows.
+
+    Args:
+    - path (Path): The dataset file.
+    - chunk_size (int): Maximum number of rows per chunk.
+    - columns (List[str], optional): Columns to read. Defaults to all.
+    - dtype (dict, optional): Types of CSV columns that must not be inferred, as in `read_dataset`.
+
+    Yields:
+    - pd.DataFrame: The chunks, in file order.
+    """
+    file_format = dataset_format(path)
+    if file_format == "csv":
+        yield from pd.read_csv(path, usecols=columns, dtype=dtype, chunksize=chunk_size)
+    elif file_format == "parquet":
+        for batch in _parquet_dataset(path).to_batches(columns=columns, batch_size=chunk_size):
+            if batch.num_rows:
+                yield batch.to_pandas()
+    else:
+        table = read_table(path, columns)
+        for start in range(0, table.num_rows, chunk_size):
+            yield table.slice(start, chunk_size).to_pandas()
@@ -0,0 +1,224 @@
+"""
+inference_cache.py
+
+Purpose:
+    Persistent cache of model outputs keyed by input text, so that postings that did not
+    change between scrapes are not run through the NER models again. Entries live in a
+    local SQLite database and are keyed by a hash of the model fingerprint and the
+    normalized text, so retraining or replacing the model invalidates them. The least
+    recently used entries are evicted once the cache exceeds its entry or size limit.
+
+Usage:
+    cache = InferenceCache("artifacts/ner_cache/spacy.sqlite", model_fingerprint(model_dir))
+    hits = cache.contains(texts)
+    cached = cache.get([text for text, hit in zip(texts, hits) if hit])
+    cache.put(missed_texts, results)
+    cache.close()  # evicts and logs the hit rate
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import unicodedata
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from src.career_chief import logger
+
+
+# Keys looked up per SQL statement, below SQLite's limit on bound parameters
+_SQL_BATCH = 500
+
+
+def model_fingerprint(model: str) -> str:
+    """
+    Fingerprint a model from the names, sizes and modification times of its files.
+
+    Args:
+    - model (str): A model directory or file, or the name of a hub model, which is used as is.
+
+    Returns:
+    - str: A hex digest that changes whenever a file of the model changes.
+    """
+    path = Path(model)
+    if not path.exists():
+        return hashlib.blake2b(str(model).encode(), digest_size=16).hexdigest()
+
+    entries = []
+    files = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+    for file in files:
+        stat = file.stat()
+        entries.append([str(file.relative_to(path)) if file != path else file.name, stat.st_size, stat.st_mtime_ns])
+    return hashlib.blake2b(json.dumps(entries).encode(), digest_size=16).hexdigest()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a text for cache lookups.
+
+    Only the Unicode form is unified: models see the text verbatim and return character
+    offsets into it, so texts differing in case or whitespace are different inputs.
+    """
+    return unicodedata.normalize("NFC", text)
+
+
+class InferenceCache:
+    """
+    A SQLite-backed cache of JSON-serializable model outputs keyed by text.
+
+    Hits refresh an entry's last use. Eviction runs in `evict` (called by `close`)
+    rather than on every write, so an entry found by `contains` is still there when
+    it is fetched later in the same run.
+
+    Attributes:
+    - path (Path): The SQLite database file.
+    - fingerprint (str): Fingerprint of the model whose outputs are cached.
+    - max_entries (int): Maximum number of entries kept, or None.
+    - max_bytes (int): Maximum total size of the stored outputs, or None.
+    - hits (int): Texts found in the cache since it was opened.
+    - misses (int): Texts not found in the cache since it was opened.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Open or create the cache.
+
+        Args:
+        - path (Path): The SQLite database file.
+        - fingerprint (str): Fingerprint of the model, e.g. from `model_fingerprint`.
+        - max_entries (int, optional): Maximum number of entries kept.
+        - max_bytes (int, optional): Maximum total size of the stored outputs in bytes.
+        """
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=60)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key BLOB PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )""")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        self._connection.commit()
+
+    def _key(self, text: str) -> bytes:
+        data = f"{self.fingerprint}\0{normalize_text(text)}".encode("utf-8", "surrogatepass")
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _select(self, keys: List[bytes], columns: str) -> dict:
+        rows = {}
+        for start in range(0, len(keys), _SQL_BATCH):
+            batch = keys[start:start + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for row in self._connection.execute(
+                    f"SELECT key, {columns} FROM entries WHERE key IN ({placeholders})", batch):
+                rows[row[0]] = row[1]
+        return rows
+
+    def contains(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Check which texts have a cached output, and count them as hits or misses.
+
+        Args:
+        - texts (Sequence[str]): The texts.
+
+        Returns:
+        - np.ndarray: A boolean mask of the cached texts.
+        """
+        keys = [self._key(text) for text in texts]
+        found = self._select(keys, "1")
+        mask = np.fromiter((key in found for key in keys), dtype=bool, count=len(keys))
+        self.hits += int(mask.sum())
+        self.misses += len(keys) - int(mask.sum())
+        return mask
+
+    def get(self, texts: Sequence[str]) -> List[Any]:
+        """
+        Fetch the cached outputs of texts and mark them as recently used.
+
+        Args:
+        - texts (Sequence[str]): Texts reported as cached by `contains`.
+
+        Returns:
+        - List[Any]: The outputs, or None for a text that is not cached.
+        """
+        keys = [self._key(text) for text in texts]
+        values = self._select(keys, "value")
+        now = time.time()
+        self._connection.executemany("UPDATE entries SET last_used = ? WHERE key = ?",
+                                     [(now, key) for key in values])
+        self._connection.commit()
+        return [json.loads(values[key]) if key in values else None for key in keys]
+
+    def put(self, texts: Sequence[str], values: Sequence[Any]):
+        """
+        Store the outputs of texts.
+
+        Args:
+        - texts (Sequence[str]): The texts.
+        - values (Sequence[Any]): Their JSON-serializable outputs.
+        """
+        now = time.time()
+        rows = []
+        for text, value in zip(texts, values):
+            data = json.dumps(value)
+            rows.append((self._key(text), data, len(data), now))
+        self._connection.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows)
+        self._connection.commit()
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries beyond the entry and size limits.
+
+        Returns:
+        - int: Number of entries removed.
+        """
+        removed = 0
+        if self.max_entries is not None:
+            removed += self._connection.execute("""
+                DELETE FROM entries WHERE key IN (
+                    SELECT key FROM entries ORDER BY last_used DESC LIMIT -1 OFFSET ?)""",
+                (self.max_entries,)).rowcount
+        if self.max_bytes is not None:
+            removed += self._connection.execute("""
+                DELETE FROM entries WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS kept FROM entries)
+                    WHERE kept > ?)""",
+                (self.max_bytes,)).rowcount
+        self._connection.commit()
+        return removed
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the looked-up texts that were cached."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        """Evict, log the hit rate and the size of the cache, and close the database."""
+        removed = self.evict()
+        entries, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        self._connection.close()
+        logger.info(f"Inference cache {self.path}: {self.hits} hits, {self.misses} misses "
+                    f"(hit rate {self.hit_rate:.1%}); {entries} entries, {size / 1e6:.1f} MB, "
+                    f"{removed} evicted.")
+
+    def __enter__(self) -> "InferenceCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,215 @@
+"""
+model_pool.py
+
+Purpose:
+    Process pool whose workers share one copy of a model. The model is loaded once in
+    the parent process and the workers are forked afterwards, so they start without
+    loading anything and read the weights from the parent's pages copy-on-write, instead
+    of every worker holding its own copy. Where fork is not available, every worker
+    falls back to calling the loader itself.
+
+    Every worker reports its startup time and memory after each task: RSS counts the
+    shared pages in every process, PSS splits them between the processes sharing them,
+    and private memory is what the worker alone holds, i.e. what one more worker costs.
+
+Usage:
+    with SharedModelPool(partial(spacy.load, model_dir), workers=8) as pool:
+        for result in pool.imap(run_batch, batches):
+            ...
+"""
+
+import gc
+import os
+import sys
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from src.career_chief import logger
+
+
+# Model of the pool's worker processes; set in the parent before forking
+_pool_model = None
+
+# Startup statistics of a worker process, set by _init_worker
+_worker_stats = None
+
+# Time of the latest fork of this process; a forked worker inherits the time it was forked at
+_forked_at = None
+
+# Fields of /proc/self/smaps_rollup reported by memory_usage, in kB
+_SMAPS_FIELDS = ("Rss", "Pss", "Private_Clean", "Private_Dirty")
+
+# Names of the memory_usage values in the logs
+_MEMORY_NAMES = {"rss_mb": "RSS", "pss_mb": "PSS", "private_mb": "private"}
+
+
+def memory_usage() -> Dict[str, float]:
+    """
+    Memory of the current process in MB.
+
+    Returns:
+    - Dict[str, float]: 'rss_mb', and on Linux 'pss_mb' and 'private_mb'.
+    """
+    try:
+        values = {}
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                if name in _SMAPS_FIELDS:
+                    values[name] = int(rest.split()[0]) / 1024
+        return {"rss_mb": values["Rss"], "pss_mb": values["Pss"],
+                "private_mb": values["Private_Clean"] + values["Private_Dirty"]}
+    except (OSError, KeyError, ValueError):
+        import resource
+
+        # Peak rather than current RSS; kB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"rss_mb": peak / (1024 * 1024 if sys.platform == "darwin" else 1024)}
+
+
+def _mark_fork():
+    global _forked_at
+    _forked_at = time.time()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_mark_fork)
+
+
+def _init_worker(loader: Optional[Callable[[], Any]], threads: Optional[int]):
+    """
+    Set up a worker process, loading the model only if it was not inherited.
+
+    The startup time of a forked worker is measured from its fork; that of a worker
+    loading the model itself is the time its loader took.
+    """
+    global _pool_model, _worker_stats
+    start = time.perf_counter()
+    if loader is not None:
+        _pool_model = loader()
+    if threads and "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(threads)
+    ready = time.time() - _forked_at if loader is None else time.perf_counter() - start
+    _worker_stats = {"pid": os.getpid(), "ready_seconds": ready, "loaded": loader is not None}
+
+
+def _call(function: Callable, args: tuple):
+    """Run a task on the worker's model and return its result with the worker's memory usage."""
+    result = function(_pool_model, *args)
+    return result, dict(_worker_stats, **memory_usage())
+
+
+class SharedModelPool:
+    """
+    A process pool running tasks on a model loaded once and shared by all workers.
+
+    On entering the context the model is loaded (or the given one taken) in this
+    process, the garbage collector is frozen so that it does not write to the shared
+    objects, and the workers are forked. Tasks are functions called as
+    `function(model, *args)` in a worker; they must not modify the model, or the touched
+    pages are copied into that worker.
+
+    Attributes:
+    - workers (int): Number of worker processes.
+    - load_seconds (float): Time taken to load the model in this process.
+    - metrics (Dict[int, dict]): Per worker pid: startup time (see `_init_worker`), tasks run, and peak RSS,
+      PSS and private memory in MB.
+    """
+
+    def __init__(self, loader: Callable[[], Any], workers: int, model: Any = None,
+                 threads: Optional[int] = None, name: str = "model"):
+        """
+        Create the pool; the model is loaded and the workers are started on entering its context.
+
+        Args:
+        - loader (Callable[[], Any]): Loads the model. Must be picklable where fork is not
+          available, as the workers then call it themselves.
+        - workers (int): Number of worker processes.
+        - model (Any, optional): An already loaded model, shared instead of calling `loader` here.
+        - threads (int, optional): Torch threads per worker; defaults to the CPUs divided among the workers.
+        - name (str, optional): Name of the model in the logs. Defaults to 'model'.
+        """
+        self.loader = loader
+        self.workers = max(1, workers)
+        self.model = model
+        self.threads = threads or max(1, (os.cpu_count() or 1) // self.workers)
+        self.name = name
+        self.load_seconds = 0.0
+        self.metrics = {}
+        self._executor = None
+
+    def __enter__(self) -> "SharedModelPool":
+        global _pool_model
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            if self.model is None:
+                start = time.perf_counter()
+                self.model = self.loader()
+                self.load_seconds = time.perf_counter() - start
+                logger.info(f"Loaded {self.name} once in {self.load_seconds:.1f}s for {self.workers} workers.")
+            _pool_model = self.model
+            gc.collect()
+            gc.freeze()
+            context, initargs = multiprocessing.get_context("fork"), (None, self.threads)
+        else:
+            logger.warning(f"fork is not available; each of the {self.workers} workers loads its own {self.name}.")
+            context, initargs = multiprocessing.get_context("spawn"), (self.loader, self.threads)
+
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                             initializer=_init_worker, initargs=initargs)
+        return self
+
+    def _record(self, stats: dict):
+        metrics = self.metrics.setdefault(stats["pid"], {"ready_seconds": stats["ready_seconds"],
+                                                         "loaded": stats["loaded"], "tasks": 0})
+        metrics["tasks"] += 1
+        for key in _MEMORY_NAMES:
+            if key in stats:
+                metrics[key] = max(metrics.get(key, 0.0), stats[key])
+
+    def imap(self, function: Callable, tasks: Iterable[tuple], in_flight: Optional[int] = None) -> Iterator[Any]:
+        """
+        Run `function(model, *task)` for every task and yield the results in task order.
+
+        Args:
+        - function (Callable): A picklable module-level function taking the model first.
+        - tasks (Iterable[tuple]): Arguments of every call; consumed lazily.
+        - in_flight (int, optional): Maximum tasks submitted ahead. Defaults to two per worker.
+
+        Yields:
+        - Any: The results, in the order of `tasks`.
+        """
+        in_flight = in_flight or 2 * self.workers
+        pending = deque()
+        for args in tasks:
+            pending.append(self._executor.submit(_call, function, tuple(args)))
+            if len(pending) >= in_flight:
+                result, stats = pending.popleft().result()
+                self._record(stats)
+                yield result
+        while pending:
+            result, stats = pending.popleft().result()
+            self._record(stats)
+            yield result
+
+    def __exit__(self, *exc_info):
+        global _pool_model
+
+        self._executor.shutdown(wait=True, cancel_futures=exc_info[0] is not None)
+        _pool_model = None
+        if gc.get_freeze_count():
+            gc.unfreeze()
+        self._log_metrics()
+
+    def _log_metrics(self):
+        parent = memory_usage()
+        lines = [f"{self.name} pool: load {self.load_seconds:.1f}s, parent RSS {parent['rss_mb']:.0f} MB"]
+        for pid, metrics in sorted(self.metrics.items()):
+            memory = ", ".join(f"{name} {metrics[key]:.0f} MB" for key, name in _MEMORY_NAMES.items() if key in metrics)
+            source = "loaded" if metrics["loaded"] else "forked"
+            lines.append(f"  worker {pid}: {source}, ready in {metrics['ready_seconds']:.2f}s, "
+                         f"{metrics['tasks']} tasks, peak {memory}")
+        logger.info("\n".join(lines))
@@ -0,0 +1,129 @@
+"""
+ragged.py
+
+Purpose:
+    Compact storage for variable-length integer sequences such as token ids. All
+    sequences are concatenated into one flat `values` array and `offsets[i]` marks
+    where sequence i starts (`offsets[-1] == len(values)`). Both arrays are saved as
+    .npy files, so readers can memory-map them and slice a sequence without parsing.
+
+Usage:
+    tokens = RaggedArray.load("artifacts/data_transformation/tokens/input_ids")
+    ids = tokens[42]  # np.ndarray view into the memory-mapped values
+"""
+
+import os
+import itertools
+import numpy as np
+from pathlib import Path
+from typing import Iterable, List, Sequence
+
+
+class RaggedArray:
+    """
+    A sequence of variable-length 1-D arrays backed by one flat array.
+
+    Attributes:
+    - values (np.ndarray): All sequences, concatenated.
+    - offsets (np.ndarray): int64 start of every sequence, followed by len(values).
+    """
+
+    def __init__(self, values: np.ndarray, offsets: np.ndarray):
+        """
+        Initialize the RaggedArray.
+
+        Args:
+        - values (np.ndarray): All sequences, concatenated.
+        - offsets (np.ndarray): Start of every sequence followed by len(values).
+
+        Raises:
+        - ValueError: If the offsets do not describe the values.
+        """
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(values):
+            raise ValueError("offsets must start at 0 and end at len(values).")
+        self.values = values
+        self.offsets = offsets
+
+    @classmethod
+    def from_sequences(cls, sequences: Sequence[Sequence[int]], dtype=np.int32) -> "RaggedArray":
+        """
+        Build a RaggedArray from a list of sequences, e.g. a tokenizer's `input_ids`.
+
+        Args:
+        - sequences (Sequence[Sequence[int]]): The sequences.
+        - dtype (optional): Data type of the values. Defaults to np.int32.
+
+        Returns:
+        - RaggedArray: The packed sequences.
+        """
+        lengths = np.fromiter((len(sequence) for sequence in sequences), dtype=np.int64, count=len(sequences))
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.fromiter(itertools.chain.from_iterable(sequences), dtype=dtype, count=int(offsets[-1]))
+        return cls(values, offsets)
+
+    @classmethod
+    def concatenate(cls, parts: Iterable["RaggedArray"]) -> "RaggedArray":
+        """
+        Join several RaggedArrays into one, keeping their order.
+
+        Args:
+        - parts (Iterable[RaggedArray]): The arrays to join.
+
+        Returns:
+        - RaggedArray: The joined array.
+        """
+        parts = list(parts)
+        if not parts:
+            return cls(np.empty(0, dtype=np.int32), np.zeros(1, dtype=np.int64))
+
+        values = np.concatenate([part.values for part in parts])
+        offsets: List[np.ndarray] = [np.zeros(1, dtype=np.int64)]
+        base = 0
+        for part in parts:
+            offsets.append(part.offsets[1:] + base)
+            base += len(part.values)
+        return cls(values, np.concatenate(offsets))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Length of every sequence."""
+        return np.diff(self.offsets)
+
+    def to_lists(self) -> List[List[int]]:
+        """Convert back into a list of Python lists."""
+        return [self[index].tolist() for index in range(len(self))]
+
+    def save(self, prefix: Path):
+        """
+        Save the array as '<prefix>.values.npy' and '<prefix>.offsets.npy'.
+
+        Args:
+        - prefix (Path): Path prefix of the two files.
+        """
+        prefix = Path(prefix)
+        os.makedirs(prefix.parent, exist_ok=True)
+        np.save(f"{prefix}.values.npy", self.values)
+        np.save(f"{prefix}.offsets.npy", self.offsets)
+
+    @classmethod
+    def load(cls, prefix: Path, mmap: bool = True) -> "RaggedArray":
+        """
+        Load an array written by `save`.
+
+        Args:
+        - prefix (Path): Path prefix of the two files.
+        - mmap (bool, optional): Memory-map the files instead of reading them. Defaults to True.
+
+        Returns:
+        - RaggedArray: The loaded array.
+        """
+        mmap_mode = "r" if mmap else None
+        return cls(np.load(f"{prefix}.values.npy", mmap_mode=mmap_mode),
+                   np.load(f"{prefix}.offsets.npy", mmap_mode=mmap_mode))
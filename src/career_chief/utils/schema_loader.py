@@ -0,0 +1,162 @@
+"""
+schema_loader.py
+
+Purpose:
+    Loads tabular job data with the column types declared in schema.yaml, so every
+    component parses the data the same way. Types are applied while the CSV is parsed:
+    'category' columns are dictionary-encoded, 'float' and 'int' columns are downcast
+    to the smallest type that holds their values and 'datetime64' columns are parsed
+    into timestamps. Only columns present in the file are requested, so a missing
+    column is left for validation to report instead of failing the read.
+"""
+
+import pandas as pd
+from typing import Dict, Iterator, List, Optional, Union
+
+from src.career_chief import logger
+
+
+# Schema types that are parsed as numbers and then downcast
+_NUMERIC_TYPES = {"float": "float", "int": "integer"}
+
+
+class SchemaLoader:
+    """
+    Reads CSV files and DataFrames into the types declared in the schema.
+
+    Attributes:
+    - schema (Dict[str, Dict]): Column definitions from the schema, each with a `type`.
+    - columns (List[str]): The schema columns, in schema order.
+    """
+
+    def __init__(self, schema: Dict[str, Dict]):
+        """
+        Initialize the SchemaLoader.
+
+        Args:
+        - schema (Dict[str, Dict]): Column definitions, e.g. `ConfigurationManager.schema.columns`.
+        """
+        self.schema = schema
+        self.columns = list(schema.keys())
+        self._types = {column: str(definition['type']) for column, definition in schema.items()}
+
+    def _parse_dtypes(self, columns: List[str]) -> Dict[str, str]:
+        """
+        Build the `dtype` argument of `pd.read_csv` for the given columns. Datetime columns
+        are converted after parsing and integer columns are downcast after parsing because
+        they may contain missing values.
+        """
+        dtypes = {}
+        for column in columns:
+            expected = self._types.get(column)
+            if expected is None or expected.startswith("datetime64") or expected == "int":
+                continue
+            dtypes[column] = "float32" if expected == "float" else expected
+        return dtypes
+
+    def _read_header(self, source) -> List[str]:
+        """Read only the header row of a CSV file or file object."""
+        header = list(pd.read_csv(source, nrows=0).columns)
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return header
+
+    def apply_types(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast the schema columns of an already loaded DataFrame to their declared types.
+        Columns that are not in the schema are left untouched.
+
+        Args:
+        - df (pd.DataFrame): The data, e.g. read from Parquet or parsed by `read_csv`.
+
+        Returns:
+        - pd.DataFrame: The same DataFrame with converted columns.
+        """
+        for column in df.columns:
+            expected = self._types.get(column)
+            if expected is None:
+                continue
+
+            if expected.startswith("datetime64"):
+                if not pd.api.types.is_datetime64_any_dtype(df[column]):
+                    parsed = pd.to_datetime(df[column], format="ISO8601", errors="coerce")
+                    unparsed = int((parsed.isna() & df[column].notna()).sum())
+                    if unparsed:
+                        logger.warning(f"{unparsed} values of column '{column}' could not be parsed as dates.")
+                    df[column] = parsed
+            elif expected in _NUMERIC_TYPES:
+                df[column] = pd.to_numeric(df[column], errors="coerce", downcast=_NUMERIC_TYPES[expected])
+            elif not pd.api.types.is_dtype_equal(df[column].dtype, expected):
+                df[column] = df[column].astype(expected)
+        return df
+
+    def read_csv(self,
+                 source,
+                 columns: Optional[List[str]] = None,
+                 chunksize: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Read a CSV file with the schema types applied at parse time.
+
+        Args:
+        - source: Path or file object of the CSV.
+        - columns (List[str], optional): Columns to read. Defaults to every column of the file.
+          Requested columns that the file lacks are skipped.
+        - chunksize (int, optional): Yield DataFrames of this many rows instead of one DataFrame.
+
+        Returns:
+        - Union[pd.DataFrame, Iterator[pd.DataFrame]]: The typed data, or an iterator of typed chunks.
+        """
+        header = self._read_header(source)
+        usecols = [column for column in header if columns is None or column in columns]
+        read_kwargs = dict(usecols=usecols, dtype=self._parse_dtypes(usecols))
+
+        if chunksize:
+            return self._iter_chunks(source, chunksize, read_kwargs)
+
+        df = self.apply_types(pd.read_csv(source, **read_kwargs))
+        self.log_memory_report(df)
+        return df
+
+    def _iter_chunks(self, source, chunksize: int, read_kwargs: dict) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(source, chunksize=chunksize, **read_kwargs) as reader:
+            for chunk in reader:
+                yield self.apply_types(chunk)
+
+    def dtype_matches(self, column: str, dtype) -> bool:
+        """
+        Check whether a column's dtype satisfies its schema type. Downcast numeric
+        columns match their generic type, e.g. float32 matches 'float'.
+
+        Args:
+        - column (str): The schema column.
+        - dtype: The actual dtype of the column.
+
+        Returns:
+        - bool: True if the dtype is what the schema expects.
+        """
+        expected = self._types[column]
+        if expected == "float":
+            return pd.api.types.is_float_dtype(dtype)
+        if expected == "int":
+            return pd.api.types.is_integer_dtype(dtype)
+        if expected.startswith("datetime64"):
+            return pd.api.types.is_datetime64_any_dtype(dtype)
+        return pd.api.types.is_dtype_equal(dtype, expected)
+
+    @staticmethod
+    def log_memory_report(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Log the dtype and in-memory size of every column of a DataFrame.
+
+        Args:
+        - df (pd.DataFrame): The data to report on.
+
+        Returns:
+        - pd.DataFrame: One row per column with 'dtype' and 'memory_mb'.
+        """
+        usage = df.memory_usage(index=False, deep=True)
+        report = pd.DataFrame({"dtype": df.dtypes.astype(str), "memory_mb": usage / 1024 ** 2})
+        lines = "\n".join(f"    {column:<25} {dtype:<15} {memory_mb:>10.2f} MB"
+                          for column, dtype, memory_mb in zip(report.index, report['dtype'], report['memory_mb']))
+        logger.info(f"Memory usage of {len(df)} rows:\n{lines}\n    {'total':<41} {report['memory_mb'].sum():>10.2f} MB")
+        return report
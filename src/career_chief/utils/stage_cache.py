@@ -0,0 +1,167 @@
+"""
+stage_cache.py
+
+Purpose:
+    Input-hash caching for pipeline stages. A stage is fingerprinted from its input
+    artifacts, its section of config.yaml and the params.yaml keys it depends on.
+    When the fingerprint matches the one recorded after the last successful run and
+    the recorded outputs are still in place, the orchestrator can skip the stage.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.career_chief import logger
+
+
+def _path_fingerprint(path: Path) -> Optional[list]:
+    """
+    Cheap fingerprint of a file or directory based on sizes and modification times.
+
+    Args:
+        path (Path): file or directory to fingerprint.
+
+    Returns:
+        Optional[list]: [size, mtime_ns] for a file, a sorted list of
+        [relative path, size, mtime_ns] for a directory, or None if the path is missing.
+    """
+    if path.is_file():
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+    if path.is_dir():
+        entries = []
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                file_path = Path(dirpath) / filename
+                stat = file_path.stat()
+                entries.append([str(file_path.relative_to(path)), stat.st_size, stat.st_mtime_ns])
+        return sorted(entries)
+    return None
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert ConfigBox/BoxList values into plain JSON-serialisable containers."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    return value
+
+
+class StageCache:
+    """
+    Records the fingerprint of every successfully executed stage and decides whether
+    a stage can be skipped on the next run.
+
+    Stages describe themselves through class attributes:
+    - CONFIG_SECTION (str): Name of the stage's section in config.yaml.
+    - INPUT_KEYS (List[str]): Keys of that section holding input artifact paths.
+    - OUTPUT_KEYS (List[str]): Keys of that section holding output artifact paths.
+    - PARAMS_KEYS (List[str]): Top-level params.yaml keys the stage depends on.
+    - USES_SCHEMA (bool, optional): Whether the stage depends on schema.yaml.
+
+    Attributes:
+    - cache_dir (Path): Directory holding one JSON record per stage.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the StageCache.
+
+        Args:
+        - cache_dir (Path): Directory holding one JSON record per stage.
+        """
+        self.cache_dir = Path(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _record_path(self, pipeline) -> Path:
+        return self.cache_dir / f"{pipeline.CONFIG_SECTION}.json"
+
+    def _section(self, pipeline) -> Dict[str, Any]:
+        return _to_plain(pipeline.config_manager.config[pipeline.CONFIG_SECTION])
+
+    def get_paths(self, pipeline, keys: List[str]) -> List[Path]:
+        """
+        Resolve the given keys of the stage's config section into paths.
+
+        Args:
+        - pipeline: The pipeline stage instance.
+        - keys (List[str]): Keys of the config section holding paths.
+
+        Returns:
+        - List[Path]: The resolved paths.
+        """
+        section = pipeline.config_manager.config[pipeline.CONFIG_SECTION]
+        return [Path(section[key]) for key in keys]
+
+    def fingerprint(self, pipeline) -> str:
+        """
+        Compute the fingerprint of a stage from its inputs, config section and params.
+
+        Args:
+        - pipeline: The pipeline stage instance.
+
+        Returns:
+        - str: SHA-256 hex digest identifying the current state of the stage's inputs.
+        """
+        params = pipeline.config_manager.params
+        state = {
+            "config": self._section(pipeline),
+            "params": {key: _to_plain(params.get(key)) for key in pipeline.PARAMS_KEYS},
+            "inputs": {str(path): _path_fingerprint(path) for path in self.get_paths(pipeline, pipeline.INPUT_KEYS)},
+        }
+        if getattr(pipeline, "USES_SCHEMA", False):
+            state["schema"] = _to_plain(pipeline.config_manager.schema)
+
+        encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def is_fresh(self, pipeline, fingerprint: str) -> bool:
+        """
+        Check whether the stage's last successful run used the same fingerprint and its
+        recorded outputs are still present and unchanged.
+
+        Args:
+        - pipeline: The pipeline stage instance.
+        - fingerprint (str): The stage's current fingerprint.
+
+        Returns:
+        - bool: True if the stage can be skipped.
+        """
+        record_path = self._record_path(pipeline)
+        if not record_path.exists():
+            return False
+
+        try:
+            with open(record_path) as f:
+                record = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable stage cache record {record_path}: {e}")
+            return False
+
+        if record.get("fingerprint") != fingerprint:
+            return False
+
+        for path, recorded in record.get("outputs", {}).items():
+            current = _path_fingerprint(Path(path))
+            if current is None or current != recorded:
+                logger.info(f"Output {path} of {pipeline.STAGE_NAME} is missing or was modified.")
+                return False
+        return True
+
+    def record(self, pipeline, fingerprint: str):
+        """
+        Store the fingerprint and the outputs of a stage after a successful run.
+
+        Args:
+        - pipeline: The pipeline stage instance.
+        - fingerprint (str): The fingerprint computed before the stage ran.
+        """
+        outputs = {str(path): _path_fingerprint(path) for path in self.get_paths(pipeline, pipeline.OUTPUT_KEYS)}
+        record_path = self._record_path(pipeline)
+        with open(record_path, "w") as f:
+            json.dump({"stage": pipeline.STAGE_NAME, "fingerprint": fingerprint, "outputs": outputs}, f, indent=4)
+        logger.info(f"Stage cache record for {pipeline.STAGE_NAME} saved at {record_path}.")
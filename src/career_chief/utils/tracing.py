@@ -0,0 +1,201 @@
+"""
+tracing.py
+
+Purpose:
+    Lightweight tracing of pipeline hot sections. Wrap a section in `trace(...)` or
+    decorate a function with `@traced(...)` to record its wall time, CPU time and the
+    number of rows it processed. Spans recorded in stage worker processes are sent
+    back to the orchestrator, which writes them as a Chrome trace (open it in
+    chrome://tracing or https://ui.perfetto.dev) and prints a summary table.
+
+Usage:
+    with trace("data_validation.read") as span:
+        df = loader.read_csv(path)
+        span.rows = len(df)
+
+    @traced("data_deduplication.signatures", rows=len)
+    def compute_signatures(texts): ...
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from src.career_chief import logger
+
+
+# Spans finished in this process that have not been collected yet
+_events: List[dict] = []
+
+
+class Span:
+    """
+    A traced section in progress.
+
+    Attributes:
+    - name (str): Name of the section, e.g. 'data_validation.read'.
+    - category (str): Chrome trace category, e.g. 'stage' or 'section'.
+    - rows (int, optional): Number of rows processed; set it inside the traced block.
+    - args (dict): Extra values stored with the span.
+    """
+
+    def __init__(self, name: str, category: str, rows: Optional[int] = None):
+        self.name = name
+        self.category = category
+        self.rows = rows
+        self.args = {}
+
+
+@contextmanager
+def trace(name: str, category: str = "section", rows: Optional[int] = None) -> Iterator[Span]:
+    """
+    Record the wall time, CPU time and row throughput of a block of code.
+
+    Args:
+    - name (str): Name of the section.
+    - category (str, optional): Chrome trace category. Defaults to "section".
+    - rows (int, optional): Number of rows processed, if known up front.
+
+    Yields:
+    - Span: The span; assign `span.rows` once the row count is known.
+    """
+    span = Span(name, category, rows)
+    start_us = time.time_ns() // 1000
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield span
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        args = {"cpu_s": round(cpu, 6), **span.args}
+        if span.rows is not None:
+            args["rows"] = int(span.rows)
+            args["rows_per_s"] = round(span.rows / wall, 1) if wall > 0 else None
+        _events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": int(wall * 1_000_000),
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": args,
+        })
+
+
+def traced(name: Optional[str] = None, category: str = "section", rows: Optional[Callable] = None):
+    """
+    Decorator tracing every call of a function.
+
+    Args:
+    - name (str, optional): Name of the section. Defaults to the function's qualified name.
+    - category (str, optional): Chrome trace category. Defaults to "section".
+    - rows (Callable, optional): Computes the processed row count from the return value, e.g. `len`.
+
+    Returns:
+    - Callable: The decorator.
+    """
+    def decorator(func):
+        section = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace(section, category) as span:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    span.rows = rows(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def collect_events() -> List[dict]:
+    """
+    Take the spans finished in this process so far, e.g. to return them from a worker.
+
+    Returns:
+    - List[dict]: The Chrome trace events; they are removed from the local buffer.
+    """
+    events = _events[:]
+    del _events[:len(events)]
+    return events
+
+
+def add_events(events: List[dict]):
+    """
+    Add spans recorded elsewhere, e.g. returned by a worker process.
+
+    Args:
+    - events (List[dict]): Chrome trace events.
+    """
+    _events.extend(events)
+
+
+def write_chrome_trace(trace_dir: Path, events: List[dict]) -> Path:
+    """
+    Write the events of a run as a Chrome trace JSON file.
+
+    Args:
+    - trace_dir (Path): Directory receiving one 'trace_<timestamp>.json' file per run.
+    - events (List[dict]): Chrome trace events.
+
+    Returns:
+    - Path: The written file.
+    """
+    os.makedirs(trace_dir, exist_ok=True)
+    path = Path(trace_dir) / f"trace_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}.json"
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    logger.info(f"Chrome trace with {len(events)} spans saved to {path}.")
+    return path
+
+
+def summarize(events: List[dict]) -> List[Dict]:
+    """
+    Aggregate the events per section name.
+
+    Args:
+    - events (List[dict]): Chrome trace events.
+
+    Returns:
+    - List[Dict]: One entry per section with 'name', 'calls', 'wall_s', 'cpu_s', 'rows'
+      and 'rows_per_s', sorted by total wall time, longest first.
+    """
+    sections = {}
+    for event in events:
+        section = sections.setdefault(event["name"], {"name": event["name"], "calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "rows": None})
+        section["calls"] += 1
+        section["wall_s"] += event["dur"] / 1_000_000
+        section["cpu_s"] += event["args"].get("cpu_s", 0.0)
+        if "rows" in event["args"]:
+            section["rows"] = (section["rows"] or 0) + event["args"]["rows"]
+
+    for section in sections.values():
+        rows, wall = section["rows"], section["wall_s"]
+        section["rows_per_s"] = rows / wall if rows is not None and wall > 0 else None
+    return sorted(sections.values(), key=lambda section: section["wall_s"], reverse=True)
+
+
+def format_summary(events: List[dict]) -> str:
+    """
+    Render the per-section summary as a text table.
+
+    Args:
+    - events (List[dict]): Chrome trace events.
+
+    Returns:
+    - str: The table.
+    """
+    lines = [f"{'section':<45} {'calls':>6} {'wall (s)':>10} {'cpu (s)':>10} {'rows':>12} {'rows/s':>12}"]
+    for section in summarize(events):
+        rows = f"{section['rows']:,}" if section["rows"] is not None else "-"
+        rate = f"{section['rows_per_s']:,.0f}" if section["rows_per_s"] is not None else "-"
+        lines.append(f"{section['name']:<45} {section['calls']:>6} {section['wall_s']:>10.2f} "
+                     f"{section['cpu_s']:>10.2f} {rows:>12} {rate:>12}")
+    return "\n".join(lines)
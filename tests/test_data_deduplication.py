@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from src.career_chief.components.data_deduplication import DataDeduplication, MinHashLSHIndex
+from src.career_chief.entity.config_entity import DataDeduplicationConfig
+
+
+def _config(tmp_path, source):
+    return DataDeduplicationConfig(root_dir=tmp_path,
+                                   data_source_file=source,
+                                   canonical_map_file=tmp_path / "canonical_map.csv",
+                                   deduplicated_file=tmp_path / "deduplicated.csv",
+                                   index_dir=tmp_path / "index",
+                                   num_perm=64,
+                                   bands=16,
+                                   shingle_size=3,
+                                   similarity_threshold=0.8,
+                                   seed=1)
+
+
+def test_write_deduplicated_keeps_leading_zero_job_ids(tmp_path):
+    source = tmp_path / "jobs.csv"
+    pd.DataFrame({"job_id": ["0010", "10", "00123", "0010"],
+                  "title": ["a", "b", "c", "repeat"]}).to_csv(source, index=False)
+
+    DataDeduplication(_config(tmp_path, source)).write_deduplicated(pd.Series(["0010", "00123"]))
+
+    written = pd.read_csv(tmp_path / "deduplicated.csv", dtype={"job_id": str})
+    assert written["job_id"].tolist() == ["0010", "00123"]
+    assert written["title"].tolist() == ["a", "c"]
+
+
+def test_add_compares_every_bucket_member(monkeypatch):
+    index = MinHashLSHIndex(num_perm=8, bands=2, similarity_threshold=0.75)
+    # Every document lands in the same bucket of every band, headed by a dissimilar one
+    monkeypatch.setattr(index, "_band_keys", lambda signatures: np.zeros((len(signatures), 2), dtype=np.uint64))
+    signatures = np.array([[1] * 8,
+                           [2] * 8,
+                           [2] * 7 + [3]], dtype=np.uint32)
+
+    canonical = index.add(np.array(["head", "a", "b"], dtype=object), signatures)
+
+    assert canonical.tolist() == ["head", "a", "a"]
+
+
+def test_add_matches_new_documents_to_indexed_ones(monkeypatch):
+    index = MinHashLSHIndex(num_perm=8, bands=2, similarity_threshold=0.75)
+    monkeypatch.setattr(index, "_band_keys", lambda signatures: np.zeros((len(signatures), 2), dtype=np.uint64))
+    index.add(np.array(["head", "a"], dtype=object), np.array([[1] * 8, [2] * 8], dtype=np.uint32))
+
+    canonical = index.add(np.array(["b"], dtype=object), np.array([[2] * 7 + [3]], dtype=np.uint32))
+
+    assert canonical.tolist() == ["a"]